@@ -0,0 +1,273 @@
+import math
+import random
+
+from partida import TAMANHO_CADEIRA, Partida
+
+# Quantidade de alvos em cada dificuldade do modo com vários alvos
+QUANTIDADE_ALVOS = {1: 30, 2: 80, 3: 200}
+
+# Os alvos têm metade do tamanho do Marçal da dificuldade
+PROPORCAO_TAMANHO_ALVO = 0.5
+
+# Velocidade dos alvos (em pixels por segundo de jogo)
+VELOCIDADE_MINIMA_ALVOS = 30
+VELOCIDADE_MAXIMA_ALVOS = 120
+
+# Canto superior esquerdo da região onde os alvos se movem (longe do ponto de lançamento)
+REGIAO_ALVOS = (500, 80)
+
+# Lado (em pixels) de cada célula da grade espacial
+TAMANHO_CELULA = 64
+
+#---------------------------------------------------------------------------
+"""
+    Grade espacial uniforme sobre o campo, com as células guardadas em um dicionário.
+
+    1. Cada item é um ponto (o centro de um alvo) e fica na célula que contém esse ponto;
+       pontos fora do campo ficam na célula da borda mais próxima.
+    2. `mover` só altera o dicionário quando o item muda de célula, de modo que atualizar
+       alvos que andam poucos pixels por passo custa só o cálculo da célula.
+    3. `consultar` retorna os itens das células que tocam um retângulo. Para achar os alvos
+       a até `raio` de um trecho, basta consultar o retângulo do trecho expandido por `raio`.
+
+    Parâmetros:
+        largura (int): A largura do campo.
+        altura (int): A altura do campo.
+        tamanho_celula (int): O lado de cada célula.
+"""
+class GradeEspacial:
+    def __init__(self, largura, altura, tamanho_celula=TAMANHO_CELULA):
+        self.tamanho_celula = tamanho_celula
+        self.colunas = -(-largura // tamanho_celula)
+        self.linhas = -(-altura // tamanho_celula)
+        self.celulas = {}
+        self.celula_de = {}
+
+    def __len__(self):
+        return len(self.celula_de)
+
+    def _celula(self, x, y):
+        coluna = min(max(int(x // self.tamanho_celula), 0), self.colunas - 1)
+        linha = min(max(int(y // self.tamanho_celula), 0), self.linhas - 1)
+        return coluna, linha
+
+    def inserir(self, item, x, y):
+        celula = self._celula(x, y)
+        self.celula_de[item] = celula
+        self.celulas.setdefault(celula, set()).add(item)
+
+    def remover(self, item):
+        celula = self.celula_de.pop(item)
+        itens = self.celulas[celula]
+        itens.discard(item)
+        if not itens:
+            del self.celulas[celula]
+
+    """
+        Atualiza a posição de um item.
+
+        Retorna:
+            bool: `True` se o item mudou de célula.
+    """
+    def mover(self, item, x, y):
+        celula = self._celula(x, y)
+        if celula == self.celula_de[item]:
+            return False
+        self.remover(item)
+        self.celula_de[item] = celula
+        self.celulas.setdefault(celula, set()).add(item)
+        return True
+
+    """
+        Lista os itens das células que tocam o retângulo [esquerda, direita] x [topo, baixo].
+
+        Retorna:
+            list: Os itens candidatos, sem repetição (cada item está em uma única célula).
+    """
+    def consultar(self, esquerda, topo, direita, baixo):
+        coluna0, linha0 = self._celula(esquerda, topo)
+        coluna1, linha1 = self._celula(direita, baixo)
+        celulas = self.celulas
+        candidatos = []
+        for linha in range(linha0, linha1 + 1):
+            for coluna in range(coluna0, coluna1 + 1):
+                itens = celulas.get((coluna, linha))
+                if itens:
+                    candidatos.extend(itens)
+        return candidatos
+
+"""
+    Alvos que se movem em linha reta e ricocheteiam nas bordas da região dos alvos,
+    indexados por uma `GradeEspacial` pelo centro.
+
+    Parâmetros:
+        quantidade (int): Quantos alvos criar.
+        tamanho (int): O lado da imagem de cada alvo.
+        gerador (random.Random): O gerador das posições e velocidades.
+        largura (int): A largura do campo.
+        altura (int): A altura do campo.
+        tamanho_celula (int): O lado de cada célula da grade.
+"""
+class Alvos:
+    def __init__(self, quantidade, tamanho, gerador=random, largura=1400, altura=800,
+                 tamanho_celula=TAMANHO_CELULA):
+        self.tamanho = tamanho
+        self.gerador = gerador
+        self.x_minimo, self.y_minimo = REGIAO_ALVOS
+        self.x_maximo, self.y_maximo = largura - tamanho, altura - tamanho
+        self.grade = GradeEspacial(largura, altura, tamanho_celula)
+        self.x, self.y, self.vx, self.vy = [], [], [], []
+
+        for i in range(quantidade):
+            x, y = self._sortear_posicao()
+            direcao = gerador.uniform(0, 2 * math.pi)
+            velocidade = gerador.uniform(VELOCIDADE_MINIMA_ALVOS, VELOCIDADE_MAXIMA_ALVOS)
+            self.x.append(x)
+            self.y.append(y)
+            self.vx.append(velocidade * math.cos(direcao))
+            self.vy.append(velocidade * math.sin(direcao))
+            self.grade.inserir(i, x + tamanho / 2, y + tamanho / 2)
+
+    def __len__(self):
+        return len(self.x)
+
+    def _sortear_posicao(self):
+        return (self.gerador.uniform(self.x_minimo, self.x_maximo),
+                self.gerador.uniform(self.y_minimo, self.y_maximo))
+
+    """
+        Move todos os alvos por `dt` segundos de jogo, refletindo a velocidade nas bordas.
+    """
+    def mover(self, dt):
+        meio = self.tamanho / 2
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        mover_na_grade = self.grade.mover
+        for i in range(len(xs)):
+            x = xs[i] + vxs[i] * dt
+            y = ys[i] + vys[i] * dt
+            if x < self.x_minimo or x > self.x_maximo:
+                vxs[i] = -vxs[i]
+                x = min(max(x, self.x_minimo), self.x_maximo)
+            if y < self.y_minimo or y > self.y_maximo:
+                vys[i] = -vys[i]
+                y = min(max(y, self.y_minimo), self.y_maximo)
+            xs[i], ys[i] = x, y
+            mover_na_grade(i, x + meio, y + meio)
+
+    """
+        Leva um alvo atingido para uma nova posição sorteada, mantendo a velocidade.
+    """
+    def reposicionar(self, i):
+        self.x[i], self.y[i] = self._sortear_posicao()
+        self.grade.mover(i, self.x[i] + self.tamanho / 2, self.y[i] + self.tamanho / 2)
+
+    """
+        Lista os alvos cujo centro pode estar a até `raio` do trecho entre dois pontos.
+    """
+    def candidatos(self, x0, y0, x1, y1, raio):
+        return self.grade.consultar(min(x0, x1) - raio, min(y0, y1) - raio,
+                                    max(x0, x1) + raio, max(y0, y1) + raio)
+
+"""
+    Partida com vários alvos em movimento no lugar do Marçal.
+
+    1. A quantidade de alvos depende da dificuldade (`QUANTIDADE_ALVOS`) e cada um tem metade
+       do tamanho do Marçal (`PROPORCAO_TAMANHO_ALVO`). Posições e velocidades vêm do
+       `gerador` da partida, de modo que a gravação e a reprodução continuam valendo.
+    2. A cada passo, os alvos andam e a grade é atualizada só para os que mudaram de célula.
+    3. A colisão contínua (`Trajetoria.tempo_contato`) só é testada contra os alvos das
+       células que tocam o trecho percorrido pela cadeira no passo; vale o primeiro contato.
+    4. O alvo atingido vale um ponto e é levado para uma nova posição.
+
+    Os parâmetros são os mesmos de `Partida`.
+"""
+class PartidaAlvos(Partida):
+    def __init__(self, *argumentos, **opcoes):
+        super().__init__(*argumentos, **opcoes)
+        self.tamanho_alvo = int(self.tamanho_marcal * PROPORCAO_TAMANHO_ALVO)
+        self.alvos = Alvos(QUANTIDADE_ALVOS[self.dificuldade], self.tamanho_alvo, self.gerador,
+                           self.largura, self.altura)
+        self.raio_contato = 0.6 * TAMANHO_CADEIRA + 0.25 * self.tamanho_alvo
+        self.alvo_atingido = None
+
+    def avancar(self, entrada):
+        self.alvos.mover(self.dt)
+        return super().avancar(entrada)
+
+    """
+        Durante a mira, os ajustes são aplicados de uma vez (veja `Partida.avancar_varios`)
+        e os alvos andam os mesmos passos em seguida.
+    """
+    def avancar_varios(self, entrada, passos):
+        mirando = not (self.lancado or entrada.lancar)
+        avancados = super().avancar_varios(entrada, passos)
+        if mirando:
+            for _ in range(avancados):
+                self.alvos.mover(self.dt)
+        return avancados
+
+    """
+        Testa a colisão contínua contra os alvos próximos do trecho percorrido (no referencial
+        do canto da cadeira, como em `Partida.testar_colisao`).
+    """
+    def testar_colisao(self, t_anterior, estado):
+        if self.estado_anterior is not None:
+            x0, y0 = self.estado_anterior[0]
+        else:
+            x0, y0 = self.trajetoria.posicao(t_anterior)
+        x1, y1 = estado[0]
+
+        # A grade guarda o centro dos alvos; o trecho é levado para o centro da cadeira
+        meia_cadeira = TAMANHO_CADEIRA // 2
+        deslocamento = self.tamanho_alvo / 2 - meia_cadeira
+        alvos = self.alvos
+        primeiro, alvo_atingido = None, None
+        for i in sorted(alvos.candidatos(x0 + meia_cadeira, y0 + meia_cadeira,
+                                         x1 + meia_cadeira, y1 + meia_cadeira, self.raio_contato)):
+            tempo = self.trajetoria.tempo_contato(
+                alvos.x[i] + deslocamento, alvos.y[i] + deslocamento, self.raio_contato,
+                t_anterior, self.t, self.estado_anterior, estado
+            )
+            if tempo is not None and (primeiro is None or tempo < primeiro):
+                primeiro, alvo_atingido = tempo, i
+        self.alvo_atingido = alvo_atingido
+        return primeiro
+
+    def reposicionar_alvo(self):
+        self.alvos.reposicionar(self.alvo_atingido)
+
+if __name__ == '__main__':
+    # Compara o teste de colisão pela grade com o teste contra todos os alvos
+    import time
+
+    from fisica import Trajetoria
+    from partida import FASES, POSICAO_INICIAL
+
+    g, k = FASES[1]["g"], FASES[1]["k"]
+    x0, y0 = POSICAO_INICIAL
+    trechos = []
+    for angulo, velocidade in ((30, 250), (45, 200), (60, 300), (40, 400), (55, 150)):
+        trajetoria = Trajetoria(angulo, velocidade, x0, y0, g, k)
+        saida = trajetoria.tempo_saida_tela(1400, 800)
+        trechos += [(trajetoria, max(0.0, (i - 1) * 0.1), i * 0.1) for i in range(1, int(saida / 0.1))]
+
+    for quantidade in (25, 100, 400, 1600):
+        alvos = Alvos(quantidade, 40, random.Random(0))
+        raio = 0.6 * TAMANHO_CADEIRA + 10
+        meia_cadeira = TAMANHO_CADEIRA // 2
+        deslocamento = 20 - meia_cadeira
+        testes = {"grade": 0, "todos": 0}
+        for modo in testes:
+            inicio = time.perf_counter()
+            for trajetoria, t0, t1 in trechos:
+                (xa, ya), (xb, yb) = trajetoria.posicao(t0), trajetoria.posicao(t1)
+                if modo == "grade":
+                    indices = alvos.candidatos(xa + meia_cadeira, ya + meia_cadeira,
+                                               xb + meia_cadeira, yb + meia_cadeira, raio)
+                else:
+                    indices = range(quantidade)
+                for i in indices:
+                    trajetoria.tempo_contato(alvos.x[i] + deslocamento, alvos.y[i] + deslocamento, raio, t0, t1)
+            testes[modo] = (time.perf_counter() - inicio) / len(trechos)
+        print(f"{quantidade:>5} alvos: {testes['grade'] * 1e6:8.1f} µs por passo com a grade, "
+              f"{testes['todos'] * 1e6:8.1f} µs contra todos")
@@ -0,0 +1,340 @@
+import argparse
+import math
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from mira import ANGULO_MAXIMO, LIMITE_SERIE_MIRA, VELOCIDADE_MAXIMA
+from partida import ALTURA_CAMPO, DIFICULDADES, FASES, LARGURA_CAMPO, POSICAO_INICIAL, TAMANHO_CADEIRA
+
+# Pasta onde os atlas são gravados (um par de arquivos .npy por fase e tamanho do Marçal)
+PASTA_ATLAS = "atlas"
+
+# Área onde `partida.reposicionar_marcal` sorteia o canto do Marçal, no campo padrão
+X_MINIMO, X_MAXIMO = 600, LARGURA_CAMPO - 200
+Y_MINIMO, Y_MAXIMO = 300, ALTURA_CAMPO - 150
+
+# Espaçamento (em pixels) entre as posições do Marçal guardadas no atlas
+PASSO_CELULA = 10
+
+# Ângulos guardados no atlas: os valores que o jogador alcança com as setas (sensibilidade 0.5)
+PASSO_ANGULO = 0.5
+ANGULOS = np.arange(0, ANGULO_MAXIMO + PASSO_ANGULO / 2, PASSO_ANGULO)
+
+# Pontos da borda do círculo de contato usados para achar as velocidades extremas, e pontos
+# usados para refinar cada extremo entre as duas amostras vizinhas
+AMOSTRAS_CONTORNO = 64
+AMOSTRAS_REFINO = 17
+
+#---------------------------------------------------------------------------
+"""
+    Versão vetorizada de `mira._resolver_arrasto`: resolve -w - ln(1 - w) = d elemento a
+    elemento, por Newton a partir do mesmo ponto inicial, até todos os elementos convergirem.
+"""
+def _resolver_arrasto_lote(d):
+    d = np.maximum(d, 0.0)
+    w = np.minimum(np.sqrt(2 * d), -np.expm1(-(d + 1)))
+    ativo = (d > 0) & (w < 1)
+    for _ in range(60):
+        if not ativo.any():
+            break
+        w_ativo = np.where(ativo, w, 0.5)
+        serie = np.zeros_like(w_ativo)
+        for n in range(16, 1, -1):
+            serie = serie * w_ativo + 1 / n
+        perda = np.where(w_ativo < LIMITE_SERIE_MIRA, serie * w_ativo * w_ativo,
+                         -w_ativo - np.log1p(-w_ativo))
+        passo = np.where(ativo, (perda - d) * (1 - w_ativo) / w_ativo, 0.0)
+        w = w - passo
+        ativo &= passo > 1e-15 * w
+    return w
+
+"""
+    Versão vetorizada de `mira.velocidade_para_angulo`.
+
+    Parâmetros:
+        angulo (array_like): Os ângulos de lançamento em graus.
+        dx (array_like): Distâncias horizontais até o alvo.
+        dy (array_like): Alturas do alvo em relação ao lançamento (eixo Y para cima).
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar.
+
+    Retorna:
+        numpy.ndarray: A velocidade que leva a trajetória até cada ponto, ou infinito onde
+        o ponto não pode ser atingido com o ângulo (acima da linha de visada ou atrás do lançamento).
+"""
+def velocidades_para_angulos(angulo, dx, dy, g, k):
+    angulo, dx, dy = np.broadcast_arrays(*(np.asarray(valor, dtype=np.float64) for valor in (angulo, dx, dy)))
+    angulo_rad = np.radians(np.minimum(angulo, 89.999))
+    cosseno = np.cos(angulo_rad)
+    folga = dx * np.tan(angulo_rad) - dy
+    valido = (dx > 0) & (angulo < 90) & (folga > 0)
+    folga = np.where(valido, folga, 1.0)
+
+    if k == 0:
+        velocidade = dx / (cosseno * np.sqrt(2 * folga / g))
+    else:
+        w = _resolver_arrasto_lote(folga * k * k / g)
+        velocidade = k * dx / (w * cosseno)
+    return np.where(valido, velocidade, np.inf)
+
+"""
+    Calcula as janelas de velocidade de uma coluna do atlas (uma posição X do Marçal).
+
+    1. A colisão acontece quando o canto da cadeira passa a até `raio` do centro do Marçal
+       deslocado de meia cadeira (o mesmo critério de `Partida.testar_colisao`).
+    2. Com o ângulo fixo, a trajetória sobe em todo ponto quando a velocidade aumenta, então
+       cada ponto do círculo de contato é atingido por uma única velocidade, e as velocidades
+       que acertam formam um intervalo: do menor ao maior valor sobre a borda do círculo.
+    3. Pontos acima da linha de visada só seriam atingidos com velocidade infinita; o
+       intervalo é limitado à velocidade máxima do jogo.
+
+    Parâmetros:
+        tarefa (tuple): (fase, tamanho_marcal, coluna), em que `coluna` é o índice da posição X.
+
+    Retorna:
+        tuple: (fase, tamanho_marcal, coluna, janelas), com `janelas` de formato
+        (linhas, ângulos, 2) contendo (velocidade mínima, velocidade máxima), ou NaN onde
+        nenhuma velocidade acerta.
+"""
+def _calcular_coluna(tarefa):
+    fase, tamanho_marcal, coluna = tarefa
+    g, k = FASES[fase]["g"], FASES[fase]["k"]
+    x0, y0 = POSICAO_INICIAL
+    deslocamento = tamanho_marcal // 2 - TAMANHO_CADEIRA // 2
+    raio = 0.6 * TAMANHO_CADEIRA + 0.25 * tamanho_marcal
+
+    alvo_x = X_MINIMO + coluna * PASSO_CELULA + deslocamento
+    alvo_y = np.arange(Y_MINIMO, Y_MAXIMO + 1, PASSO_CELULA) + deslocamento
+
+    def velocidades_no_contorno(fi):
+        # `fi` tem formato (linhas, ângulos, pontos do contorno)
+        dx = alvo_x + raio * np.cos(fi) - x0
+        dy = y0 - (alvo_y[:, None, None] + raio * np.sin(fi))
+        return velocidades_para_angulos(ANGULOS[None, :, None], dx, dy, g, k)
+
+    # Amostra o contorno inteiro e refina cada extremo entre as amostras vizinhas
+    intervalo = 2 * math.pi / AMOSTRAS_CONTORNO
+    contorno = np.broadcast_to(np.arange(AMOSTRAS_CONTORNO) * intervalo, (len(alvo_y), len(ANGULOS), AMOSTRAS_CONTORNO))
+    velocidades = velocidades_no_contorno(contorno)
+    refino = np.linspace(-intervalo, intervalo, AMOSTRAS_REFINO)
+    extremos = []
+    for indice in (velocidades.argmin(axis=2), velocidades.argmax(axis=2)):
+        extremos.append(velocidades_no_contorno(np.take_along_axis(contorno, indice[..., None], axis=2) + refino))
+
+    minima = np.minimum(velocidades.min(axis=2), extremos[0].min(axis=2))
+    maxima = np.minimum(np.maximum(velocidades.max(axis=2), extremos[1].max(axis=2)), VELOCIDADE_MAXIMA)
+    alcancavel = minima <= VELOCIDADE_MAXIMA
+    janelas = np.stack([np.where(alcancavel, minima, np.nan), np.where(alcancavel, maxima, np.nan)], axis=-1)
+    return fase, tamanho_marcal, coluna, janelas.astype(np.float32)
+
+"""
+    Resume as janelas de cada posição: a maior largura de janela (a margem, em m/s) e o
+    lançamento no meio dessa janela.
+
+    Retorna:
+        numpy.ndarray: Formato (colunas, linhas, 3) com (margem, ângulo, velocidade); margem 0
+        e NaN no lançamento onde o Marçal não pode ser atingido.
+"""
+def _resumir(janelas):
+    larguras = np.nan_to_num(janelas[..., 1] - janelas[..., 0], nan=-1.0)
+    melhor = larguras.argmax(axis=2)
+    escolhidas = np.take_along_axis(janelas, melhor[..., None, None], axis=2)[:, :, 0, :]
+    alcancavel = larguras.max(axis=2) >= 0
+    resumo = np.empty(janelas.shape[:2] + (3,), dtype=np.float32)
+    resumo[..., 0] = np.where(alcancavel, larguras.max(axis=2), 0.0)
+    resumo[..., 1] = np.where(alcancavel, ANGULOS[melhor], np.nan)
+    resumo[..., 2] = np.where(alcancavel, escolhidas.mean(axis=-1), np.nan)
+    return resumo
+
+def _caminhos(fase, tamanho_marcal, pasta):
+    prefixo = os.path.join(pasta, f"fase{fase}_marcal{tamanho_marcal}")
+    return prefixo + "_janelas.npy", prefixo + "_resumo.npy"
+
+"""
+    Constrói os atlas de todas as fases e tamanhos do Marçal e os grava em `pasta`.
+
+    1. Divide o trabalho em uma tarefa por fase, tamanho e posição X do Marçal.
+    2. Distribui as tarefas em um pool de processos, como `simulacao.simular_em_lote`.
+    3. Junta as colunas e grava, para cada fase e tamanho, as janelas de velocidade
+       (`*_janelas.npy`) e o resumo por posição (`*_resumo.npy`).
+
+    Parâmetros:
+        pasta (str): A pasta de destino (criada se não existir).
+        processos (int): Número de processos do pool (None usa todos os núcleos).
+        fases (iterable): As fases incluídas.
+        tamanhos (iterable): Os tamanhos do Marçal incluídos.
+
+    Retorna:
+        list: Os caminhos dos arquivos gravados.
+"""
+def construir_atlas(pasta=PASTA_ATLAS, processos=None, fases=tuple(FASES),
+                    tamanhos=tuple(sorted({d["tamanho_marcal"] for d in DIFICULDADES.values()}))):
+    colunas = (X_MAXIMO - X_MINIMO) // PASSO_CELULA + 1
+    linhas = (Y_MAXIMO - Y_MINIMO) // PASSO_CELULA + 1
+    tarefas = [(fase, tamanho, coluna) for fase in fases for tamanho in tamanhos for coluna in range(colunas)]
+
+    atlas = {(fase, tamanho): np.empty((colunas, linhas, len(ANGULOS), 2), dtype=np.float32)
+             for fase in fases for tamanho in tamanhos}
+    with multiprocessing.Pool(processos) as pool:
+        for fase, tamanho, coluna, janelas in pool.imap_unordered(_calcular_coluna, tarefas):
+            atlas[fase, tamanho][coluna] = janelas
+
+    os.makedirs(pasta, exist_ok=True)
+    gravados = []
+    for (fase, tamanho), janelas in sorted(atlas.items()):
+        caminho_janelas, caminho_resumo = _caminhos(fase, tamanho, pasta)
+        np.save(caminho_janelas, janelas)
+        np.save(caminho_resumo, _resumir(janelas))
+        gravados += [caminho_janelas, caminho_resumo]
+    return gravados
+
+"""
+    Atlas de acerto de uma fase e um tamanho do Marçal, lido do disco por mapeamento de
+    memória (`np.load(mmap_mode='r')`): abrir o atlas não lê os arquivos, e cada consulta
+    só lê as poucas páginas que usa.
+
+    1. As posições do Marçal (canto superior esquerdo) são arredondadas para a posição
+       mais próxima da grade de `PASSO_CELULA` pixels; fora da área de sorteio, usa a borda.
+    2. Todas as consultas são O(1): um índice na grade, sem chamar o resolvedor de `mira.py`.
+    3. Os valores valem para a posição da grade; a posição exata do Marçal pode estar a até
+       meio `PASSO_CELULA` dela em cada eixo.
+
+    Parâmetros:
+        fase (int): A fase (define g e k).
+        tamanho_marcal (int): O tamanho do Marçal (define o raio de contato).
+        pasta (str): A pasta com os arquivos gravados por `construir_atlas`.
+"""
+class Atlas:
+    def __init__(self, fase, tamanho_marcal, pasta=PASTA_ATLAS):
+        caminho_janelas, caminho_resumo = _caminhos(fase, tamanho_marcal, pasta)
+        self.janelas = np.load(caminho_janelas, mmap_mode="r")
+        self.resumo = np.load(caminho_resumo, mmap_mode="r")
+
+    def _celula(self, marcal_x, marcal_y):
+        colunas, linhas = self.resumo.shape[:2]
+        coluna = min(max(round((marcal_x - X_MINIMO) / PASSO_CELULA), 0), colunas - 1)
+        linha = min(max(round((marcal_y - Y_MINIMO) / PASSO_CELULA), 0), linhas - 1)
+        return coluna, linha
+
+    """
+        Retorna o intervalo de velocidades que acerta o Marçal com o ângulo dado.
+
+        Retorna:
+            tuple: (velocidade mínima, velocidade máxima), ou None se o ângulo não acerta.
+    """
+    def janela(self, marcal_x, marcal_y, angulo):
+        indice = min(max(round(angulo / PASSO_ANGULO), 0), len(ANGULOS) - 1)
+        minima, maxima = self.janelas[self._celula(marcal_x, marcal_y) + (indice,)]
+        if math.isnan(minima):
+            return None
+        return float(minima), float(maxima)
+
+    """
+        Retorna a maior largura (em m/s) de janela de velocidade entre todos os ângulos,
+        ou 0 se o Marçal não pode ser atingido.
+    """
+    def margem(self, marcal_x, marcal_y):
+        return float(self.resumo[self._celula(marcal_x, marcal_y) + (0,)])
+
+    def alcancavel(self, marcal_x, marcal_y):
+        return self.margem(marcal_x, marcal_y) > 0
+
+    """
+        Retorna o lançamento mais tolerante: o ângulo com a maior janela e a velocidade no
+        meio dela, ou None se o Marçal não pode ser atingido.
+    """
+    def melhor_lancamento(self, marcal_x, marcal_y):
+        margem, angulo, velocidade = self.resumo[self._celula(marcal_x, marcal_y)]
+        if margem <= 0:
+            return None
+        return float(angulo), float(velocidade)
+
+"""
+    Abre o atlas de uma fase e tamanho do Marçal, ou retorna None se ele não foi construído.
+"""
+def carregar_atlas(fase, tamanho_marcal, pasta=PASTA_ATLAS):
+    if not all(os.path.exists(caminho) for caminho in _caminhos(fase, tamanho_marcal, pasta)):
+        return None
+    return Atlas(fase, tamanho_marcal, pasta)
+
+"""
+    Confere o atlas contra a colisão contínua do jogo (`Trajetoria.tempo_contato`) em
+    lançamentos sorteados: o meio de cada janela deve acertar e velocidades um pouco fora
+    dela devem errar.
+
+    Parâmetros:
+        atlas (Atlas): O atlas conferido.
+        fase (int): A fase do atlas.
+        tamanho_marcal (int): O tamanho do Marçal do atlas.
+        quantidade (int): Quantas posições e ângulos sortear.
+        folga (float): A distância (em m/s) das velocidades testadas fora da janela.
+        semente (int): Semente do gerador aleatório.
+
+    Retorna:
+        tuple: (lançamentos conferidos, lançamentos em desacordo com o atlas).
+"""
+def conferir_atlas(atlas, fase, tamanho_marcal, quantidade=200, folga=1.0, semente=0):
+    from fisica import Trajetoria
+
+    gerador = np.random.default_rng(semente)
+    g, k = FASES[fase]["g"], FASES[fase]["k"]
+    x0, y0 = POSICAO_INICIAL
+    deslocamento = tamanho_marcal // 2 - TAMANHO_CADEIRA // 2
+    raio = 0.6 * TAMANHO_CADEIRA + 0.25 * tamanho_marcal
+
+    def acerta(angulo, velocidade, cx, cy):
+        trajetoria = Trajetoria(angulo, velocidade, x0, y0, g, k)
+        saida = trajetoria.tempo_saida_tela(LARGURA_CAMPO, ALTURA_CAMPO)
+        return trajetoria.tempo_contato(cx, cy, raio, 0.0, saida) is not None
+
+    conferidos = desacordos = 0
+    for _ in range(quantidade):
+        # Posições exatamente sobre a grade, onde o atlas vale sem aproximação
+        marcal_x = X_MINIMO + PASSO_CELULA * int(gerador.integers(0, (X_MAXIMO - X_MINIMO) // PASSO_CELULA + 1))
+        marcal_y = Y_MINIMO + PASSO_CELULA * int(gerador.integers(0, (Y_MAXIMO - Y_MINIMO) // PASSO_CELULA + 1))
+        angulo = float(ANGULOS[gerador.integers(0, len(ANGULOS))])
+        cx, cy = marcal_x + deslocamento, marcal_y + deslocamento
+
+        janela = atlas.janela(marcal_x, marcal_y, angulo)
+        if janela is None:
+            testes = [(float(v), False) for v in np.linspace(0, VELOCIDADE_MAXIMA, 25)]
+        else:
+            minima, maxima = janela
+            testes = [((minima + maxima) / 2, True), (minima - folga, False)]
+            if maxima + folga < VELOCIDADE_MAXIMA:
+                testes.append((maxima + folga, False))
+        for velocidade, esperado in testes:
+            if velocidade < 0:
+                continue
+            conferidos += 1
+            desacordos += acerta(angulo, velocidade, cx, cy) != esperado
+    return conferidos, desacordos
+
+def main():
+    parser = argparse.ArgumentParser(description="Constrói os atlas de acerto de Chairs! por fase e tamanho do Marçal.")
+    parser.add_argument("--pasta", default=PASTA_ATLAS, help="pasta onde gravar os arquivos .npy")
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: todos os núcleos)")
+    parser.add_argument("--conferir", type=int, default=200,
+                        help="lançamentos sorteados conferidos contra a colisão do jogo em cada atlas (0 não confere)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    gravados = construir_atlas(args.pasta, args.processos)
+    tamanho = sum(os.path.getsize(caminho) for caminho in gravados)
+    print(f"{len(gravados)} arquivos ({tamanho / 2**20:.1f} MiB) em {time.perf_counter() - inicio:.1f} s")
+
+    if args.conferir:
+        print(f"{'fase':<8}{'marçal':>7}{'alcançáveis':>13}{'margem média':>14}{'desacordos':>12}")
+        for fase in FASES:
+            for tamanho_marcal in sorted({d["tamanho_marcal"] for d in DIFICULDADES.values()}):
+                atlas = Atlas(fase, tamanho_marcal, args.pasta)
+                conferidos, desacordos = conferir_atlas(atlas, fase, tamanho_marcal, args.conferir)
+                margens = np.asarray(atlas.resumo[..., 0])
+                print(f"{FASES[fase]['nome']:<8}{tamanho_marcal:>7}{(margens > 0).mean():>13.1%}"
+                      f"{margens[margens > 0].mean():>14.1f}{desacordos:>7}/{conferidos}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,372 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+# Os quadros do jogo são desenhados sem janela; precisa vir antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from fisica import Trajetoria, atualizar_posicao_e_velocidade_com_resistencia, verificar_colisao
+from partida import DIFICULDADES, FASES, POSICAO_INICIAL, TAMANHO_CADEIRA, Entrada
+
+# Arquivo com os resultados de referência
+ARQUIVO_BASE = "benchmarks_base.json"
+
+# Queda de vazão, em relação à referência, a partir da qual um benchmark é uma regressão
+LIMITE_REGRESSAO = 0.2
+
+# Cada benchmark é repetido e vale a melhor repetição, que é a menos afetada por ruído
+REPETICOES = 5
+
+# Duração mínima (em s) de cada repetição; a quantidade de operações é calibrada para ela
+DURACAO_MINIMA = 0.2
+
+# Quadros de cada partida medida: menos que a partida mais curta (30 s a 60 passos por segundo)
+QUADROS_POR_PARTIDA = 1500
+
+# Lançamentos usados nos quadros medidos (ângulo, velocidade), repetidos em ciclo
+LANCAMENTOS = ((30, 250), (45, 200), (60, 300), (40, 400), (55, 150))
+
+ENTRADA_LANCAR = Entrada(False, False, False, False, True, False)
+
+#---------------------------------------------------------------------------
+"""
+    Benchmark da posição e velocidade pela solução fechada (`atualizar_posicao_e_velocidade_com_resistencia`),
+    em instantes espalhados por um voo de 10 s.
+
+    Parâmetros:
+        fase (int): A fase, que define g e k.
+
+    Retorna:
+        callable: Função que executa `n` operações e retorna o tempo gasto, em segundos.
+"""
+def benchmark_fisica(fase):
+    g, k = FASES[fase]["g"], FASES[fase]["k"]
+    x0, y0 = POSICAO_INICIAL
+    instantes = [i * 0.01 for i in range(1000)]
+
+    def executar(n):
+        inicio = time.perf_counter()
+        for i in range(n):
+            atualizar_posicao_e_velocidade_com_resistencia(instantes[i % 1000], 45, 300, x0, y0, g, k)
+        return time.perf_counter() - inicio
+
+    return executar
+
+"""
+    Benchmark do teste de colisão entre a cadeira e o Marçal (`verificar_colisao`),
+    com posições sorteadas na tela (com e sem colisão).
+
+    Parâmetros:
+        dificuldade (int): A dificuldade, que define o tamanho do Marçal.
+"""
+def benchmark_colisao(dificuldade):
+    gerador = random.Random(0)
+    raio_marcal = 0.25 * DIFICULDADES[dificuldade]["tamanho_marcal"]
+    raio_cadeira = 0.6 * TAMANHO_CADEIRA
+    posicoes = [(gerador.uniform(0, 1400), gerador.uniform(0, 800)) for _ in range(1000)]
+
+    def executar(n):
+        inicio = time.perf_counter()
+        for i in range(n):
+            x, y = posicoes[i % 1000]
+            verificar_colisao(x, y, 990, 550, raio_cadeira, raio_marcal)
+        return time.perf_counter() - inicio
+
+    return executar
+
+"""
+    Benchmark da colisão contínua usada pelo jogo (`Trajetoria.tempo_contato`): um teste
+    por passo de física ao longo de voos completos, com o Marçal no caminho de parte deles.
+
+    Parâmetros:
+        fase (int): A fase, que define g e k.
+        dificuldade (int): A dificuldade, que define o tamanho do Marçal.
+"""
+def benchmark_colisao_continua(fase, dificuldade):
+    g, k = FASES[fase]["g"], FASES[fase]["k"]
+    x0, y0 = POSICAO_INICIAL
+    tamanho_marcal = DIFICULDADES[dificuldade]["tamanho_marcal"]
+    raio = 0.6 * TAMANHO_CADEIRA + 0.25 * tamanho_marcal
+    centro = 990 + tamanho_marcal // 2 - TAMANHO_CADEIRA // 2, 550 + tamanho_marcal // 2 - TAMANHO_CADEIRA // 2
+
+    # Trechos (t0, t1) de cada passo de física até o voo sair da tela
+    trechos = []
+    for angulo, velocidade in LANCAMENTOS:
+        trajetoria = Trajetoria(angulo, velocidade, x0, y0, g, k)
+        saida = trajetoria.tempo_saida_tela(1400, 800)
+        passos = int(saida / 0.1)
+        trechos += [(trajetoria, max(0.0, (i - 1) * 0.1), i * 0.1) for i in range(passos)]
+
+    def executar(n):
+        inicio = time.perf_counter()
+        for i in range(n):
+            trajetoria, t0, t1 = trechos[i % len(trechos)]
+            trajetoria.tempo_contato(centro[0], centro[1], raio, t0, t1)
+        return time.perf_counter() - inicio
+
+    return executar
+
+"""
+    Benchmark da colisão contínua com vários alvos (`alvos.PartidaAlvos.testar_colisao`):
+    um teste por passo de física ao longo dos voos de `LANCAMENTOS`, contra `quantidade`
+    alvos parados em posições sorteadas.
+
+    1. Com `grade`, só os alvos das células da `GradeEspacial` que tocam o trecho são testados.
+    2. Sem `grade`, todos os alvos são testados, como referência da força bruta.
+
+    Parâmetros:
+        quantidade (int): Quantos alvos há no campo.
+        grade (bool): Se os candidatos vêm da grade espacial.
+"""
+def benchmark_alvos(quantidade, grade):
+    from alvos import Alvos
+
+    g, k = FASES[1]["g"], FASES[1]["k"]
+    x0, y0 = POSICAO_INICIAL
+    alvos = Alvos(quantidade, 40, random.Random(0))
+    raio = 0.6 * TAMANHO_CADEIRA + 0.25 * alvos.tamanho
+    meia_cadeira = TAMANHO_CADEIRA // 2
+    deslocamento = alvos.tamanho / 2 - meia_cadeira
+    todos = range(quantidade)
+
+    trechos = []
+    for angulo, velocidade in LANCAMENTOS:
+        trajetoria = Trajetoria(angulo, velocidade, x0, y0, g, k)
+        saida = trajetoria.tempo_saida_tela(1400, 800)
+        for i in range(1, int(saida / 0.1)):
+            t0, t1 = (i - 1) * 0.1, i * 0.1
+            trechos.append((trajetoria, t0, t1, trajetoria.posicao(t0), trajetoria.posicao(t1)))
+
+    def executar(n):
+        inicio = time.perf_counter()
+        for i in range(n):
+            trajetoria, t0, t1, (xa, ya), (xb, yb) = trechos[i % len(trechos)]
+            if grade:
+                candidatos = alvos.candidatos(xa + meia_cadeira, ya + meia_cadeira,
+                                              xb + meia_cadeira, yb + meia_cadeira, raio)
+            else:
+                candidatos = todos
+            for j in candidatos:
+                trajetoria.tempo_contato(alvos.x[j] + deslocamento, alvos.y[j] + deslocamento, raio, t0, t1)
+        return time.perf_counter() - inicio
+
+    return executar
+
+"""
+    Benchmark de um passo do modo rajada (`rajada.LoteCadeiras.avancar`) com `quantidade`
+    cadeiras no ar: posição, colisão contínua com o Marçal e remoção em lote. As cadeiras
+    são relançadas (fora da medida) quando metade delas já saiu do campo.
+
+    Parâmetros:
+        quantidade (int): Quantas cadeiras ficam no ar.
+"""
+def benchmark_rajada(quantidade):
+    import numpy as np
+
+    from rajada import LoteCadeiras
+
+    g, k = FASES[1]["g"], FASES[1]["k"]
+    x0, y0 = POSICAO_INICIAL
+    angulos = np.linspace(20, 80, quantidade)
+
+    def executar(n):
+        gasto = 0.0
+        lote = LoteCadeiras(g, k)
+        for _ in range(n):
+            if len(lote) < quantidade // 2:
+                lote = LoteCadeiras(g, k)
+                lote.lancar(x0, y0, angulos, 150)
+            inicio = time.perf_counter()
+            lote.avancar(0.1, 990, 550, 120, 1400, 800)
+            gasto += time.perf_counter() - inicio
+        return gasto
+
+    return executar
+
+"""
+    Benchmark de um quadro completo da partida (`CenaJogo` de `chairs.py`), com todas as
+    imagens, textos, traçado, previsão, compositor e envio para a janela (sem janela real).
+
+    1. Cada quadro avança exatamente um passo de física, independente do relógio.
+    2. Quando a cadeira não está voando, ela é lançada com o próximo par de `LANCAMENTOS`,
+       de modo que os quadros alternam entre mira, voo e acertos.
+    3. Uma nova partida (com a mesma semente) é criada a cada `QUADROS_POR_PARTIDA` quadros;
+       a criação não entra na medida.
+
+    Parâmetros:
+        dificuldade (int): A dificuldade da partida.
+        fase (int): A fase da partida.
+"""
+def benchmark_quadro(dificuldade, fase):
+    import chairs
+    from qualidade import NIVEIS, governador
+
+    chairs.iniciar()
+    # Mede sempre a qualidade mais alta, sem trocas de nível durante a medida
+    governador.ativo = False
+    governador.nivel = len(NIVEIS) - 1
+
+    def executar(n):
+        gasto = 0.0
+        feitos = 0
+        while feitos < n:
+            chairs.dificuldade, chairs.fases = dificuldade, fase
+            random.seed(0)
+            cena = chairs.CenaJogo()
+            partida = cena.partida
+            quadros = min(n - feitos, QUADROS_POR_PARTIDA)
+
+            inicio = time.perf_counter()
+            for i in range(quadros):
+                if not partida.lancado:
+                    partida.angulo, partida.velocidade_inicial = LANCAMENTOS[(feitos + i) % len(LANCAMENTOS)]
+                    partida.avancar(ENTRADA_LANCAR)
+                cena.tempo_anterior = chairs.obter_ticks()
+                cena.acumulador = partida.dt
+                cena.atualizar()
+                cena.desenhar()
+            gasto += time.perf_counter() - inicio
+            feitos += quadros
+        return gasto
+
+    return executar
+
+"""
+    Benchmark da abertura do jogo: executa "chairs.py --medir-inicio" em um processo novo e
+    soma o tempo informado da importação até o primeiro quadro do menu (veja `chairs.main`).
+    O início do interpretador não entra na medida.
+"""
+def benchmark_inicio():
+    comando = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "chairs.py"), "--medir-inicio"]
+
+    def executar(n):
+        gasto = 0.0
+        for _ in range(n):
+            saida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+            gasto += json.loads(saida[saida.index("{"):])["total"] / 1000
+        return gasto
+
+    return executar
+
+"""
+    Lista os benchmarks da suíte, pelo nome.
+
+    Retorna:
+        dict: Para cada nome, a função que monta o benchmark.
+"""
+def listar_benchmarks():
+    benchmarks = {}
+    for fase in FASES:
+        benchmarks[f"fisica/{FASES[fase]['nome']}"] = lambda fase=fase: benchmark_fisica(fase)
+    for dificuldade in DIFICULDADES:
+        benchmarks[f"colisao/{DIFICULDADES[dificuldade]['nome']}"] = lambda d=dificuldade: benchmark_colisao(d)
+    combinacoes = [(d, f, f"{DIFICULDADES[d]['nome']}/{FASES[f]['nome']}") for d in DIFICULDADES for f in FASES]
+    for dificuldade, fase, nome in combinacoes:
+        benchmarks[f"colisao_continua/{nome}"] = lambda d=dificuldade, f=fase: benchmark_colisao_continua(f, d)
+    for quantidade in (25, 100, 400):
+        benchmarks[f"alvos/grade/{quantidade}"] = lambda q=quantidade: benchmark_alvos(q, True)
+        benchmarks[f"alvos/todos/{quantidade}"] = lambda q=quantidade: benchmark_alvos(q, False)
+    for quantidade in (1000, 5000):
+        benchmarks[f"rajada/{quantidade}"] = lambda q=quantidade: benchmark_rajada(q)
+    for dificuldade, fase, nome in combinacoes:
+        benchmarks[f"quadro/{nome}"] = lambda d=dificuldade, f=fase: benchmark_quadro(d, f)
+    benchmarks["inicio/primeiro_quadro"] = benchmark_inicio
+    return benchmarks
+
+"""
+    Mede a vazão de um benchmark.
+
+    1. Aumenta a quantidade de operações (pelo menos dobrando, estimada pela duração da
+       execução anterior) até uma execução durar pelo menos `duracao_minima`.
+    2. Repete a medida `repeticoes` vezes com essa quantidade e usa a mais rápida.
+
+    Parâmetros:
+        executar (callable): Função que executa `n` operações e retorna o tempo gasto.
+        repeticoes (int): Quantas medidas fazer.
+        duracao_minima (float): A duração mínima de cada medida, em segundos.
+
+    Retorna:
+        float: Operações por segundo.
+"""
+def medir(executar, repeticoes=REPETICOES, duracao_minima=DURACAO_MINIMA):
+    n = 1
+    while True:
+        gasto = executar(n)
+        if gasto >= duracao_minima:
+            break
+        n = n * 2 if gasto <= 0 else max(n * 2, int(n * duracao_minima / gasto * 1.1))
+
+    melhor = gasto
+    for _ in range(repeticoes - 1):
+        melhor = min(melhor, executar(n))
+    return n / melhor
+
+"""
+    Compara os resultados com a referência.
+
+    Parâmetros:
+        resultados (dict): Vazão atual de cada benchmark.
+        base (dict): Vazão de referência de cada benchmark.
+        limite (float): A queda relativa tolerada.
+
+    Retorna:
+        list: Os nomes dos benchmarks que regrediram além do limite.
+"""
+def comparar(resultados, base, limite=LIMITE_REGRESSAO):
+    return [nome for nome, vazao in resultados.items()
+            if nome in base and vazao < base[nome] * (1 - limite)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede a física, a colisão, os modos rajada e com vários alvos e os quadros de Chairs! e compara com uma referência.")
+    parser.add_argument("--base", default=ARQUIVO_BASE, help="arquivo JSON com os resultados de referência")
+    parser.add_argument("--salvar", action="store_true", help="grava os resultados como a nova referência")
+    parser.add_argument("--limite", type=float, default=LIMITE_REGRESSAO,
+                        help="queda de vazão tolerada em relação à referência (0.2 = 20%%)")
+    parser.add_argument("--filtro", default="", help="executa só os benchmarks cujo nome contém este texto")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES)
+    parser.add_argument("--duracao", type=float, default=DURACAO_MINIMA, help="duração mínima de cada medida, em segundos")
+    args = parser.parse_args()
+
+    base = {}
+    if os.path.exists(args.base) and not args.salvar:
+        with open(args.base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)["resultados"]
+
+    resultados = {}
+    print(f"{'benchmark':<36}{'ops/s':>14}{'referência':>14}{'variação':>10}")
+    for nome, montar in listar_benchmarks().items():
+        if args.filtro not in nome:
+            continue
+        resultados[nome] = medir(montar(), args.repeticoes, args.duracao)
+        linha = f"{nome:<36}{resultados[nome]:>14.0f}"
+        if nome in base:
+            linha += f"{base[nome]:>14.0f}{resultados[nome] / base[nome] - 1:>+10.1%}"
+        print(linha)
+
+    if args.salvar:
+        with open(args.base, "w", encoding="utf-8") as arquivo:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "plataforma": platform.platform(),
+                "resultados": resultados,
+            }, arquivo, indent=2, ensure_ascii=False)
+        print(f"Referência gravada em {args.base}")
+        return
+
+    regressoes = comparar(resultados, base, args.limite)
+    if regressoes:
+        print(f"{len(regressoes)} benchmark(s) abaixo de {1 - args.limite:.0%} da referência: {', '.join(regressoes)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import pygame
+
+from perfil import perfilador
+
+# Tempo limite (em ms) da espera por eventos quando a cena do topo está parada
+TEMPO_ESPERA_EVENTO = 500
+
+# Taxa de quadros das cenas animadas
+QUADROS_POR_SEGUNDO = 60
+
+# Eventos que exigem redesenhar as cenas visíveis (janela redimensionada ou reexposta)
+EVENTOS_REDESENHO = (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+#---------------------------------------------------------------------------
+"""
+    Uma tela do jogo (menu, partida, resultados, janelas sobrepostas).
+
+    Atributos de classe:
+        animada (bool): Se a cena é atualizada e desenhada a cada quadro (como a partida)
+                        ou apenas quando recebe eventos (como o menu).
+        sobreposicao (bool): Se a cena é desenhada por cima da cena de baixo, que continua visível.
+
+    Métodos que as cenas podem redefinir:
+        entrar: chamado quando a cena passa a ser a do topo (ao ser empilhada ou revelada).
+        invalidar: chamado quando a janela precisa ser redesenhada inteira (útil nas cenas animadas).
+        tratar_evento: recebe cada evento do pygame enquanto a cena está no topo.
+        atualizar: chamado uma vez por quadro nas cenas animadas.
+        desenhar: desenha a cena na tela; as cenas paradas desenham tudo e a pilha
+                  envia a tela para a janela; as animadas enviam elas mesmas.
+"""
+class Cena:
+    animada = False
+    sobreposicao = False
+
+    def __init__(self):
+        self.pilha = None
+
+    def entrar(self):
+        pass
+
+    def invalidar(self):
+        pass
+
+    def tratar_evento(self, evento):
+        pass
+
+    def atualizar(self):
+        pass
+
+    def desenhar(self):
+        pass
+
+"""
+    Pilha de cenas com um único laço principal e uma única janela.
+
+    1. A cena do topo recebe os eventos. As cenas trocam de tela empilhando, desempilhando
+       ou trocando cenas, sem criar janelas nem laços próprios.
+    2. Se a cena do topo é animada, o laço processa os eventos pendentes, atualiza e
+       desenha a cena e limita a taxa de quadros. O processamento dos eventos e a espera
+       pelo relógio são medidos pelo perfilador de quadros (`perfil.py`), quando ligado.
+    3. Se está parada, o laço dorme em `pygame.event.wait` e só redesenha quando a pilha
+       muda ou quando a janela é reexposta. O redesenho começa pela cena mais alta que
+       não é sobreposição, para que as janelas sobrepostas apareçam por cima dela.
+    4. O laço termina quando a pilha fica vazia.
+
+    Parâmetros:
+        relogio (pygame.time.Clock): Controla a taxa de quadros das cenas animadas.
+"""
+class PilhaCenas:
+    def __init__(self, relogio):
+        self.relogio = relogio
+        self.cenas = []
+        self._redesenhar = True
+
+    @property
+    def topo(self):
+        return self.cenas[-1] if self.cenas else None
+
+    def empilhar(self, cena):
+        cena.pilha = self
+        self.cenas.append(cena)
+        cena.entrar()
+        self._redesenhar = True
+
+    def desempilhar(self):
+        cena = self.cenas.pop()
+        cena.pilha = None
+        if self.cenas:
+            self.cenas[-1].entrar()
+        self._redesenhar = True
+
+    """
+        Substitui a cena do topo por outra (por exemplo, a partida pelos resultados).
+    """
+    def trocar(self, cena):
+        antiga = self.cenas.pop()
+        antiga.pilha = None
+        self.empilhar(cena)
+
+    """
+        Esvazia a pilha, encerrando o laço principal.
+    """
+    def limpar(self):
+        for cena in self.cenas:
+            cena.pilha = None
+        self.cenas.clear()
+
+    """
+        Redesenha as cenas visíveis, de baixo para cima, e envia a tela para a janela.
+    """
+    def _desenhar_visiveis(self):
+        inicio = len(self.cenas) - 1
+        while inicio > 0 and self.cenas[inicio].sobreposicao:
+            inicio -= 1
+        for cena in self.cenas[inicio:]:
+            cena.desenhar()
+        pygame.display.flip()
+
+    def executar(self):
+        while self.cenas:
+            cena = self.topo
+            if cena.animada:
+                eventos = pygame.event.get()
+            else:
+                if self._redesenhar:
+                    self._redesenhar = False
+                    self._desenhar_visiveis()
+                eventos = [pygame.event.wait(TEMPO_ESPERA_EVENTO)] + pygame.event.get()
+
+            # Cada evento vai para a cena que estiver no topo quando ele for tratado
+            for evento in eventos:
+                cena = self.topo
+                if cena is None:
+                    return
+                if evento.type in EVENTOS_REDESENHO:
+                    self._redesenhar = True
+                    cena.invalidar()
+                cena.tratar_evento(evento)
+
+            cena = self.topo
+            if cena is not None and cena.animada:
+                perfilador.marcar("eventos")
+                cena.atualizar()
+                if self.topo is cena:
+                    cena.desenhar()
+                self.relogio.tick(QUADROS_POR_SEGUNDO)
+                perfilador.marcar("espera")
+                perfilador.fechar_quadro()
@@ -1,15 +1,27 @@
+import time
+# Instante em que o módulo começou a ser importado, usado para medir a abertura do jogo
+INICIO_IMPORTACAO = time.perf_counter()
+
 import pygame
 import sys
 import math
-
-# Inicializa o Pygame
-pygame.init()
+import json
+
+from partida import DIFICULDADES, FASES, MODOS, PASSOS_POR_SEGUNDO, SEM_ENTRADA, Entrada
+from composicao import CamadaTracado, Compositor, GraficoPerfil, PrevisaoTrajetoria
+from mira import deslocamento_alvo, solucao_velocidade_minima, velocidade_para_angulo, VELOCIDADE_MAXIMA
+from diagramacao import renderizar_paragrafo
+from cenas import Cena, PilhaCenas
+from perfil import perfilador
+from qualidade import governador
+from replay import Gravacao, nova_semente, salvar_nova_gravacao
+from recursos import SpritesRotacionados, TextoHUD, imagens, obter_fonte, obter_fonte_sistema, textos
 
 # Definir dimensões da tela
 largura = 1400
 altura = 800
-tela = pygame.display.set_mode((largura, altura))
-pygame.display.set_caption('Chairs!')
+# Janela do jogo, criada por `iniciar` (importar o módulo não abre a janela)
+tela = None
 
 # Cores
 BRANCO = (255, 255, 255)
@@ -20,61 +32,93 @@ PRETO = (0, 0, 0)
 VERDE = (0, 255, 0)
 ROXO = (166, 38, 166)
 
-# Fontes
-fonte1 = pygame.font.SysFont(None, 60)  
-fonte2 = pygame.font.SysFont("Cantarell", 72, bold=True)
-fonte3 = pygame.font.SysFont("Cantarell", 36, bold=True)
-fonte4 = pygame.font.SysFont(None, 62)
-fonte5 = pygame.font.SysFont(None, 20)
+# Fontes, criadas por `iniciar`
+fonte1 = fonte2 = fonte3 = fonte4 = fonte5 = None
+
+# Tempo (em ms) de cada etapa da abertura do jogo, medido por `iniciar` e `main`
+tempos_inicio = {}
 
 #seleções
 dificuldade = 1
 fases = 1
+modo = "normal"
+
+# Passo fixo da física: passos por segundo de jogo (pode ser maior que a taxa de quadros)
+passos_por_segundo = PASSOS_POR_SEGUNDO
+# Escala de tempo (menor que 1 para câmera lenta, maior que 1 para acelerar)
+escala_tempo = 1.0
+ESCALA_TEMPO_MIN = 0.125
+ESCALA_TEMPO_MAX = 8.0
+# Limites contra a espiral de quadros lentos: tempo real máximo considerado por
+# quadro (em ms) e número máximo de passos de física executados por quadro
+MAX_MS_POR_QUADRO = 250
+MAX_PASSOS_POR_QUADRO = 64
+
+# Perfilador de quadros: região do gráfico (F3) e arquivos criados ao exportar (F4)
+REGIAO_PERFIL = pygame.Rect(largura - 410, altura - 330, 400, 320)
+ARQUIVO_TRACO = "perfil_quadros.json"
+ARQUIVO_CSV_PERFIL = "perfil_quadros.csv"
+
+# Grava a entrada de cada partida em `replay.PASTA_GRAVACOES`, para reproduzi-la com `replay.py`;
+# desligado por padrão, ligado com "--gravar" na linha de comando
+GRAVAR_PARTIDAS = "--gravar" in sys.argv
+
+# Região da janela onde as janelas sobrepostas (seleção e ajuda) são desenhadas
+PAINEL_MODAL = pygame.Rect((largura - 600) // 2, 0, 600, 800)
 
 #---------------------------------------------------------------------------
 """
-    Atualiza a posição e a velocidade de um objeto considerando a resistência do ar.
-
-    1. Converte o ângulo de lançamento para radianos.
-    2. Calcula os componentes da velocidade inicial nos eixos X e Y.
-    3. Aplica as equações diferenciais com resistência proporcional à velocidade para calcular:
-       - Velocidades nos eixos X e Y após o tempo `t`.
-       - Novas posições nos eixos X e Y após o tempo `t`.
-    4. Retorna a posição e a velocidade atualizadas.
-
-    Parâmetros:
-        t (float): O tempo transcorrido desde o início do movimento.
-        angulo (float): O ângulo de lançamento em graus, medido em relação ao eixo X.
-        velocidade_inicial (float): A velocidade inicial do objeto no instante do lançamento.
-        posicao_inicial_x (float): A posição inicial do objeto no eixo X.
-        posicao_inicial_y (float): A posição inicial do objeto no eixo Y.
-        g (float): A aceleração gravitacional (em metros por segundo ao quadrado).
-        k (float): A constante de resistência do ar, proporcional à velocidade.
+    Inicializa o pygame e cria a janela e as fontes do jogo. Importar o módulo não tem esses
+    efeitos, de modo que ferramentas (como `benchmarks.py` e `replay.py`) podem importá-lo e
+    chamar esta função só quando precisam da janela.
+
+    1. Inicializa só os subsistemas usados pelo jogo (vídeo e fontes); áudio e joystick,
+       que `pygame.init` também abriria, não são usados.
+    2. Abre a janela de `largura` x `altura`.
+    3. Cria as fontes; os arquivos das fontes do sistema vêm do cache em disco
+       (`recursos.obter_fonte_sistema`), sem repetir a busca do fontconfig a cada abertura.
+    4. Guarda em `tempos_inicio` o tempo gasto na importação e em cada etapa.
+    5. Chamadas seguintes apenas retornam a janela já criada.
 
     Retorna:
-        tuple: Um par de tuplas contendo:
-            - A posição atual do objeto (x, y) no espaço.
-            - A velocidade atual do objeto (velocidade_x, velocidade_y).
+        pygame.Surface: A tela do jogo.
 """
-def atualizar_posicao_e_velocidade_com_resistencia(
-    t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k
-):
-    angulo_rad = math.radians(angulo)
-    
-    # Componentes da velocidade inicial
-    velocidade_inicial_x = velocidade_inicial * math.cos(angulo_rad)
-    velocidade_inicial_y = velocidade_inicial * math.sin(angulo_rad)
-    
-    # Calcula a nova velocidade com resistência
-    velocidade_x = velocidade_inicial_x * math.exp(-k * t)
-    velocidade_y = (velocidade_inicial_y - g / k) * math.exp(-k * t) + g / k
+def iniciar():
+    global tela, fonte1, fonte2, fonte3, fonte4, fonte5
+    if tela is not None:
+        return tela
 
-    # Calcula nova posição
-    x = posicao_inicial_x + (velocidade_inicial_x / k) * (1 - math.exp(-k * t))
-    y = posicao_inicial_y - ((1 / k) * (velocidade_inicial_y + g / k) * (1 - math.exp(-k * t)) - (g * t / k))
-    
-    return (x, y), (velocidade_x, velocidade_y)
+    marca = time.perf_counter()
+    tempos_inicio["importacao"] = (marca - INICIO_IMPORTACAO) * 1000
+
+    def medir(etapa):
+        nonlocal marca
+        agora = time.perf_counter()
+        tempos_inicio[etapa] = (agora - marca) * 1000
+        marca = agora
+
+    pygame.display.init()
+    pygame.font.init()
+    medir("subsistemas")
 
+    tela = pygame.display.set_mode((largura, altura))
+    pygame.display.set_caption('Chairs!')
+    medir("janela")
+
+    fonte1 = obter_fonte_sistema(None, 60)
+    fonte2 = obter_fonte_sistema("Cantarell", 72, negrito=True)
+    fonte3 = obter_fonte_sistema("Cantarell", 36, negrito=True)
+    fonte4 = obter_fonte_sistema(None, 62)
+    fonte5 = obter_fonte_sistema(None, 20)
+    medir("fontes")
+    return tela
+
+"""
+    Tempo desde a importação do módulo, em ms. Substitui `pygame.time.get_ticks`, que
+    depende do subsistema de tempo iniciado só por `pygame.init`.
+"""
+def obter_ticks():
+    return int((time.perf_counter() - INICIO_IMPORTACAO) * 1000)
 
 """
     Desenha um vetor representando a direção e magnitude da velocidade inicial de um objeto.
@@ -90,13 +134,16 @@ def atualizar_posicao_e_velocidade_com_resistencia(
         y (float): A posição inicial do vetor no eixo Y.
         angulo (float): O ângulo do vetor em graus, medido em relação ao eixo X.
         velocidade_inicial (float): A velocidade inicial do objeto, usada para determinar o comprimento do vetor (em unidades arbitrárias).
+
+    Retorna:
+        pygame.Rect: A região da tela ocupada pelo vetor.
 """
 def desenhar_vetor_direcao(x, y, angulo, velocidade_inicial):
     comprimento_vetor = velocidade_inicial * 0.5
     angulo_rad = math.radians(angulo)
     fim_vetor_x = x + comprimento_vetor * math.cos(angulo_rad)
     fim_vetor_y = y - comprimento_vetor * math.sin(angulo_rad)
-    pygame.draw.line(tela, ROXO, (int(x), int(y)), (int(fim_vetor_x), int(fim_vetor_y)), 3)
+    linha = pygame.draw.line(tela, ROXO, (int(x), int(y)), (int(fim_vetor_x), int(fim_vetor_y)), 3)
 
     comprimento_seta = 12
     angulo_seta = math.radians(25)
@@ -104,116 +151,32 @@ def desenhar_vetor_direcao(x, y, angulo, velocidade_inicial):
     ponta1_y = fim_vetor_y + comprimento_seta * math.sin(angulo_rad - angulo_seta)
     ponta2_x = fim_vetor_x - comprimento_seta * math.cos(angulo_rad + angulo_seta)
     ponta2_y = fim_vetor_y + comprimento_seta * math.sin(angulo_rad + angulo_seta)
-    pygame.draw.polygon(tela, ROXO, [(fim_vetor_x, fim_vetor_y), (ponta1_x, ponta1_y), (ponta2_x, ponta2_y)])
-
-"""
-    Verifica se ocorreu colisão entre dois objetos.
-
-    1. Calcula a distância entre os centros dos dois objetos.
-    2. Compara a distância com a soma dos raios dos dois objetos para determinar se há colisão.
-
-    Parâmetros:
-        x1 (float): Coordenada X do centro do primeiro objeto.
-        y1 (float): Coordenada Y do centro do primeiro objeto.
-        x2 (float): Coordenada X do centro do segundo objeto.
-        y2 (float): Coordenada Y do centro do segundo objeto.
-        raio_objeto1 (float): Raio do primeiro objeto.
-        raio_objeto2 (float): Raio do segundo objeto.
-
-    Retorna:
-        bool: `True` se os objetos estiverem colidindo (ou seja, a distância entre seus centros for menor ou igual à soma dos seus raios), caso contrário, `False`.
+    ponta = pygame.draw.polygon(tela, ROXO, [(fim_vetor_x, fim_vetor_y), (ponta1_x, ponta1_y), (ponta2_x, ponta2_y)])
+    return linha.union(ponta)
 
 """
-def verificar_colisao(x1, y1, x2, y2, raio_objeto1, raio_objeto2):
-    distancia = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-    return distancia <= (raio_objeto1 + raio_objeto2)
-
-"""
-    Reposiciona o alvo em uma nova posição aleatória dentro de uma área predefinida.
-
-    1. Gera uma nova coordenada X aleatória dentro do intervalo [600, largura - 200].
-    2. Gera uma nova coordenada Y aleatória dentro do intervalo [300, altura - 150].
-    3. Retorna as novas coordenadas.
+    Lê o estado atual das teclas usadas durante o jogo.
 
     Retorna:
-        tuple: Uma tupla contendo as novas coordenadas (x, y) do alvo.
-"""
-def reposicionar_marcal():
-    # Gera uma nova posição aleatória para o marcal
-    import random
-    novo_x = random.randint(600, largura - 200)
-    novo_y = random.randint(300, altura - 150)
-    return novo_x, novo_y
-
+        Entrada: O estado das teclas de ângulo, velocidade, lançamento (`K_RETURN`) e reinício (`K_SPACE`).
 """
-    Processa a entrada contínua do teclado para ajustar os parâmetros do lançamento e reiniciar o jogo.
-
-    1. Verifica o estado atual de todas as teclas pressionadas.
-    2. Ajusta o ângulo do lançamento com base nas teclas de direção para cima (`K_UP`) e para baixo (`K_DOWN`).
-    3. Ajusta a velocidade inicial com base nas teclas de direção para a direita (`K_RIGHT`) e para a esquerda (`K_LEFT`).
-    4. Marca o lançamento como ativado se a tecla `K_RETURN` for pressionada.
-    5. Define a intenção de reiniciar o jogo se a tecla `K_SPACE` for pressionada.
-    6. Limita o ângulo do lançamento ao intervalo [0, 90] graus.
-    7. Limita a velocidade inicial ao intervalo [0, 150].
-
-    Parâmetros:
-        sens_ang (float): A sensibilidade para ajustes no ângulo (incremento ou decremento por iteração).
-        sens_vel (float): A sensibilidade para ajustes na velocidade inicial (incremento ou decremento por iteração).
-        lancado (bool): Estado atual indicando se o lançamento já foi iniciado.
-        angulo (float): O ângulo atual do lançamento.
-        velocidade_inicial (float): A velocidade inicial atual do objeto.
-
-    Retorna:
-        tuple: Uma tupla contendo:
-            - angulo (float): O ângulo ajustado após o processamento.
-            - velocidade_inicial (float): A velocidade inicial ajustada após o processamento.
-            - lancado (bool): Estado atualizado indicando se o lançamento foi ativado.
-            - restart (bool): Indicação se o jogo deve ser reiniciado.
-"""
-def processar_entrada_continua(sens_ang, sens_vel, lancado, angulo, velocidade_inicial):
-    
-    # Obtém o estado atual de todas as teclas
+def ler_entrada():
     teclas = pygame.key.get_pressed()
-
-    #restart do jogo
-    restart = True
-
-    # Ajusta o ângulo
-    if teclas[pygame.K_UP]:
-        angulo += sens_ang
-    if teclas[pygame.K_DOWN]:
-        angulo -= sens_ang
-        
-    # Ajusta a velocidade
-    if teclas[pygame.K_RIGHT]:
-        velocidade_inicial += sens_vel
-    if teclas[pygame.K_LEFT]:
-        velocidade_inicial -= sens_vel
-
-    if teclas[pygame.K_RETURN]:
-        lancado = True;
-    if teclas[pygame.K_SPACE]:
-        restart = False
-    
-    # Limita o ângulo entre 0 e 90 graus
-    angulo = max(0, min(90, angulo))
-    # Limita a velocidade inicial entre 0 e 150
-    velocidade_inicial = max(0, min(600, velocidade_inicial))
-
-    return angulo, velocidade_inicial, lancado, restart
+    return Entrada(
+        teclas[pygame.K_UP], teclas[pygame.K_DOWN],
+        teclas[pygame.K_RIGHT], teclas[pygame.K_LEFT],
+        teclas[pygame.K_RETURN], teclas[pygame.K_SPACE]
+    )
 
 """
-    Exibe a tela de resultados ao final do jogo, com a pontuação final e a opção de reiniciar.
+    Desenha os textos da tela de resultados com a pontuação final e a opção de reiniciar.
 
-    1. Monitora eventos do Pygame para permitir o fechamento da janela ou reinício do jogo:
-        - Fecha o jogo se o evento de saída (`QUIT`) for detectado.
-        - Reinicia o jogo se a tecla `K_SPACE` for pressionada.
-    2. Exibe mensagens informando o estado do jogo, incluindo:
+    1. Exibe mensagens informando o estado do jogo, incluindo:
         - Uma mensagem de "Fim de Jogo".
         - A pontuação final do jogador.
         - Uma mensagem de desfecho indicando vitória ou derrota, dependendo se a pontuação alcançou ou superou a meta.
         - Uma instrução para pressionar a tecla `ESPAÇO` para reiniciar.
-    3. Centraliza e renderiza os textos na tela usando a fonte definida (`fonte1`) e cores específicas para cada mensagem.
+    2. Centraliza e renderiza os textos na tela usando a fonte definida (`fonte1`) e cores específicas para cada mensagem.
 
     Parâmetros:
         pontuacao (int): A pontuação final obtida pelo jogador.
@@ -222,38 +185,56 @@ def processar_entrada_continua(sens_ang, sens_vel, lancado, angulo, velocidade_i
     Retorna:
         None
 """
-def mostrar_resultados(pontuacao, meta):
-    while True:
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                return
-            if evento.type == pygame.KEYDOWN:
-                if evento.key == pygame.K_SPACE:  # Reinicia o jogo
-                    return
-        
-        # Mostrar textos
-        texto_fim = fonte1.render("FIM DE JOGO!", True, BRANCO)
-        texto_pontuacao_final = fonte1.render(f"Pontuação Final: {pontuacao}", True, BRANCO)
-        texto_reiniciar = fonte1.render("Pressione ESPAÇO para jogar novamente", True, BRANCO)
-        
-        if pontuacao >= meta:
-            texto_desfecho = fonte1.render("PARABENS! você venceu esta fase", True, VERDE)
-        else:
-            texto_desfecho = fonte1.render("Não foi dessa vez, tente novamente...", True, VERMELHO)
+def desenhar_resultados(pontuacao, meta):
+    texto_fim = textos.renderizar(fonte1, "FIM DE JOGO!", BRANCO)
+    texto_pontuacao_final = textos.renderizar(fonte1, f"Pontuação Final: {pontuacao}", BRANCO)
+    texto_reiniciar = textos.renderizar(fonte1, "Pressione ESPAÇO para jogar novamente", BRANCO)
 
-        tela.blit(texto_fim, (largura // 2 - texto_fim.get_width() // 2, altura // 2 + 150))
-        tela.blit(texto_desfecho, (largura // 2 - texto_desfecho.get_width() // 2, altura // 2 + 50))
-        tela.blit(texto_pontuacao_final, (largura // 2 - texto_pontuacao_final.get_width() // 2, altura // 2 - 50))
-        tela.blit(texto_reiniciar, (largura // 2 - texto_reiniciar.get_width() // 2, altura // 2 - 150))
+    if pontuacao >= meta:
+        texto_desfecho = textos.renderizar(fonte1, "PARABENS! você venceu esta fase", VERDE)
+    else:
+        texto_desfecho = textos.renderizar(fonte1, "Não foi dessa vez, tente novamente...", VERMELHO)
 
-        pygame.display.flip()
+    tela.blit(texto_fim, (largura // 2 - texto_fim.get_width() // 2, altura // 2 + 150))
+    tela.blit(texto_desfecho, (largura // 2 - texto_desfecho.get_width() // 2, altura // 2 + 50))
+    tela.blit(texto_pontuacao_final, (largura // 2 - texto_pontuacao_final.get_width() // 2, altura // 2 - 50))
+    tela.blit(texto_reiniciar, (largura // 2 - texto_reiniciar.get_width() // 2, altura // 2 - 150))
+
+"""
+    Tela de resultados exibida ao final do jogo.
+
+    1. Guarda uma cópia do último quadro da partida, desenhada por baixo dos textos
+       (`desenhar_resultados`).
+    2. Volta ao menu (desempilhando a cena) quando a tecla `K_SPACE` é pressionada ou
+       quando a janela é fechada.
+
+    Parâmetros:
+        pontuacao (int): A pontuação final obtida pelo jogador.
+        meta (int): A pontuação mínima necessária para vencer o jogo.
+"""
+class CenaResultados(Cena):
+    def __init__(self, pontuacao, meta):
+        super().__init__()
+        self.pontuacao = pontuacao
+        self.meta = meta
+        self.fundo = tela.copy()
+
+    def tratar_evento(self, evento):
+        if evento.type == pygame.QUIT:
+            self.pilha.desempilhar()
+        elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_SPACE:  # Reinicia o jogo
+            self.pilha.desempilhar()
+
+    def desenhar(self):
+        tela.blit(self.fundo, (0, 0))
+        desenhar_resultados(self.pontuacao, self.meta)
 
 #---------------------------------------------------------------------------
 
 """
     Desenha o menu principal na tela do jogo.
 
-    1. Carrega e redimensiona a imagem de fundo para se ajustar ao tamanho da tela.
+    1. Obtém do cache de imagens o fundo já convertido e redimensionado.
     2. Desenha o título do jogo no topo do menu.
     3. Cria botões interativos para diferentes opções, incluindo:
         - "Iniciar Jogo"
@@ -262,7 +243,7 @@ def mostrar_resultados(pontuacao, meta):
         - "Como Jogar"
         - "Sair"
     4. Centraliza os textos nos botões e os renderiza com bordas arredondadas.
-    5. Atualiza a tela para exibir o menu completo.
+    A tela é enviada para a janela pela pilha de cenas (`cenas.py`).
 
     Parâmetros:
         None
@@ -271,58 +252,62 @@ def mostrar_resultados(pontuacao, meta):
         None
 """
 def draw_menu():
-    planofundo = pygame.image.load("images/startmenu.webp")
-    planofundo = pygame.transform.scale(planofundo, (1600, 1200))
+    planofundo = imagens.obter("images/startmenu.webp", (1600, 1200), alpha=False)
     
     tela.blit(planofundo, (0, 0))
 
     # Desenhando o título
-    titulo = fonte2.render('Chairs: throw at Marçal', True, BRANCO)
+    titulo = textos.renderizar(fonte2, 'Chairs: throw at Marçal', BRANCO)
     tela.blit(titulo, (largura // 2 - titulo.get_width() // 2, 100))
 
     # Botão "Iniciar Jogo"
-    start_button = pygame.Rect(150, 250, 300, 50)
+    start_button = pygame.Rect(150, 230, 300, 50)
     pygame.draw.rect(tela, BRANCO, start_button, border_radius=20)
-    start_text = fonte3.render('Iniciar Jogo', True, PRETO)
+    start_text = textos.renderizar(fonte3, 'Iniciar Jogo', PRETO)
     
     tela.blit(start_text, (start_button.left + start_button.width//2 - start_text.get_width()//2,
     start_button.top+start_button.height//2 - start_text.get_height()//2))
 
     #Botão "Dificuldade"
-    dificult_button = pygame.Rect(150, 350, 300, 50)
+    dificult_button = pygame.Rect(150, 320, 300, 50)
     pygame.draw.rect(tela, BRANCO, dificult_button, border_radius=20)
-    dificult_text = fonte3.render('Dificuldade', True, PRETO)
+    dificult_text = textos.renderizar(fonte3, 'Dificuldade', PRETO)
 
     tela.blit(dificult_text,(dificult_button.left + dificult_button.width//2 - dificult_text.get_width()//2,
     dificult_button.top+dificult_button.height//2 - dificult_text.get_height()/2))
 
     #Botão "Fases"
-    fases_button = pygame.Rect(150, 450, 300, 50)
+    fases_button = pygame.Rect(150, 410, 300, 50)
     pygame.draw.rect(tela, BRANCO, fases_button, border_radius=20)
-    fases_text = fonte3.render('Selecionar fase', True, PRETO)
+    fases_text = textos.renderizar(fonte3, 'Selecionar fase', PRETO)
 
     tela.blit(fases_text,(fases_button.left + fases_button.width//2 - fases_text.get_width()//2,
     fases_button.top+fases_button.height//2 - fases_text.get_height()/2))
 
+    #Botão "Modo de jogo"
+    modo_button = pygame.Rect(150, 500, 300, 50)
+    pygame.draw.rect(tela, BRANCO, modo_button, border_radius=20)
+    modo_text = textos.renderizar(fonte3, 'Modo de jogo', PRETO)
+
+    tela.blit(modo_text,(modo_button.left + modo_button.width//2 - modo_text.get_width()//2,
+    modo_button.top+modo_button.height//2 - modo_text.get_height()/2))
+
     #Botão "Como Jogar"
-    htp_button = pygame.Rect(150, 550, 300, 50)
+    htp_button = pygame.Rect(150, 590, 300, 50)
     pygame.draw.rect(tela, BRANCO, htp_button, border_radius=20)
-    htp_text = fonte3.render('Como jogar', True, PRETO)
+    htp_text = textos.renderizar(fonte3, 'Como jogar', PRETO)
 
     tela.blit(htp_text,(htp_button.left + htp_button.width//2 - htp_text.get_width()//2,
     htp_button.top+htp_button.height//2 - htp_text.get_height()/2))
 
     # Botão "Sair"
-    exit_button = pygame.Rect(150, 650, 300, 50)
+    exit_button = pygame.Rect(150, 680, 300, 50)
     pygame.draw.rect(tela, BRANCO, exit_button, border_radius=20)
-    exit_text = fonte3.render('Sair', True, PRETO)
+    exit_text = textos.renderizar(fonte3, 'Sair', PRETO)
 
     tela.blit(exit_text, (exit_button.left + exit_button.width//2 - exit_text.get_width()//2,
     exit_button.top+exit_button.height//2 - exit_text.get_height()//2))
 
-
-    pygame.display.update()
-
 """
     Gera e desenha um botão com o texto fornecido na tela.
 
@@ -339,188 +324,249 @@ def draw_menu():
 def gerar_btn():
     dificult_button = pygame.Rect(150, 350, 300, 50)
     pygame.draw.rect(tela, BRANCO, dificult_button, border_radius=20)
-    dificult_text = fonte3.render('texto', True, PRETO)
+    dificult_text = textos.renderizar(fonte3, 'texto', PRETO)
 
     tela.blit(dificult_text,(dificult_button.left + dificult_button.width//2 - dificult_text.get_width()//2,
     dificult_button.top+dificult_button.height//2 - dificult_text.get_height()/2))
 
 """
-    Exibe uma janela para alterar parâmetros de dificuldade ou fase do jogo.
+    Lista as imagens que `CenaJogo` carrega para uma seleção de dificuldade, fase e modo,
+    no formato de `CacheImagens.antecipar`. O fundo da fase, a imagem mais cara de
+    decodificar, vem primeiro.
+
+    Parâmetros:
+        dificuldade (int): A dificuldade selecionada.
+        fases (int): A fase selecionada.
+        modo (str): O modo de jogo selecionado.
+
+    Retorna:
+        list: Tuplas (caminho, tamanho, alpha).
+"""
+def imagens_da_partida(dificuldade, fases, modo):
+    tamanho_marcal = DIFICULDADES[dificuldade]["tamanho_marcal"]
+    pedidos = [
+        (FASES[fases]["fundo"], (1400, 800), False),
+        ("images/cadeira.png", (150, 150), True),
+        ("images/marcal.png", (tamanho_marcal, tamanho_marcal), True),
+        ("images/quadrado.png", (7, 7), True),
+        ("images/air_resistence.png", (50, 50), True),
+        ("images/grav.png", (50, 50), True),
+    ]
+    if modo == "rajada":
+        from rajada import TAMANHO_CADEIRA_RAJADA
+        pedidos.append(("images/cadeira.png", (TAMANHO_CADEIRA_RAJADA, TAMANHO_CADEIRA_RAJADA), True))
+    elif modo == "alvos":
+        from alvos import PROPORCAO_TAMANHO_ALVO
+        tamanho_alvo = int(tamanho_marcal * PROPORCAO_TAMANHO_ALVO)
+        pedidos.append(("images/marcal.png", (tamanho_alvo, tamanho_alvo), True))
+    return pedidos
 
-    1. Cria uma nova janela temporária de 600x800 pixels.
+"""
+    Menu principal, a cena na base da pilha.
+
+    1. Desenha o menu com `draw_menu` e restaura o título da janela sempre que volta ao topo.
+       Depois de desenhar o menu ao voltar ao topo (na abertura e depois de cada seleção),
+       pede o carregamento em segundo plano das imagens da partida selecionada
+       (`imagens_da_partida`), que ficam prontas enquanto o menu está parado; uma nova
+       seleção cancela o pedido anterior.
+    2. Realiza a ação correspondente ao botão clicado:
+        - Empilha a partida (`CenaJogo`).
+        - Encerra o programa, esvaziando a pilha (o mesmo ao fechar a janela).
+        - Empilha a janela de ajuda (`CenaAjuda`).
+        - Empilha a seleção de dificuldade, de fase ou de modo de jogo (`CenaSelecao`).
+"""
+class CenaMenu(Cena):
+    def __init__(self):
+        super().__init__()
+        self.start_button = pygame.Rect(150, 230, 300, 50)
+        self.exit_button = pygame.Rect(150, 680, 300, 50)
+        self.htp_button = pygame.Rect(150, 590, 300, 50)
+        self.dificult_button = pygame.Rect(150, 320, 300, 50)
+        self.fases_button = pygame.Rect(150, 410, 300, 50)
+        self.modo_button = pygame.Rect(150, 500, 300, 50)
+        self.antecipar_partida = False
+
+    def entrar(self):
+        pygame.display.set_caption('Chairs!')
+        self.antecipar_partida = True
+
+    def tratar_evento(self, evento):
+        if evento.type == pygame.QUIT:
+            self.pilha.limpar()
+        elif evento.type == pygame.MOUSEBUTTONDOWN:
+            if self.start_button.collidepoint(evento.pos):
+                self.pilha.empilhar(CenaJogo())
+            elif self.exit_button.collidepoint(evento.pos):
+                self.pilha.limpar()
+            elif self.htp_button.collidepoint(evento.pos):
+                self.pilha.empilhar(CenaAjuda())
+            elif self.dificult_button.collidepoint(evento.pos):
+                self.pilha.empilhar(CenaSelecao("dificuldade"))
+            elif self.fases_button.collidepoint(evento.pos):
+                self.pilha.empilhar(CenaSelecao("fases"))
+            elif self.modo_button.collidepoint(evento.pos):
+                self.pilha.empilhar(CenaSelecao("modo"))
+
+    def desenhar(self):
+        draw_menu()
+        # O pedido é feito depois de desenhar, para não disputar o processador com o quadro
+        if self.antecipar_partida:
+            self.antecipar_partida = False
+            imagens.antecipar(imagens_da_partida(dificuldade, fases, modo))
+
+"""
+    Janela para alterar parâmetros de dificuldade, fase ou modo do jogo.
+
+    1. É desenhada como um painel de 600x800 pixels (`PAINEL_MODAL`) sobre o menu, na
+       mesma janela, sem recriá-la.
     2. Define o título da janela com base no parâmetro fornecido:
         - "Selecione a dificuldade" se o parâmetro for "dificuldade".
+        - "Selecione o modo de jogo" se o parâmetro for "modo".
         - "Selecione a fase" caso contrário.
     3. Exibe botões interativos com as opções correspondentes ao parâmetro:
         - Para "dificuldade": "Fácil", "Médio", "Difícil".
         - Para "fase": "Terra", "Lua", "Marte".
-    4. Detecta cliques nos botões e altera o valor global das variáveis `dificuldade` ou `fases`.
-    5. Após selecionar uma opção, retorna à janela principal do jogo.
+        - Para "modo": "Normal", "Rajada", "Vários alvos" (na ordem de `partida.MODOS`).
+    4. Detecta cliques nos botões (com a posição convertida para o painel) e altera o valor
+       global das variáveis `dificuldade`, `fases` ou `modo`.
+    5. Após selecionar uma opção, ou ao fechar a janela, volta ao menu.
 
     Parâmetros:
         parametro (str): Define o tipo de ajuste a ser feito. Pode ser:
             - "dificuldade": Exibe opções para alterar a dificuldade do jogo.
+            - "modo": Exibe opções para alterar o modo de jogo.
             - Outro valor: Exibe opções para alterar a fase do jogo.
-
-    Retorna:
-        None
 """
-def mudar_parametro(parametro):
-    nova_janela = pygame.display.set_mode((600, 800))
-
-    if parametro == "dificuldade":
-        pygame.display.set_caption("Selecione a dificuldade")
-    else:
-        pygame.display.set_caption("Selecione a fase")
-    
-    cadeado = True
-    while cadeado:
-        
-        global fases, dificuldade
-        clicado = False
-        nova_janela.fill(AZUL_ESCURO)
-
-        b1 = pygame.Rect(150, 200, 300, 100)
-        pygame.draw.rect(nova_janela, BRANCO, b1, border_radius=20)
-        b2 = pygame.Rect(150, 400, 300, 100)
-        pygame.draw.rect(nova_janela, BRANCO, b2, border_radius=20)
-        b3 = pygame.Rect(150, 600, 300, 100)
-        pygame.draw.rect(nova_janela, BRANCO, b3, border_radius=20)
-        if parametro == "dificuldade":
-            b1_text = fonte3.render('Fácil', True, PRETO)
-            b2_text = fonte3.render('Médio', True, PRETO)
-            b3_text = fonte3.render('Difícil', True, PRETO)
-
+class CenaSelecao(Cena):
+    sobreposicao = True
+
+    def __init__(self, parametro):
+        super().__init__()
+        self.parametro = parametro
+        self.painel = tela.subsurface(PAINEL_MODAL)
+        self.botoes = [pygame.Rect(150, 200, 300, 100),
+                       pygame.Rect(150, 400, 300, 100),
+                       pygame.Rect(150, 600, 300, 100)]
+
+    def entrar(self):
+        if self.parametro == "dificuldade":
+            pygame.display.set_caption("Selecione a dificuldade")
+        elif self.parametro == "modo":
+            pygame.display.set_caption("Selecione o modo de jogo")
         else:
-            b1_text = fonte3.render('Terra', True, PRETO)
-            b2_text = fonte3.render('Lua', True, PRETO)
-            b3_text = fonte3.render('Marte', True, PRETO)
-        
-        nova_janela.blit(b1_text, (b1.left + b1.width//2 - b1_text.get_width()//2, b1.top+b1.height//2 - b1_text.get_height()/2))
-        nova_janela.blit(b2_text, (b2.left + b2.width//2 - b2_text.get_width()//2, b2.top+b2.height//2 - b2_text.get_height()/2))
-        nova_janela.blit(b3_text, (b3.left + b3.width//2 - b3_text.get_width()//2, b3.top+b3.height//2 - b3_text.get_height()/2))
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                cadeado = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and not clicado:
-                if b1.collidepoint(event.pos):
-                    clicado = True
-                    if parametro == "dificuldade":
-                        dificuldade = 1
-                    else:
-                        fases = 1
-                    cadeado = False
-                elif b2.collidepoint(event.pos) and not clicado:
-                    clicado = True
-                    if parametro == "dificuldade":
-                        dificuldade = 2
+            pygame.display.set_caption("Selecione a fase")
+
+    """
+        Os nomes das opções exibidas, um por botão.
+    """
+    def nomes(self):
+        if self.parametro == "dificuldade":
+            return ('Fácil', 'Médio', 'Difícil')
+        if self.parametro == "modo":
+            return ('Normal', 'Rajada', 'Vários alvos')
+        return ('Terra', 'Lua', 'Marte')
+
+    def tratar_evento(self, evento):
+        global fases, dificuldade, modo
+        if evento.type == pygame.QUIT:
+            self.pilha.desempilhar()
+        elif evento.type == pygame.MOUSEBUTTONDOWN:
+            posicao = (evento.pos[0] - PAINEL_MODAL.x, evento.pos[1] - PAINEL_MODAL.y)
+            for valor, botao in enumerate(self.botoes[:len(self.nomes())], start=1):
+                if botao.collidepoint(posicao):
+                    if self.parametro == "dificuldade":
+                        dificuldade = valor
+                    elif self.parametro == "modo":
+                        modo = MODOS[valor - 1]
                     else:
-                        fases = 2
-                    cadeado = False
-                elif b3.collidepoint(event.pos) and not clicado:
-                    clicado = True
-                    if parametro == "dificuldade":
-                        dificuldade = 3
-                    else:
-                        fases = 3
-                    cadeado = False
-            elif event.type == pygame.MOUSEBUTTONUP and clicado:
-                clicado = False
-
-        pygame.display.flip()
+                        fases = valor
+                    self.pilha.desempilhar()
+                    break
 
-    # Retorna para a janela principal
-    tela = pygame.display.set_mode((largura, altura))
-    pygame.display.set_caption('Chairs!')
-    draw_menu()
+    def desenhar(self):
+        self.painel.fill(AZUL_ESCURO)
 
+        for botao, nome in zip(self.botoes, self.nomes()):
+            pygame.draw.rect(self.painel, BRANCO, botao, border_radius=20)
+            texto = textos.renderizar(fonte3, nome, PRETO)
+            self.painel.blit(texto, (botao.left + botao.width//2 - texto.get_width()//2, botao.top+botao.height//2 - texto.get_height()/2))
 
 """
-    Função que exibe uma janela pop-up com as instruções de como jogar o jogo "Chairs: Throw at Marçal". 
+    Janela com as instruções de como jogar o jogo "Chairs: Throw at Marçal".
 
     Descrição:
-        O pop-up fornece detalhes sobre os controles e o objetivo do jogo, permitindo que o jogador entenda como interagir com o jogo. A função fica em execução até que o jogador feche a janela de instruções, momento em que retorna ao menu principal.
-        1. A função cria uma nova janela (600x800 pixels) para exibir as instruções.
-        2. A janela contém um texto detalhado sobre como jogar, incluindo os controles e o objetivo.
-        3. O texto é quebrado em várias linhas para garantir que se ajuste à largura da janela.
-        5. Ao fechar a janela, o jogo retorna ao menu principal, restaurando a janela original.
-
-    Parâmetros:
-        None
-
-    Retorno:
-        None
-
+        O pop-up fornece detalhes sobre os controles e o objetivo do jogo, permitindo que o jogador entenda como interagir com o jogo. A janela fica aberta até que o jogador a feche (`ESC`), momento em que o menu principal volta ao topo.
+        1. As instruções são desenhadas em um painel de 600x800 pixels (`PAINEL_MODAL`) sobre o menu, na mesma janela.
+        2. O painel contém um texto detalhado sobre como jogar, incluindo os controles e o objetivo.
+        3. O texto é quebrado em várias linhas para garantir que se ajuste à largura do painel;
+           as quebras são medidas com `Font.size` e cada parágrafo é renderizado uma única vez
+           (`renderizar_paragrafo`), sendo reaproveitado nas aberturas seguintes.
+        4. Ao fechar a janela, o jogo retorna ao menu principal.
 """
-def abrir_pop_up():
-    # Criar a nova janela
-    nova_janela = pygame.display.set_mode((600, 800))
-    pygame.display.set_caption("Como Jogar - Chairs: Throw at Marçal")
-    
+class CenaAjuda(Cena):
+    sobreposicao = True
+
     # Definir cores
     COR_FUNDO = AZUL_ESCURO
     COR_TITULO = (255, 215, 0)  # Amarelo dourado para destaque
     COR_TEXTO = BRANCO
     COR_SECAO = (255, 165, 0)  # Laranja para seções
-    
-    # Definir fontes com tamanhos diferentes
-    fonte_titulo = pygame.font.Font(None, 48)
-    fonte_secao = pygame.font.Font(None, 36)
-    fonte_texto = pygame.font.Font(None, 28)
-    
+
+    def __init__(self):
+        super().__init__()
+        self.painel = tela.subsurface(PAINEL_MODAL)
+
+        # Definir fontes com tamanhos diferentes
+        self.fonte_titulo = obter_fonte(None, 48)
+        self.fonte_secao = obter_fonte(None, 36)
+        self.fonte_texto = obter_fonte(None, 28)
+
+    def entrar(self):
+        pygame.display.set_caption("Como Jogar - Chairs: Throw at Marçal")
+
+    def tratar_evento(self, evento):
+        if evento.type == pygame.QUIT:
+            self.pilha.desempilhar()
+        elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
+            self.pilha.desempilhar()
+
+    @staticmethod
     def render_texto_centralizado(superficie, texto, fonte, cor, y_pos, largura_max):
-        texto_surface = fonte.render(texto, True, cor)
+        texto_surface = textos.renderizar(fonte, texto, cor)
         texto_rect = texto_surface.get_rect(centerx=superficie.get_rect().centerx, top=y_pos)
         superficie.blit(texto_surface, texto_rect)
         return texto_rect.bottom
-    
+
+    # Cada parágrafo é quebrado e renderizado uma única vez (`diagramacao.py`)
+    @staticmethod
     def render_texto_justificado(superficie, texto, fonte, cor, pos_inicial, largura_max):
-        palavras = texto.split()
-        linhas = []
-        linha_atual = []
-        for palavra in palavras:
-            teste_linha = ' '.join(linha_atual + [palavra])
-            teste_surface = fonte.render(teste_linha, True, cor)
-            if teste_surface.get_width() <= largura_max:
-                linha_atual.append(palavra)
-            else:
-                linhas.append(' '.join(linha_atual))
-                linha_atual = [palavra]
-        
-        if linha_atual:
-            linhas.append(' '.join(linha_atual))
-        
-        y_offset = pos_inicial[1]
-        for linha in linhas:
-            texto_surface = fonte.render(linha, True, cor)
-            texto_rect = texto_surface.get_rect(centerx=superficie.get_rect().centerx, top=y_offset)
-            superficie.blit(texto_surface, texto_rect)
-            y_offset += fonte.get_height() + 5
-        
-        return y_offset
-    
-    cadeado = True
-    while cadeado:
+        paragrafo = renderizar_paragrafo(texto, fonte, cor, largura_max)
+        texto_rect = paragrafo.get_rect(centerx=superficie.get_rect().centerx, top=pos_inicial[1])
+        superficie.blit(paragrafo, texto_rect)
+        return texto_rect.bottom
+
+    def desenhar(self):
+        painel = self.painel
+
         # Preencher o fundo
-        nova_janela.fill(COR_FUNDO)
-        
+        painel.fill(self.COR_FUNDO)
+
         # Renderizar título
         y_pos = 50
-        y_pos = render_texto_centralizado(nova_janela, "Chairs: Throw at Marçal", fonte_titulo, COR_TITULO, y_pos, 500)
+        y_pos = self.render_texto_centralizado(painel, "Chairs: Throw at Marçal", self.fonte_titulo, self.COR_TITULO, y_pos, 500)
         y_pos += 30  # Espaço após o título
-        
+
         # Renderizar seções
-        y_pos = render_texto_centralizado(nova_janela, "Objetivo", fonte_secao, COR_SECAO, y_pos, 500)
+        y_pos = self.render_texto_centralizado(painel, "Objetivo", self.fonte_secao, self.COR_SECAO, y_pos, 500)
         y_pos += 20
-        y_pos = render_texto_justificado(nova_janela, 
-            "Seu objetivo é acertar o Marçal o máximo de vezes possível antes que o tempo acabe. Alcance a pontuação meta para vencer o jogo!", 
-            fonte_texto, COR_TEXTO, (50, y_pos), 500)
-        
+        y_pos = self.render_texto_justificado(painel,
+            "Seu objetivo é acertar o Marçal o máximo de vezes possível antes que o tempo acabe. Alcance a pontuação meta para vencer o jogo!",
+            self.fonte_texto, self.COR_TEXTO, (50, y_pos), 500)
+
         y_pos += 30
-        y_pos = render_texto_centralizado(nova_janela, "Controles", fonte_secao, COR_SECAO, y_pos, 500)
+        y_pos = self.render_texto_centralizado(painel, "Controles", self.fonte_secao, self.COR_SECAO, y_pos, 500)
         y_pos += 20
-        
+
         # Lista de controles com ícones ou marcadores
         controles = [
             "Seta para Cima: Aumentar ângulo",
@@ -529,264 +575,408 @@ def abrir_pop_up():
             "Seta para a Esquerda: Diminuir velocidade",
             "Espaço: Lançar cadeira"
         ]
-        
+
         for controle in controles:
-            y_pos = render_texto_justificado(nova_janela, controle, fonte_texto, COR_TEXTO, (50, y_pos), 500)
+            y_pos = self.render_texto_justificado(painel, controle, self.fonte_texto, self.COR_TEXTO, (50, y_pos), 500)
             y_pos += 10
-        
+
         # Mensagem de rodapé
         y_pos += 30
-        render_texto_centralizado(nova_janela, "Boa sorte! O Marçal está esperando...", fonte_texto, COR_SECAO, y_pos, 500)
-        
-        # Manipulação de eventos
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                cadeado = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    cadeado = False
-        
-        # Atualizar a tela
-        pygame.display.flip()
-    
-    # Retornar para a janela principal
-    tela = pygame.display.set_mode((largura, altura))
-    pygame.display.set_caption('Chairs!')
-    draw_menu()
+        self.render_texto_centralizado(painel, "Boa sorte! O Marçal está esperando...", self.fonte_texto, self.COR_SECAO, y_pos, 500)
 
 """
-    Inicia o jogo, gerenciando a física do lançamento, a interação do jogador, e os elementos visuais.
+    A partida em andamento, gerenciando a física do lançamento, a interação do jogador, e os elementos visuais.
 
     1. Configuração inicial:
-        - Define variáveis de física como gravidade (g), resistência do ar (k), e tempo total do jogo.
-        - Ajusta os parâmetros de acordo com a dificuldade e a fase selecionadas.
+        - Cria a `Partida` com a dificuldade e a fase selecionadas, que define gravidade (g),
+          resistência do ar (k), tempo total e meta de pontos.
 
     2. Elementos gráficos:
-        - Configura imagens de fundo, projétil (cadeira), alvo (Marçal), e ícones informativos.
+        - Obtém do cache (`recursos.imagens`) as imagens de fundo, projétil (cadeira), alvo (Marçal)
+          e ícones informativos, já convertidas e redimensionadas.
         - Renderiza informações na tela, incluindo ângulo, velocidade, pontuação, tempo restante, e meta de pontos.
 
     3. Interatividade:
-        - Detecta e processa entradas do jogador para alterar ângulo e velocidade antes do lançamento.
-        - Atualiza a posição do projétil após o lançamento, considerando resistência do ar e gravidade.
-        - Detecta colisões com o alvo (marçal), atualizando a pontuação e reposicionando o alvo.
+        - Lê as teclas a cada quadro e as repassa para `Partida.avancar`, que aplica as mesmas
+          regras usadas pela simulação sem janela (`simulacao.py`): ajuste de ângulo e velocidade,
+          física do lançamento, colisão com o alvo (marçal), pontuação e reposicionamento.
+        - A física avança em passos fixos: o tempo real de cada quadro (multiplicado pela
+          `escala_tempo`) é acumulado e consumido em quantos passos couberem, de modo que
+          quadros lentos não mudam a jogabilidade. A cadeira é desenhada interpolando entre
+          os dois últimos estados da física.
+        - `PageUp` e `PageDown` dobram ou reduzem à metade a escala de tempo e `Home` a restaura.
+        - `F3` liga ou desliga o perfilador de quadros (`perfil.py`) e seu gráfico, com o tempo
+          de cada etapa do quadro (eventos, entrada, física, colisão, traçado, textos, desenho,
+          envio para a janela e espera) e os percentis p50/p95/p99. `F4` exporta os quadros
+          medidos em formato de traço do Chrome e em CSV.
+
+    4. Modo rajada:
+        - Com `modo` igual a "rajada", a partida é uma `rajada.PartidaRajada`: a cadeira de mira
+          fica parada e, enquanto a tecla de lançar está pressionada, dispara várias cadeiras
+          menores, guardadas em arrays do NumPy e atualizadas em lote a cada passo.
+        - Todas as cadeiras no ar são desenhadas com uma única chamada a `Surface.blits`, a
+          partir de um sprite com cor transparente (`rajada.preparar_sprite`), e a interface
+          mostra quantas estão no ar.
+        - Com `modo` igual a "alvos", a partida é uma `alvos.PartidaAlvos`: dezenas a centenas
+          de alvos menores se movem pela tela no lugar do Marçal, cada um desenhado como uma
+          região alterada do `Compositor`.
+
+    5. Gravação e reprodução:
+        - A entrada de cada passo é registrada em uma `replay.Gravacao`, junto com a semente do
+          gerador que reposiciona o Marçal, a dificuldade, a fase e o modo; ao final, a gravação é salva
+          (se `GRAVAR_PARTIDAS`, isto é, com "--gravar" na linha de comando).
+        - Com `reproducao`, a partida é recriada a partir de uma gravação e a entrada de cada
+          passo vem dela, em vez do teclado.
+
+    6. Condições de término:
+        - A partida reinicia o projétil quando ele sai da tela.
+        - Quando o tempo acaba (ou a janela é fechada), troca a cena pela tela de resultados (`CenaResultados`).
+
+    7. Sistema de desenho:
+        - Monta uma vez a camada estática (fundo, ícones e textos fixos) no `Compositor`.
+        - Carimba a trajetória do projétil uma única vez na camada do traçado (`CamadaTracado`).
+        - Durante o voo, desenha a cadeira girada na direção da velocidade, a partir de versões
+          pré-rotacionadas (`recursos.SpritesRotacionados`).
+        - Durante a mira, mostra a trajetória prevista (`PrevisaoTrajetoria`) como uma única linha
+          e, na dificuldade Fácil, uma dica com a velocidade que acerta o alvo (`dica_de_mira`)
+          e, se o atlas da fase foi construído (`atlas.py`), o intervalo de velocidades que acerta.
+        - Redesenha a cada quadro apenas os objetos móveis e os textos que mudaram,
+          enviando só essas regiões para a janela.
+        - A pilha de cenas (`cenas.py`) limita a taxa de quadros a 60 por segundo.
+        - O governador de qualidade (`qualidade.py`) mede o tempo de trabalho de cada quadro
+          e, quando falta folga no orçamento de 60 quadros por segundo, reduz a densidade do
+          traçado, o antialiasing dos textos, os pontos da previsão e a rotação da cadeira
+          (`aplicar_qualidade`); com folga de sobra por alguns segundos, volta a aumentá-los.
+
+    Parâmetros:
+        reproducao (Gravacao): Uma gravação a ser reproduzida, ou None para jogar com o teclado.
+"""
+class CenaJogo(Cena):
+    animada = True
+    # Versões rotacionadas da cadeira, geradas na primeira partida e reaproveitadas nas seguintes
+    cadeira_rotacionada = None
+
+    def __init__(self, reproducao=None):
+        super().__init__()
+        # Estado e regras da partida (física, pontuação, tempo e reposicionamento do alvo),
+        # criada a partir da gravação para que a mesma semente e a mesma entrada a reproduzam
+        if reproducao is None:
+            self.gravacao = Gravacao(dificuldade, fases, nova_semente(), passos_por_segundo, largura, altura, modo)
+            self.entradas = None
+            partida = self.gravacao.criar_partida()
+        else:
+            self.gravacao = None
+            self.entradas = reproducao.entradas()
+            partida = reproducao.criar_partida()
+        self.partida = partida
+        self.modo = (reproducao or self.gravacao).modo
+        self.rajada = self.modo == "rajada"
+        g, k = partida.g, partida.k
+
+        # Prepara a imagem da cadeira
+        self.cadeira = imagens.obter("images/cadeira.png", (150, 150))
+        self.boneco_largura, self.boneco_altura = self.cadeira.get_size()
+
+        # Durante o voo, a cadeira aponta na direção da velocidade; as versões rotacionadas
+        # (a cada 2°) são geradas na primeira vez que cada direção aparece, sem atrasar o
+        # início da partida
+        if CenaJogo.cadeira_rotacionada is None:
+            CenaJogo.cadeira_rotacionada = SpritesRotacionados(self.cadeira)
+
+        # No modo rajada, prepara o sprite das cadeiras em lote (o NumPy só é importado nesse modo)
+        if self.rajada:
+            from rajada import TAMANHO_CADEIRA_RAJADA, preparar_sprite
+            self.sprite_rajada = preparar_sprite(
+                imagens.obter("images/cadeira.png", (TAMANHO_CADEIRA_RAJADA, TAMANHO_CADEIRA_RAJADA))
+            )
+
+        # Prepara a imagem e caracteristicas do marcal
+        self.marcal = imagens.obter("images/marcal.png", (partida.tamanho_marcal, partida.tamanho_marcal))
+        if self.modo == "alvos":
+            self.alvo = imagens.obter("images/marcal.png", (partida.tamanho_alvo, partida.tamanho_alvo))
+
+        tracado = imagens.obter("images/quadrado.png", (7, 7))
+
+        # Sistema de tempo: acumulador do passo fixo (em segundos de jogo)
+        self.tempo_anterior = obter_ticks()
+        self.acumulador = 0.0
+
+        # Prepara o plano de fundo
+        fundo_img = imagens.obter(FASES[partida.fases]["fundo"], (1400, 800), alpha=False)
+
+        #prepara o icone da resistencia do ar
+        air_rest_icon = imagens.obter("images/air_resistence.png", (50, 50))
+
+        #prepara o icone da gravidade
+        grav_icon = imagens.obter("images/grav.png", (50, 50))
+
+        # Textos da interface, criados uma vez e renderizados novamente só quando mudam
+        fonte_hud = obter_fonte(None, 36)
+        self.texto_angulo = TextoHUD(fonte_hud, BRANCO, (10, 10))
+        self.texto_velocidade = TextoHUD(fonte_hud, BRANCO, (10, 50))
+        self.texto_pontuacao = TextoHUD(fonte_hud, VERDE, (10, 90))
+        self.texto_tempo = TextoHUD(fonte_hud, VERMELHO, (10, 130))
+        self.texto_escala = TextoHUD(fonte_hud, ROXO, (10, 210))
+        self.texto_dica = TextoHUD(fonte_hud, BRANCO, (10, 250))
+        # Atlas de acerto usado na dica (só existe depois de `python atlas.py`; é mapeado do disco).
+        # As janelas do atlas valem para a cadeira de 150 px; no modo rajada, cujas cadeiras são
+        # menores (e o raio de contato também), a dica fica sem o intervalo
+        self.atlas = None
+        if partida.dificuldade == 1 and self.modo == "normal":
+            from atlas import carregar_atlas
+            self.atlas = carregar_atlas(partida.fases, partida.tamanho_marcal)
+        self.texto_rajada = TextoHUD(fonte_hud, BRANCO, (10, 290))
+        texto_meta = TextoHUD(fonte_hud, AZUL, (10, 170), f"Meta de pontos: {partida.meta_pontuacao} pontos")
+        texto_grav = TextoHUD(fonte4, BRANCO, (1170, 25), f"{g} m/s")
+        texto_air_rest = TextoHUD(fonte4, BRANCO, (910, 25), "0" if k == 0.00001 else f"{k}")
+
+        # Traçado carimbado uma única vez em uma camada persistente
+        self.camada_tracado = CamadaTracado((largura, altura), tracado)
+
+        # Previsão da trajetória durante a mira, partindo do mesmo ponto da cadeira que o traçado
+        self.previsao = PrevisaoTrajetoria(
+            g, k, partida.arrasto,
+            (partida.posicao_inicial_x + self.boneco_largura * 0.1, partida.posicao_inicial_y + self.boneco_altura // 2),
+            (largura, altura), BRANCO
+        )
+
+        # Camada estática (fundo, ícones e textos fixos) montada uma vez; o restante
+        # é desenhado por cima e só as regiões alteradas são enviadas para a janela
+        self.compositor = Compositor(tela)
+        self.compositor.preparar(
+            fundo_img,
+            fixos=[(air_rest_icon, (830, 20)), (grav_icon, (1100, 20)),
+                   (texto_meta.superficie, texto_meta.posicao),
+                   (texto_air_rest.superficie, texto_air_rest.posicao),
+                   (texto_grav.superficie, texto_grav.posicao)],
+            sobreposicoes=[self.texto_angulo, self.texto_velocidade, self.texto_pontuacao,
+                           self.texto_tempo, self.texto_escala, self.texto_dica, self.texto_rajada],
+            camadas=[self.camada_tracado.superficie],
+        )
+
+        # Estado anterior ao último passo, usado para interpolar a posição desenhada
+        self.anterior_x, self.anterior_y = partida.posicao_x, partida.posicao_y
+        self.voo_anterior = None
+
+        # Gráfico do perfilador, exibido enquanto ele está ligado
+        self.grafico_perfil = GraficoPerfil(perfilador, obter_fonte(None, 20), REGIAO_PERFIL)
+
+        # Qualidade atual do governador (traçado, textos, previsão e cadeira girada)
+        self.inicio_quadro = time.perf_counter()
+        self.aplicar_qualidade()
+
+    """
+        Aplica a configuração do nível atual do governador de qualidade (`qualidade.py`).
+    """
+    def aplicar_qualidade(self):
+        configuracao = governador.configuracao
+        self.camada_tracado.intervalo = configuracao["intervalo_tracado"]
+        for texto in self.compositor.sobreposicoes:
+            texto.definir_suavizado(configuracao["texto_suavizado"])
+        self.previsao.definir_quantidade(configuracao["pontos_previsao"])
+        self.cadeira_girada = configuracao["cadeira_girada"]
+
+    """
+        Recomeça a contagem do tempo real e redesenha a janela inteira ao assumir o topo.
+    """
+    def entrar(self):
+        self.tempo_anterior = obter_ticks()
+        self.compositor.invalidar()
+        perfilador.iniciar_quadro()
+        governador.reiniciar_janela()
+
+    def invalidar(self):
+        self.compositor.invalidar()
+
+    def tratar_evento(self, evento):
+        global escala_tempo
+        if evento.type == pygame.QUIT: #fechar jogo
+            self.encerrar()
+        elif evento.type == pygame.KEYDOWN:
+            # Câmera lenta e avanço rápido
+            if evento.key == pygame.K_PAGEUP:
+                escala_tempo = min(ESCALA_TEMPO_MAX, escala_tempo * 2)
+            elif evento.key == pygame.K_PAGEDOWN:
+                escala_tempo = max(ESCALA_TEMPO_MIN, escala_tempo / 2)
+            elif evento.key == pygame.K_HOME:
+                escala_tempo = 1.0
+            # Perfilador de quadros
+            elif evento.key == pygame.K_F3:
+                perfilador.alternar()
+            elif evento.key == pygame.K_F4:
+                perfilador.exportar_traco(ARQUIVO_TRACO)
+                perfilador.exportar_csv(ARQUIVO_CSV_PERFIL)
+
+    """
+        Salva a gravação da partida (se `GRAVAR_PARTIDAS`) e troca a partida pela tela de resultados.
+    """
+    def encerrar(self):
+        if self.gravacao is not None and GRAVAR_PARTIDAS:
+            self.gravacao.finalizar(self.partida)
+            salvar_nova_gravacao(self.gravacao)
+        self.pilha.trocar(CenaResultados(self.partida.pontuacao, self.partida.meta_pontuacao))
+
+    def atualizar(self):
+        partida = self.partida
+        self.inicio_quadro = time.perf_counter()
+
+        # Acumula o tempo real do quadro e avança a partida em passos fixos
+        tempo_atual = obter_ticks()
+        self.acumulador += min(tempo_atual - self.tempo_anterior, MAX_MS_POR_QUADRO) / 1000 * escala_tempo
+        self.tempo_anterior = tempo_atual
+
+        entrada = ler_entrada()
+        perfilador.marcar("entrada")
+        passos = 0
+        jogo_ativo = True
+        while jogo_ativo and self.acumulador >= partida.dt:
+            if self.entradas is not None:
+                entrada = next(self.entradas, SEM_ENTRADA)
+            else:
+                self.gravacao.registrar(entrada)
+            self.anterior_x, self.anterior_y = partida.posicao_x, partida.posicao_y
+            self.voo_anterior = (partida.lancado, partida.lancamentos, partida.pontuacao)
+            jogo_ativo = partida.avancar(entrada)
+            self.acumulador -= partida.dt
+            passos += 1
+            perfilador.marcar("fisica")
+
+            # Atualiza o traçado: apaga enquanto mira e carimba cada posição do voo
+            if not partida.lancado:
+                self.compositor.invalidar_regiao(self.camada_tracado.limpar())
+            else:
+                self.compositor.invalidar_regiao(self.camada_tracado.adicionar(
+                    int(partida.posicao_x + self.boneco_largura * 0.1), int(partida.posicao_y + self.boneco_altura // 2)
+                ))
+            perfilador.marcar("tracado")
+
+            # Descarta o atraso que não cabe em um quadro, em vez de acumulá-lo
+            if passos >= MAX_PASSOS_POR_QUADRO:
+                self.acumulador = 0.0
+
+        if not jogo_ativo:
+            self.encerrar()
+
+    def desenhar(self):
+        partida = self.partida
+        compositor = self.compositor
+
+        # Atualiza os textos da interface (cada texto só é renderizado de novo quando muda)
+        self.texto_angulo.atualizar(f"Ângulo: {partida.angulo:.1f}°")
+        self.texto_velocidade.atualizar(f"Velocidade: {partida.velocidade_inicial:.1f} m/s")
+        self.texto_pontuacao.atualizar(f"Pontuação: {partida.pontuacao}")
+        self.texto_tempo.atualizar(f"Tempo: {partida.tempo_restante}s")
+        self.texto_escala.atualizar("" if escala_tempo == 1 else f"Tempo: {escala_tempo:g}x")
+        if partida.dificuldade == 1 and self.modo != "alvos":
+            self.texto_dica.atualizar("" if partida.lancado else dica_de_mira(partida, self.atlas))
+        if self.rajada:
+            self.texto_rajada.atualizar(f"Cadeiras no ar: {len(partida.cadeiras)}")
+        perfilador.marcar("hud")
+
+        # Interpola entre os dois últimos passos, desde que sejam do mesmo voo
+        posicao_x, posicao_y = partida.posicao_x, partida.posicao_y
+        if partida.lancado and self.voo_anterior == (True, partida.lancamentos, partida.pontuacao):
+            fracao = self.acumulador / partida.dt
+            posicao_x = self.anterior_x + (posicao_x - self.anterior_x) * fracao
+            posicao_y = self.anterior_y + (posicao_y - self.anterior_y) * fracao
+
+        # Apaga o que foi desenhado no quadro anterior
+        compositor.iniciar_quadro()
+
+        if not partida.lancado:
+            # A previsão só é recalculada quando o ângulo ou a velocidade mudam
+            self.previsao.atualizar(partida.angulo, partida.velocidade_inicial)
+            compositor.pintar(self.previsao.desenhar, tela)
+            compositor.pintar(desenhar_vetor_direcao, posicao_x, posicao_y, partida.angulo, partida.velocidade_inicial)
+
+        # Desenha o marcal (ou os alvos)
+        if self.modo == "alvos":
+            for x, y in zip(partida.alvos.x, partida.alvos.y):
+                compositor.desenhar(self.alvo, (int(x), int(y)))
+        else:
+            compositor.desenhar(self.marcal, (int(partida.marcal_x), int(partida.marcal_y)))
 
-    4. Condições de término:
-        - Reinicia o projétil se ele sair da tela.
-        - Finaliza o jogo e exibe resultados se o tempo acabar.
+        # Desenha a imagem da cadeira, girada na direção da velocidade durante o voo
+        if partida.lancado and self.cadeira_girada:
+            direcao = math.degrees(math.atan2(partida.velocidade_y, partida.velocidade_x))
+            cadeira, (dx, dy) = self.cadeira_rotacionada.obter(direcao)
+            compositor.desenhar(cadeira, (int(posicao_x) + dx, int(posicao_y) + dy))
+        else:
+            compositor.desenhar(self.cadeira, (int(posicao_x), int(posicao_y)))
 
-    5. Sistema de desenho:
-        - Adiciona a trajetória do projétil ao traçado e redesenha a cada quadro.
-        - Atualiza a tela a 60 quadros por segundo usando `pygame.time.Clock`.
+        # Desenha as cadeiras da rajada de uma vez
+        if self.rajada:
+            compositor.pintar(partida.cadeiras.desenhar, tela, self.sprite_rajada)
 
-    Parâmetros:
-        - relogio (pygame.time.Clock): Controla a taxa de atualização dos quadros.
+        if perfilador.ativo:
+            perfilador.marcar("blits")
+            compositor.pintar(self.grafico_perfil.desenhar, tela)
+            perfilador.marcar("perfil")
+
+        # Desenha os textos da interface e envia as regiões alteradas para a janela
+        compositor.finalizar_quadro()
+        perfilador.marcar("flip")
+
+        # Informa o tempo de trabalho do quadro ao governador e aplica o novo nível, se mudou
+        if governador.registrar_quadro((time.perf_counter() - self.inicio_quadro) * 1000):
+            self.aplicar_qualidade()
 
-    Retorna:
-        None
 """
-def start_game(relogio):
-    # Variáveis de Física
-    g = 9.81  # Aceleração default
-    air_rest = 0;
-    angulo = 45  # Ângulo de lançamento em graus
-    velocidade_inicial = 50  # Velocidade inicial
-    t = 0  # Tempo
-    k = 0.05  # Coeficiente de resistência do ar
-
-    #meta de pontuação default para a dificuldade
-    meta_pontuacao = 15
-    #tempo total default
-    tempo_total = 60
-
-
-    # Variáveis de controle de sensibilidade
-    sens_ang = 0.5  # Velocidade de mudança do ângulo
-    sens_vel = 0.5  # Velocidade de mudança da velocidade inicial
-
-    # Posição inicial do projétil
-    posicao_inicial_x, posicao_inicial_y = 100, altura - 250
-    posicao_x, posicao_y = posicao_inicial_x, posicao_inicial_y
-
-
-
-    lancado = False
-    jogo_ativo = False
-    pontuacao = 0
-    tracado_pontos = []
-
-    # Prepara a imagem da cadeira
-    cadeira = pygame.image.load("images/cadeira.png")
-    cadeira = pygame.transform.scale(cadeira, (150, 150))
-    boneco_largura, boneco_altura = cadeira.get_size()
-
-    # Prepara a imagem e caracteristicas do marcal
-    marcal = pygame.image.load("images/marcal.png")
-
-    tracado = pygame.image.load("images/quadrado.png")
-    tracado = pygame.transform.scale(tracado, (7, 7))
-
-    if dificuldade == 1:
-        tempo_total = 60
-        meta_pontuacao = 15
-        marcal = pygame.transform.scale(marcal, (125, 125))
-    elif dificuldade == 2:
-        tempo_atual = 60
-        meta_pontuacao = 20
-        marcal = pygame.transform.scale(marcal, (100, 100))
-    else:
-        tempo_total = 30
-        meta_pontuacao = 15
-        marcal = pygame.transform.scale(marcal, (75, 75))
+    Monta o texto da dica de mira exibida na dificuldade Fácil.
 
-    marcal_largura, marcal_altura = marcal.get_size()
-    marcal_x, marcal_y = 990, 550
+    1. Calcula a velocidade que acerta o Marçal com o ângulo atual (`mira.py`).
+    2. Se o atlas da fase foi construído (`atlas.py`), mostra também o intervalo de
+       velocidades que acerta com esse ângulo, consultado em O(1). O atlas só vale para a
+       cadeira do modo normal; nos outros modos, `atlas` é None.
+    3. Se o ângulo atual não permite acertar dentro dos limites do jogo, sugere o
+       lançamento de menor velocidade.
+    4. Nas fases com arrasto não linear, não exibe dica.
 
-    # Sistema de tempo
-    tempo_inicial = pygame.time.get_ticks()
-    
-    # Prepara o plano de fundo
-    if fases == 1:
-        g = 9.81
-        k = 0.03
-        fundo_img = pygame.image.load("images/debate.png").convert()
-    elif fases == 2:
-        k = 0.00001
-        g = 1.62
-        fundo_img = pygame.image.load("images/lua2.png").convert()
-    else:
-        k = 0.3
-        g = 8.87
-        fundo_img = pygame.image.load("images/marte.jpeg").convert()
-    
-    fundo_img = pygame.transform.scale(fundo_img, (1400, 800))
-
-    #prepara o icone da resistencia do ar
-    air_rest_icon = pygame.image.load("images/air_resistence.png")
-    air_rest_icon = pygame.transform.scale(air_rest_icon, (50, 50))
-
-    #prepara o icone da gravidade
-    grav_icon = pygame.image.load("images/grav.png")
-    grav_icon = pygame.transform.scale(grav_icon, (50, 50))
-
-    jogo_ativo = True
-    while jogo_ativo:
-        
-        tela.blit(fundo_img, (0, 0)) #desenha o fundo
-        
-
-        for evento in pygame.event.get(): #fechar jogo
-            if evento.type == pygame.QUIT:
-                jogo_ativo = False
-   
-        # Calcula o tempo restante
-        tempo_atual = pygame.time.get_ticks()
-        tempo_passado = (tempo_atual - tempo_inicial) // 1000  # Converte para segundos
-        tempo_restante = tempo_total - tempo_passado
-        if tempo_restante <= 0 and jogo_ativo:        # Verifica se o tempo acabou
-            jogo_ativo = False
-
-        if jogo_ativo:
-            if not lancado:
-
-                tracado_pontos.clear()
-
-                # Processa entrada contínua das teclas
-                angulo, velocidade_inicial, lancado, _ = processar_entrada_continua(sens_ang, sens_vel, lancado, angulo, velocidade_inicial)
-                
-                #cadeira = pygame.transform.rotate(boneco_aux, angulo);
-                desenhar_vetor_direcao(posicao_x, posicao_y, angulo, velocidade_inicial)
-                posicao_x, posicao_y = posicao_inicial_x, posicao_inicial_y
-
-            # Atualiza a posição somente se foi lançado
-            else:
-                # Dentro do loop principal, ao calcular a nova posição
-                (posicao_x, posicao_y), _ = atualizar_posicao_e_velocidade_com_resistencia(
-                    t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k
-                )
-                t += 0.1
-
-                # Verifica colisão com o marcal
-                if verificar_colisao(
-                    posicao_x + boneco_largura//2, posicao_y + boneco_altura // 2,
-                    marcal_x + marcal_largura//2, marcal_y + marcal_altura//2,
-                    0.6 * boneco_largura, 0.25 * marcal_largura
-                ):
-                    pontuacao += 1
-                    lancado = False
-                    # Reposiciona o marcal após acertar
-                    marcal_x, marcal_y = reposicionar_marcal()
-                    t = 0
-
-            # Se o projétil sair da tela, reinicia
-            if posicao_y > altura or posicao_x > largura:
-                lancado = False
-                posicao_x, posicao_y = posicao_inicial_x, posicao_inicial_y
-                t = 0
-
-            # Desenha o marcal
-            tela.blit(marcal, (int(marcal_x), int(marcal_y)))
-
-            # Desenha todos os pontos armazenados no traçado
-            for i, ponto in enumerate(tracado_pontos):
-                if i % 3 == 0:  # Se o índice for par, desenha o ponto
-                    tela.blit(tracado, ponto)
-
-            # Adiciona a posição atual ao traçado
-            tracado_pontos.append((int(posicao_x + boneco_largura * 0.1), int(posicao_y + boneco_altura // 2)))
-
-            # Desenha a imagem da cadeira
-            tela.blit(cadeira, (int(posicao_x), int(posicao_y)))    
-
-        # Interface do usuário
-        fonte1 = pygame.font.Font(None, 36)
-        
-        # Mostra informações durante o jogo
-        if jogo_ativo:
-            texto_angulo = fonte1.render(f"Ângulo: {angulo:.1f}°", True, BRANCO)
-            texto_velocidade = fonte1.render(f"Velocidade: {velocidade_inicial:.1f} m/s", True, BRANCO)
-            texto_pontuacao = fonte1.render(f"Pontuação: {pontuacao}", True, VERDE)
-            texto_tempo = fonte1.render(f"Tempo: {tempo_restante}s", True, VERMELHO)
-            texto_meta = fonte1.render(f"Meta de pontos: {meta_pontuacao} pontos", True, AZUL) 
-            texto_grav = fonte4.render(f"{g} m/s", True, BRANCO)
-            if k == 0.00001:
-                texto_air_rest = fonte4.render("0", True, BRANCO)
-            else:
-                texto_air_rest = fonte4.render(f"{k}", True, BRANCO)
-
-
-            tela.blit(texto_angulo, (10, 10))
-            tela.blit(texto_velocidade, (10, 50))
-            tela.blit(texto_pontuacao, (10, 90))
-            tela.blit(texto_tempo, (10, 130))
-            tela.blit(texto_meta, (10, 170))
-            tela.blit(air_rest_icon, (830, 20))
-            tela.blit(grav_icon, (1100, 20))
-            tela.blit(texto_air_rest, (910 , 25) )
-            tela.blit(texto_grav, (1170 , 25) )
-        else:
-            mostrar_resultados(pontuacao, meta_pontuacao)
-            draw_menu()
+    Parâmetros:
+        partida (Partida): A partida em andamento.
+        atlas (atlas.Atlas): O atlas de acerto da fase e do tamanho do Marçal, ou None.
+
+    Retorna:
+        str: O texto da dica.
+"""
+def dica_de_mira(partida, atlas=None):
+    # O resolvedor usa a solução fechada do arrasto linear
+    if partida.arrasto != "linear":
+        return ""
+    dx, dy = deslocamento_alvo(partida)
+    velocidade = velocidade_para_angulo(partida.angulo, dx, dy, partida.g, partida.k)
+    if velocidade is not None and velocidade <= VELOCIDADE_MAXIMA:
+        janela = atlas.janela(partida.marcal_x, partida.marcal_y, partida.angulo) if atlas else None
+        if janela is not None:
+            return f"Dica: {velocidade:.1f} m/s com este ângulo (acerta de {janela[0]:.0f} a {janela[1]:.0f})"
+        return f"Dica: {velocidade:.1f} m/s com este ângulo"
+    solucao = solucao_velocidade_minima(dx, dy, partida.g, partida.k)
+    if solucao is None:
+        return ""
+    return f"Dica: {solucao[0]:.1f}° e {solucao[1]:.1f} m/s"
 
-        pygame.display.flip()
-        relogio.tick(60) 
 #--------------------------------------------------------------------------------
 """
-    Função principal que gerencia o menu inicial do jogo e as interações do jogador.
+    Função principal que cria a pilha de cenas com o menu inicial e executa o laço do jogo.
 
     1. Configuração inicial:
-        - Inicializa o estado do menu (`in_menu`) e o controle de clique (`clicado`).
-        - Desenha o menu inicial na tela e define os botões (iniciar, sair, ajuda, dificuldade, e fases).
+        - Inicializa o pygame, a janela e as fontes (`iniciar`).
+        - Cria a pilha de cenas (`cenas.PilhaCenas`) com o relógio que limita a taxa de quadros.
+        - Empilha o menu principal (`CenaMenu`), que empilha as demais cenas (partida,
+          seleção de dificuldade, fase ou modo e ajuda) conforme os botões clicados.
 
     2. Sistema de eventos:
-        - Detecta eventos do pygame, como fechar o jogo (`QUIT`) ou interagir com os botões via cliques do mouse.
-        - Realiza a ação correspondente ao botão clicado:
-            - Inicia o jogo chamando `start_game`.
-            - Encerra o programa.
-            - Exibe a janela de ajuda com `abrir_pop_up`.
-            - Modifica parâmetros de dificuldade ou fase com `mudar_parametro`.
+        - Um único laço (`PilhaCenas.executar`) entrega os eventos à cena do topo. Enquanto o
+          menu ou uma janela sobreposta está no topo, o laço espera pelos eventos com
+          `pygame.event.wait`, sem ocupar o processador, e só redesenha quando algo muda.
+        - Todas as cenas usam a mesma janela, que nunca é recriada.
 
-    3. Controle de cliques:
-        - Garante que cada clique seja processado uma única vez ao controlar o estado do botão pressionado.
+    3. Encerramento:
+        - Quando a pilha fica vazia (botão "Sair" ou janela fechada no menu), encerra o programa.
+
+    4. Medida da abertura:
+        - Com `--medir-inicio`, desenha só o primeiro quadro do menu, imprime em JSON o tempo
+          (em ms) da importação, de cada etapa de `iniciar`, do primeiro quadro e o total, e encerra.
 
     Parâmetros:
         None
@@ -795,42 +985,26 @@ def start_game(relogio):
         None
 """
 def main():
-    in_menu = True
-    clicado = False
-    draw_menu()
-
-    start_button = pygame.Rect(150, 250, 300, 50)
-    exit_button = pygame.Rect(150, 650, 300, 50)
-    htp_button = pygame.Rect(150, 550, 300, 50)
-    dificult_button = pygame.Rect(150, 350, 300, 50)
-    fases_button = pygame.Rect(150, 450, 300, 50)
-
-    while in_menu:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN and not clicado:
-                if start_button.collidepoint(event.pos):
-                    jogo_ativo = True;
-                    clicado = True;
-                    relogio = pygame.time.Clock()
-                    start_game(relogio)
-                elif exit_button.collidepoint(event.pos):
-                    clicado = True
-                    pygame.quit()
-                    sys.exit()
-                elif htp_button.collidepoint(event.pos):
-                    clicado = True
-                    abrir_pop_up();
-                elif dificult_button.collidepoint(event.pos):
-                    clicado = True
-                    mudar_parametro("dificuldade")
-                elif fases_button.collidepoint(event.pos):
-                    clicado = True
-                    mudar_parametro("fases")
-            elif event.type == pygame.MOUSEBUTTONUP and clicado:
-                clicado = False
+    iniciar()
+    pilha = PilhaCenas(pygame.time.Clock())
+    pilha.empilhar(CenaMenu())
+
+    if "--medir-inicio" in sys.argv:
+        # Desenha só o primeiro quadro do menu e informa quanto tempo cada etapa levou
+        inicio = time.perf_counter()
+        pilha.topo.desenhar()
+        pygame.display.flip()
+        tempos_inicio["primeiro_quadro"] = (time.perf_counter() - inicio) * 1000
+        tempos_inicio["total"] = (time.perf_counter() - INICIO_IMPORTACAO) * 1000
+        print(json.dumps({etapa: round(ms, 2) for etapa, ms in tempos_inicio.items()}, indent=2))
+        imagens.parar_antecipacao()
+        pygame.quit()
+        return
+
+    pilha.executar()
+    imagens.parar_antecipacao()
+    pygame.quit()
+    sys.exit()
 
 if __name__ == '__main__':
     main()
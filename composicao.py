@@ -0,0 +1,403 @@
+import pygame
+
+from integradores import criar_trajetoria
+from perfil import PERCENTIS, perfilador
+
+# Fração da tela acima da qual é mais barato atualizar a tela inteira do que uma lista de retângulos
+LIMITE_AREA_SUJA = 0.35
+
+# Quantidade de pontos da linha que prevê a trajetória durante a mira
+PONTOS_PREVISAO = 64
+
+# Gráfico do perfilador: altura das barras, largura de cada barra, a cada quantos quadros
+# a tabela de percentis é atualizada, cor de fundo e cores das etapas
+ALTURA_GRAFICO_PERFIL = 100
+LARGURA_BARRA_PERFIL = 2
+INTERVALO_TEXTO_PERFIL = 30
+FUNDO_PERFIL = (20, 20, 28)
+CORES_PERFIL = ((230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200), (245, 130, 48),
+                (145, 30, 180), (70, 240, 240), (240, 50, 230), (210, 245, 60), (250, 190, 212),
+                (0, 128, 128), (170, 110, 40))
+
+#---------------------------------------------------------------------------
+"""
+    Compositor em camadas que atualiza na tela apenas as regiões que mudaram.
+
+    1. Camada estática: fundo, ícones e textos fixos são combinados uma única vez em
+       uma superfície do tamanho da tela (`preparar`). Camadas persistentes transparentes
+       (como o traçado) ficam logo acima dela; quem as altera informa a região com
+       `invalidar_regiao`.
+    2. Camada de sprites: a cada quadro, as regiões ocupadas no quadro anterior são
+       restauradas a partir da camada estática (`iniciar_quadro`) e os objetos móveis
+       são desenhados com `desenhar` ou `pintar`.
+    3. Camada de sobreposição: textos da interface (`TextoHUD`) são redesenhados por
+       cima de tudo apenas quando mudam ou quando algum sprite passou sobre eles. Como os
+       textos são semitransparentes nas bordas, a região de cada texto redesenhado é antes
+       recomposta (camada estática e sprites do quadro) para não acumular transparência.
+       Os textos não devem se sobrepor entre si.
+    4. Em `finalizar_quadro`, envia para a janela somente os retângulos sujos com
+       `pygame.display.update(retangulos)`, ou a tela inteira com `pygame.display.flip()`
+       quando a área suja passa de `limite_area` ou quando tudo foi invalidado.
+
+    Parâmetros:
+        tela (pygame.Surface): A superfície da janela.
+        limite_area (float): Fração da área da tela a partir da qual se usa `flip`.
+"""
+class Compositor:
+    def __init__(self, tela, limite_area=LIMITE_AREA_SUJA):
+        self.tela = tela
+        self.limite_area = limite_area
+        self.estatico = None
+        self.sobreposicoes = []
+        self.camadas = []
+        self.quadros_completos = 0
+        self.quadros_parciais = 0
+        self._anteriores = []
+        self._atuais = []
+        self._comandos = []
+        self._sujos = []
+        self._pendentes = []
+        self._redesenhar_tudo = True
+
+    """
+        Monta a camada estática.
+
+        Parâmetros:
+            fundo (pygame.Surface): A imagem de fundo, já no tamanho da tela.
+            fixos (list): Pares (superfície, posição) desenhados uma vez sobre o fundo.
+            sobreposicoes (list): Textos (`TextoHUD`) que ficam por cima dos sprites.
+    """
+    def preparar(self, fundo, fixos=(), sobreposicoes=(), camadas=()):
+        self.estatico = fundo.copy()
+        for superficie, posicao in fixos:
+            self.estatico.blit(superficie, posicao)
+        self.sobreposicoes = list(sobreposicoes)
+        self.camadas = list(camadas)
+        self.invalidar()
+
+    """
+        Força o próximo quadro a redesenhar e enviar a tela inteira
+        (por exemplo, depois que outra tela foi desenhada por cima do jogo).
+    """
+    def invalidar(self):
+        self._redesenhar_tudo = True
+
+    """
+        Informa que uma região de uma camada persistente mudou e deve ser recomposta
+        no próximo `iniciar_quadro`.
+    """
+    def invalidar_regiao(self, retangulo):
+        if retangulo is not None:
+            self._pendentes.append(retangulo)
+
+    """
+        Redesenha a camada estática e as camadas persistentes dentro de `retangulo`.
+    """
+    def _recompor(self, retangulo):
+        tela = self.tela
+        tela.blit(self.estatico, retangulo, retangulo)
+        for camada in self.camadas:
+            tela.blit(camada, retangulo, retangulo)
+
+    """
+        Restaura a camada estática sob tudo o que foi desenhado no quadro anterior
+        e sob os textos que mudaram de valor.
+    """
+    def iniciar_quadro(self):
+        self._atuais = []
+        self._comandos = []
+        pendentes, self._pendentes = self._pendentes, []
+
+        if self._redesenhar_tudo:
+            self.tela.blit(self.estatico, (0, 0))
+            for camada in self.camadas:
+                self.tela.blit(camada, (0, 0))
+            self._sujos = []
+            return
+
+        self._sujos = self._anteriores + pendentes
+        for retangulo in self._sujos:
+            self._recompor(retangulo)
+
+        for texto in self.sobreposicoes:
+            if texto.alterado and texto.retangulo_anterior is not None:
+                self._recompor(texto.retangulo_anterior)
+                self._sujos.append(texto.retangulo_anterior)
+
+    """
+        Desenha um objeto móvel e registra a região ocupada.
+
+        Retorna:
+            pygame.Rect: A região da tela alterada.
+    """
+    def desenhar(self, superficie, posicao):
+        return self.pintar(self.tela.blit, superficie, posicao)
+
+    """
+        Desenha com uma função qualquer que pinta na tela e retorna a região alterada
+        (por exemplo, funções que usam `pygame.draw`). A chamada é guardada para poder
+        ser repetida sob um texto que precise ser redesenhado.
+
+        Retorna:
+            pygame.Rect: A região da tela alterada.
+    """
+    def pintar(self, funcao, *argumentos):
+        retangulo = funcao(*argumentos)
+        self._atuais.append(retangulo)
+        self._comandos.append((retangulo, funcao, argumentos))
+        return retangulo
+
+    """
+        Desenha as sobreposições necessárias e envia as regiões alteradas para a janela.
+    """
+    def finalizar_quadro(self):
+        tela = self.tela
+        sujos = self._sujos + self._atuais
+
+        for texto in self.sobreposicoes:
+            retangulo = texto.retangulo()
+            if self._redesenhar_tudo:
+                texto.desenhar(tela)
+            elif texto.alterado or retangulo.collidelist(sujos) != -1:
+                # Recompõe a região do texto antes de desenhá-lo de novo
+                tela.set_clip(retangulo)
+                self._recompor(retangulo)
+                for regiao, funcao, argumentos in self._comandos:
+                    if regiao.colliderect(retangulo):
+                        funcao(*argumentos)
+                tela.set_clip(None)
+                texto.desenhar(tela)
+                sujos.append(retangulo)
+            texto.alterado = False
+
+        area_tela = tela.get_width() * tela.get_height()
+        area_suja = sum(r.width * r.height for r in sujos)
+        perfilador.marcar("blits")
+        if self._redesenhar_tudo or area_suja > self.limite_area * area_tela:
+            pygame.display.flip()
+            self.quadros_completos += 1
+        else:
+            pygame.display.update(sujos)
+            self.quadros_parciais += 1
+
+        self._anteriores = self._atuais
+        self._redesenhar_tudo = False
+
+"""
+    Traçado da trajetória carimbado uma única vez em uma camada transparente persistente.
+
+    1. Os pontos não são guardados: a camada já contém tudo o que é desenhado, e só o
+       total de pontos adicionados é contado.
+    2. A cada `intervalo` pontos (um em cada três, como no traçado original), o ponto é
+       carimbado na camada, de modo que o custo por quadro não cresce com o tempo de voo.
+    3. `limpar` apaga somente a região ocupada pelos carimbos.
+
+    Os métodos retornam a região alterada da camada, para ser informada ao `Compositor`.
+
+    Parâmetros:
+        tamanho_tela (tuple): O tamanho da camada, igual ao da tela.
+        ponto (pygame.Surface): A imagem carimbada em cada ponto.
+        intervalo (int): Carimba um ponto a cada `intervalo` pontos adicionados.
+"""
+class CamadaTracado:
+    def __init__(self, tamanho_tela, ponto, intervalo=3):
+        self.superficie = pygame.Surface(tamanho_tela, pygame.SRCALPHA)
+        self.ponto = ponto
+        self.intervalo = intervalo
+        self.total = 0
+        self._regiao = None
+
+    """
+        Adiciona um ponto ao traçado e o carimba se for a sua vez.
+
+        Retorna:
+            pygame.Rect: A região carimbada, ou None se o ponto não foi carimbado.
+    """
+    def adicionar(self, x, y):
+        carimbar = self.total % self.intervalo == 0
+        self.total += 1
+        if not carimbar:
+            return None
+
+        retangulo = self.superficie.blit(self.ponto, (x, y))
+        self._regiao = retangulo if self._regiao is None else self._regiao.union(retangulo)
+        return retangulo
+
+    """
+        Apaga o traçado.
+
+        Retorna:
+            pygame.Rect: A região apagada da camada, ou None se o traçado já estava vazio.
+    """
+    def limpar(self):
+        self.total = 0
+        retangulo, self._regiao = self._regiao, None
+        if retangulo is not None:
+            self.superficie.fill((0, 0, 0, 0), retangulo)
+        return retangulo
+
+"""
+    Previsão da trajetória exibida enquanto o jogador mira, desenhada como uma única linha.
+
+    1. Em `atualizar`, só recalcula os pontos quando o ângulo ou a velocidade mudam;
+       enquanto nenhuma tecla é pressionada, a mesma lista de pontos é reaproveitada.
+    2. A linha termina exatamente onde o ponto acompanhado sai da tela, pelo instante de
+       saída calculado analiticamente (`tempo_saida_tela` da trajetória), e os pontos são
+       distribuídos igualmente no tempo até esse instante.
+    3. Em `desenhar`, faz uma única chamada a `pygame.draw.lines`.
+
+    Parâmetros:
+        g (float): A aceleração da gravidade da fase.
+        k (float): O coeficiente de resistência do ar da fase.
+        arrasto (str): A lei de arrasto da fase.
+        origem (tuple): O ponto (x, y) da tela de onde a linha parte.
+        tamanho_tela (tuple): O tamanho (largura, altura) da tela, usado para cortar a linha.
+        cor (tuple): A cor da linha.
+        pontos (int): Quantidade de pontos da linha.
+"""
+class PrevisaoTrajetoria:
+    def __init__(self, g, k, arrasto, origem, tamanho_tela, cor=(255, 255, 255), pontos=PONTOS_PREVISAO):
+        self.g = g
+        self.k = k
+        self.arrasto = arrasto
+        self.origem = origem
+        self.largura, self.altura = tamanho_tela
+        self.cor = cor
+        self.quantidade = pontos
+        self.pontos = []
+        self._parametros = None
+
+    """
+        Recalcula os pontos se o ângulo ou a velocidade mudaram. Retorna `True` se recalculou.
+    """
+    def atualizar(self, angulo, velocidade_inicial):
+        parametros = (angulo, velocidade_inicial)
+        if parametros == self._parametros:
+            return False
+        self._parametros = parametros
+
+        trajetoria = criar_trajetoria(
+            angulo, velocidade_inicial, self.origem[0], self.origem[1], self.g, self.k, self.arrasto
+        )
+        tempo_final = trajetoria.tempo_saida_tela(self.largura, self.altura)
+        ultimo = self.quantidade - 1
+        self.pontos = [trajetoria.posicao(tempo_final * i / ultimo) for i in range(self.quantidade)]
+        return True
+
+    """
+        Troca a quantidade de pontos da linha; ela é recalculada no próximo `atualizar`.
+    """
+    def definir_quantidade(self, pontos):
+        if pontos != self.quantidade:
+            self.quantidade = pontos
+            self._parametros = None
+
+    """
+        Desenha a linha na tela.
+
+        Retorna:
+            pygame.Rect: A região da tela ocupada pela linha.
+    """
+    def desenhar(self, tela):
+        return pygame.draw.lines(tela, self.cor, False, self.pontos, 2)
+
+"""
+    Gráfico do perfilador de quadros (`perfil.py`), desenhado por cima do jogo.
+
+    1. A parte de baixo é um gráfico de barras empilhadas com o tempo de cada etapa nos
+       últimos quadros e uma linha no orçamento de um quadro (16,7 ms a 60 quadros por
+       segundo). O gráfico fica em uma superfície própria, que é deslocada para a esquerda
+       a cada quadro novo; só a barra do quadro novo é desenhada.
+    2. A parte de cima lista os percentis (p50/p95/p99) de cada etapa, renderizados
+       novamente a cada `intervalo_texto` quadros.
+
+    Parâmetros:
+        perfilador (Perfilador): O perfilador cujos quadros são exibidos.
+        fonte (pygame.font.Font): A fonte da tabela de percentis.
+        retangulo (pygame.Rect): A região da tela ocupada pelo gráfico.
+        orcamento_ms (float): O tempo de um quadro na taxa desejada.
+        intervalo_texto (int): A cada quantos quadros a tabela é atualizada.
+"""
+class GraficoPerfil:
+    def __init__(self, perfilador, fonte, retangulo, orcamento_ms=1000 / 60, intervalo_texto=INTERVALO_TEXTO_PERFIL):
+        self.perfilador = perfilador
+        self.fonte = fonte
+        self.retangulo = pygame.Rect(retangulo)
+        self.orcamento_ms = orcamento_ms
+        self.intervalo_texto = intervalo_texto
+
+        self.grafico = pygame.Surface((self.retangulo.width, ALTURA_GRAFICO_PERFIL))
+        self.grafico.fill(FUNDO_PERFIL)
+        self.escala = ALTURA_GRAFICO_PERFIL / (2 * orcamento_ms)
+        self.tabela = pygame.Surface((self.retangulo.width, self.retangulo.height - ALTURA_GRAFICO_PERFIL))
+        self.tabela.fill(FUNDO_PERFIL)
+        self._visto = perfilador.total_quadros
+        self._tabela_em = None
+
+    def cor(self, etapa):
+        return CORES_PERFIL[self.perfilador.etapas.index(etapa) % len(CORES_PERFIL)]
+
+    """
+        Desloca o gráfico e desenha as barras dos quadros fechados desde a última chamada.
+    """
+    def _atualizar_grafico(self):
+        perfilador = self.perfilador
+        novos = min(perfilador.total_quadros - self._visto, len(perfilador.historico),
+                    self.retangulo.width // LARGURA_BARRA_PERFIL)
+        self._visto = perfilador.total_quadros
+        if novos <= 0:
+            return
+
+        grafico = self.grafico
+        largura = grafico.get_width()
+        grafico.scroll(-novos * LARGURA_BARRA_PERFIL, 0)
+        grafico.fill(FUNDO_PERFIL, (largura - novos * LARGURA_BARRA_PERFIL, 0, novos * LARGURA_BARRA_PERFIL, ALTURA_GRAFICO_PERFIL))
+        for i in range(novos):
+            totais = perfilador.historico[i - novos]
+            x = largura - (novos - i) * LARGURA_BARRA_PERFIL
+            y = ALTURA_GRAFICO_PERFIL
+            for etapa in perfilador.etapas:
+                altura = round(totais.get(etapa, 0.0) * self.escala)
+                if altura > 0:
+                    y -= altura
+                    grafico.fill(self.cor(etapa), (x, y, LARGURA_BARRA_PERFIL, altura))
+
+        # Linha do orçamento de um quadro
+        y_orcamento = ALTURA_GRAFICO_PERFIL - round(self.orcamento_ms * self.escala)
+        grafico.fill((255, 255, 255), (largura - novos * LARGURA_BARRA_PERFIL, y_orcamento, novos * LARGURA_BARRA_PERFIL, 1))
+
+    """
+        Renderiza de novo a tabela de percentis.
+    """
+    def _atualizar_tabela(self):
+        self.tabela.fill(FUNDO_PERFIL)
+        altura_linha = self.fonte.get_linesize()
+        linhas = [("etapa", [f"p{p}" for p in PERCENTIS], (255, 255, 255))]
+        for etapa, valores in self.perfilador.percentis().items():
+            cor = (255, 255, 255) if etapa == "quadro" else self.cor(etapa)
+            linhas.append((etapa, [f"{valor:.2f}" for valor in valores], cor))
+
+        # Uma coluna para o nome e uma, alinhada à direita, para cada percentil
+        largura_coluna = (self.tabela.get_width() - 8) // (len(PERCENTIS) + 2)
+        for i, (nome, colunas, cor) in enumerate(linhas):
+            y = 2 + i * altura_linha
+            self.tabela.blit(self.fonte.render(nome, True, cor), (4, y))
+            for j, texto in enumerate(colunas):
+                superficie = self.fonte.render(texto, True, cor)
+                self.tabela.blit(superficie, superficie.get_rect(topright=(4 + (j + 3) * largura_coluna, y)))
+
+    """
+        Desenha o gráfico na tela.
+
+        Retorna:
+            pygame.Rect: A região da tela ocupada pelo gráfico.
+    """
+    def desenhar(self, tela):
+        self._atualizar_grafico()
+        if self._tabela_em is None or self.perfilador.total_quadros - self._tabela_em >= self.intervalo_texto:
+            self._tabela_em = self.perfilador.total_quadros
+            self._atualizar_tabela()
+
+        tela.blit(self.tabela, self.retangulo.topleft)
+        return tela.blit(self.grafico, (self.retangulo.left, self.retangulo.bottom - ALTURA_GRAFICO_PERFIL)).union(
+            self.retangulo)
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+
+import pygame
+
+# Quantidade máxima de quebras de linha e de parágrafos renderizados mantidos em cache
+CAPACIDADE_QUEBRAS = 512
+CAPACIDADE_PARAGRAFOS = 64
+
+# Quebras de linha já calculadas, por (texto, fonte, largura máxima)
+_quebras = OrderedDict()
+
+# Parágrafos já renderizados, por (texto, fonte, cor, largura máxima, espaçamento)
+_paragrafos = OrderedDict()
+
+#---------------------------------------------------------------------------
+"""
+    Guarda um valor em um cache LRU, removendo o usado há mais tempo quando passa da capacidade.
+"""
+def _guardar(cache, chave, valor, capacidade):
+    cache[chave] = valor
+    if len(cache) > capacidade:
+        cache.popitem(last=False)
+    return valor
+
+"""
+    Quebra um texto em linhas que cabem em `largura_max`.
+
+    1. Mede cada linha candidata com `Font.size`, que calcula a largura sem renderizar o texto.
+    2. Acrescenta palavras à linha atual enquanto ela couber; uma palavra sozinha mais larga
+       que o limite fica em uma linha própria.
+    3. Guarda o resultado por (texto, fonte, largura máxima), de modo que o mesmo texto não é
+       medido de novo.
+
+    Parâmetros:
+        texto (str): O texto a ser quebrado.
+        fonte (pygame.font.Font): A fonte usada para medir o texto.
+        largura_max (int): A largura máxima de cada linha, em pixels.
+
+    Retorna:
+        tuple: As linhas do texto.
+"""
+def quebrar_linhas(texto, fonte, largura_max):
+    chave = (texto, fonte, largura_max)
+    linhas = _quebras.get(chave)
+    if linhas is not None:
+        _quebras.move_to_end(chave)
+        return linhas
+
+    linhas = []
+    linha_atual = ""
+    for palavra in texto.split():
+        teste_linha = f"{linha_atual} {palavra}" if linha_atual else palavra
+        if not linha_atual or fonte.size(teste_linha)[0] <= largura_max:
+            linha_atual = teste_linha
+        else:
+            linhas.append(linha_atual)
+            linha_atual = palavra
+    if linha_atual:
+        linhas.append(linha_atual)
+
+    return _guardar(_quebras, chave, tuple(linhas), CAPACIDADE_QUEBRAS)
+
+"""
+    Renderiza um parágrafo com as linhas centralizadas em uma superfície transparente.
+
+    1. Quebra o texto com `quebrar_linhas`.
+    2. Renderiza cada linha uma única vez e a centraliza na largura `largura_max`.
+    3. Cada linha ocupa a altura da fonte mais `espaco` pixels.
+    4. Guarda a superfície pronta; enquanto o texto, a fonte, a cor e a largura forem os
+       mesmos, a mesma superfície é devolvida.
+
+    Parâmetros:
+        texto (str): O texto do parágrafo.
+        fonte (pygame.font.Font): A fonte do texto.
+        cor (tuple): A cor do texto.
+        largura_max (int): A largura do parágrafo, em pixels.
+        espaco (int): O espaço extra abaixo de cada linha.
+
+    Retorna:
+        pygame.Surface: O parágrafo renderizado.
+"""
+def renderizar_paragrafo(texto, fonte, cor, largura_max, espaco=5):
+    chave = (texto, fonte, cor, largura_max, espaco)
+    superficie = _paragrafos.get(chave)
+    if superficie is not None:
+        _paragrafos.move_to_end(chave)
+        return superficie
+
+    linhas = quebrar_linhas(texto, fonte, largura_max)
+    altura_linha = fonte.get_height() + espaco
+    largura = max([largura_max] + [fonte.size(linha)[0] for linha in linhas])
+    superficie = pygame.Surface((largura, altura_linha * len(linhas)), pygame.SRCALPHA)
+    for i, linha in enumerate(linhas):
+        texto_surface = fonte.render(linha, True, cor)
+        superficie.blit(texto_surface, texto_surface.get_rect(centerx=largura // 2, top=i * altura_linha))
+
+    return _guardar(_paragrafos, chave, superficie, CAPACIDADE_PARAGRAFOS)
+
+"""
+    Remove todas as quebras e parágrafos do cache (por exemplo, após trocar as fontes).
+"""
+def limpar():
+    _quebras.clear()
+    _paragrafos.clear()
@@ -0,0 +1,365 @@
+import math
+
+# Abaixo deste valor de k*t as diferenças (1 - e^(-kt)) e (e^(-kt) - 1 + kt)
+# perdem precisão por cancelamento, então usamos a série de Taylor.
+LIMITE_SERIE = 0.05
+
+# Comprimento máximo de cada parte do trecho examinado na colisão contínua, em frações
+# do raio, e limite de partes por trecho
+FRACAO_RAIO_CONTATO = 0.25
+MAX_PARTES_CONTATO = 256
+
+#---------------------------------------------------------------------------
+"""
+    Atualiza a posição e a velocidade de um objeto considerando a resistência do ar.
+
+    1. Converte o ângulo de lançamento para radianos.
+    2. Calcula os componentes da velocidade inicial nos eixos X e Y.
+    3. Aplica as equações diferenciais com resistência proporcional à velocidade para calcular:
+       - Velocidades nos eixos X e Y após o tempo `t`.
+       - Novas posições nos eixos X e Y após o tempo `t`.
+    4. Retorna a posição e a velocidade atualizadas.
+
+    Parâmetros:
+        t (float): O tempo transcorrido desde o início do movimento.
+        angulo (float): O ângulo de lançamento em graus, medido em relação ao eixo X.
+        velocidade_inicial (float): A velocidade inicial do objeto no instante do lançamento.
+        posicao_inicial_x (float): A posição inicial do objeto no eixo X.
+        posicao_inicial_y (float): A posição inicial do objeto no eixo Y.
+        g (float): A aceleração gravitacional (em metros por segundo ao quadrado).
+        k (float): A constante de resistência do ar, proporcional à velocidade.
+
+    Retorna:
+        tuple: Um par de tuplas contendo:
+            - A posição atual do objeto (x, y) na tela (eixo Y para baixo).
+            - A velocidade atual do objeto (velocidade_x, velocidade_y), com o eixo Y para cima.
+"""
+def atualizar_posicao_e_velocidade_com_resistencia(
+    t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k
+):
+    angulo_rad = math.radians(angulo)
+
+    # Componentes da velocidade inicial
+    velocidade_inicial_x = velocidade_inicial * math.cos(angulo_rad)
+    velocidade_inicial_y = velocidade_inicial * math.sin(angulo_rad)
+
+    # Calcula a nova velocidade com resistência
+    velocidade_x = velocidade_inicial_x * math.exp(-k * t)
+    velocidade_y = (velocidade_inicial_y + g / k) * math.exp(-k * t) - g / k
+
+    # Calcula nova posição
+    x = posicao_inicial_x + (velocidade_inicial_x / k) * (1 - math.exp(-k * t))
+    y = posicao_inicial_y - ((1 / k) * (velocidade_inicial_y + g / k) * (1 - math.exp(-k * t)) - (g * t / k))
+
+    return (x, y), (velocidade_x, velocidade_y)
+
+
+"""
+    Verifica se ocorreu colisão entre dois objetos.
+
+    1. Calcula a distância entre os centros dos dois objetos.
+    2. Compara a distância com a soma dos raios dos dois objetos para determinar se há colisão.
+
+    Parâmetros:
+        x1 (float): Coordenada X do centro do primeiro objeto.
+        y1 (float): Coordenada Y do centro do primeiro objeto.
+        x2 (float): Coordenada X do centro do segundo objeto.
+        y2 (float): Coordenada Y do centro do segundo objeto.
+        raio_objeto1 (float): Raio do primeiro objeto.
+        raio_objeto2 (float): Raio do segundo objeto.
+
+    Retorna:
+        bool: `True` se os objetos estiverem colidindo (ou seja, a distância entre seus centros for menor ou igual à soma dos seus raios), caso contrário, `False`.
+
+"""
+def verificar_colisao(x1, y1, x2, y2, raio_objeto1, raio_objeto2):
+    distancia = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return distancia <= (raio_objeto1 + raio_objeto2)
+
+
+"""
+    Calcula, de forma estável, os fatores phi1(z) = (1 - e^(-z)) / z e
+    phi2(z) = (e^(-z) - 1 + z) / z², além de e^(-z), com uma única chamada a `expm1`.
+
+    Para |z| pequeno usa a série de Taylor, o que também cobre o caso sem resistência (k = 0).
+
+    Parâmetros:
+        z (float): O produto k * t.
+
+    Retorna:
+        tuple: (e^(-z), phi1(z), phi2(z)).
+"""
+def _fatores_exponenciais(z):
+    if abs(z) < LIMITE_SERIE:
+        z2 = z * z
+        phi1 = 1 - z / 2 + z2 / 6 - z2 * z / 24 + z2 * z2 / 120 - z2 * z2 * z / 720
+        phi2 = 0.5 - z / 6 + z2 / 24 - z2 * z / 120 + z2 * z2 / 720 - z2 * z2 * z / 5040
+        return 1 - z * phi1, phi1, phi2
+    em1 = math.expm1(-z)
+    return em1 + 1, -em1 / z, (em1 + z) / (z * z)
+
+
+"""
+    Trajetória de um lançamento com resistência do ar linear, pré-calculada no momento do lançamento.
+
+    1. Converte o ângulo e decompõe a velocidade inicial uma única vez.
+    2. Avalia posição e velocidade em O(1) com uma única exponencial por chamada,
+       sem o cancelamento dos termos g / k quando k é muito pequeno (fase da Lua).
+    3. Fornece analiticamente o instante do ápice, o instante de retorno à altura
+       de lançamento e o instante em que o objeto sai da tela.
+
+    As posições seguem o sistema de coordenadas da tela (eixo Y para baixo) e as
+    velocidades seguem o referencial físico (eixo Y para cima), como em
+    `atualizar_posicao_e_velocidade_com_resistencia`.
+
+    Parâmetros:
+        angulo (float): O ângulo de lançamento em graus.
+        velocidade_inicial (float): A velocidade inicial do lançamento.
+        posicao_inicial_x (float): A posição inicial no eixo X.
+        posicao_inicial_y (float): A posição inicial no eixo Y.
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar (pode ser 0).
+"""
+class Trajetoria:
+    __slots__ = ("angulo", "velocidade_inicial", "x0", "y0", "g", "k", "vx0", "vy0")
+
+    def __init__(self, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k):
+        angulo_rad = math.radians(angulo)
+        self.angulo = angulo
+        self.velocidade_inicial = velocidade_inicial
+        self.x0 = posicao_inicial_x
+        self.y0 = posicao_inicial_y
+        self.g = g
+        self.k = k
+        self.vx0 = velocidade_inicial * math.cos(angulo_rad)
+        self.vy0 = velocidade_inicial * math.sin(angulo_rad)
+
+    """
+        Retorna a posição (x, y) na tela no instante `t`.
+    """
+    def posicao(self, t):
+        _, phi1, phi2 = _fatores_exponenciais(self.k * t)
+        x = self.x0 + self.vx0 * t * phi1
+        y = self.y0 - (self.vy0 * t * phi1 - self.g * t * t * phi2)
+        return x, y
+
+    """
+        Retorna a velocidade (velocidade_x, velocidade_y) no instante `t`, com o eixo Y para cima.
+    """
+    def velocidade(self, t):
+        e, phi1, _ = _fatores_exponenciais(self.k * t)
+        return self.vx0 * e, self.vy0 * e - self.g * t * phi1
+
+    """
+        Retorna posição e velocidade no instante `t`, no mesmo formato de
+        `atualizar_posicao_e_velocidade_com_resistencia`.
+    """
+    def estado(self, t):
+        e, phi1, phi2 = _fatores_exponenciais(self.k * t)
+        x = self.x0 + self.vx0 * t * phi1
+        y = self.y0 - (self.vy0 * t * phi1 - self.g * t * t * phi2)
+        return (x, y), (self.vx0 * e, self.vy0 * e - self.g * t * phi1)
+
+    """
+        Instante em que a velocidade vertical se anula (ponto mais alto da trajetória).
+
+        Retorna 0 se o lançamento não tem componente vertical para cima.
+    """
+    def tempo_apice(self):
+        if self.vy0 <= 0:
+            return 0.0
+        if self.g <= 0:
+            return math.inf
+        razao = self.vy0 / self.g
+        if self.k == 0:
+            return razao
+        return math.log1p(self.k * razao) / self.k
+
+    """
+        Retorna a posição (x, y) do ponto mais alto da trajetória.
+    """
+    def apice(self):
+        return self.posicao(self.tempo_apice())
+
+    """
+        Instante, após o ápice, em que o objeto desce até a coordenada de tela `y`.
+
+        1. Parte do ápice, onde a altura é máxima e a trajetória passa a ser
+           estritamente descendente.
+        2. Encontra um intervalo [a, b] que contém o instante procurado dobrando o passo.
+        3. Refina com Newton protegido por bissecção (a função é côncava no referencial físico).
+
+        Parâmetros:
+            y (float): A coordenada Y da tela que se deseja atingir.
+
+        Retorna:
+            float: O instante procurado, ou `math.inf` se ele nunca for atingido.
+    """
+    def tempo_descida_ate(self, y):
+        if self.g <= 0:
+            return math.inf
+        a = self.tempo_apice()
+        ya = self.posicao(a)[1]
+        if ya >= y:
+            return a
+
+        passo = max(a, 1.0)
+        b = a + passo
+        while self.posicao(b)[1] < y:
+            a = b
+            passo *= 2
+            b = a + passo
+
+        t = b
+        for _ in range(60):
+            (_, yt), (_, vy) = self.estado(t)
+            f = yt - y
+            if f > 0:
+                b = t
+            else:
+                a = t
+            # dy/dt na tela é -vy
+            if vy != 0:
+                t_novo = t + f / vy
+            else:
+                t_novo = (a + b) / 2
+            if not (a < t_novo < b):
+                t_novo = (a + b) / 2
+            if abs(t_novo - t) <= 1e-12 * max(1.0, t):
+                return t_novo
+            t = t_novo
+        return t
+
+    """
+        Instante em que o objeto volta à altura de lançamento (alcance horizontal).
+    """
+    def tempo_pouso(self):
+        if self.vy0 <= 0:
+            return 0.0
+        return self.tempo_descida_ate(self.y0)
+
+    """
+        Instante em que a coordenada X atinge `x`, ou `math.inf` se a assíntota
+        x0 + vx0 / k ficar antes de `x`.
+    """
+    def tempo_ate_x(self, x):
+        distancia = x - self.x0
+        if distancia <= 0:
+            return 0.0
+        if self.vx0 <= 0:
+            return math.inf
+        if self.k == 0:
+            return distancia / self.vx0
+        u = self.k * distancia / self.vx0
+        if u >= 1:
+            return math.inf
+        return -math.log1p(-u) / self.k
+
+    """
+        Instante a partir do qual o objeto está fora da tela, isto é, a partir do
+        qual `posicao_x > largura` ou `posicao_y > altura`.
+
+        Parâmetros:
+            largura (float): Largura da tela.
+            altura (float): Altura da tela.
+
+        Retorna:
+            float: O primeiro instante em que o objeto sai pela direita ou por baixo.
+    """
+    def tempo_saida_tela(self, largura, altura):
+        return min(self.tempo_ate_x(largura), self.tempo_descida_ate(altura))
+
+    """
+        Distância ao quadrado de (cx, cy) menos `raio2` no instante `t`, e metade da
+        sua derivada no tempo.
+    """
+    def _aproximacao(self, t, cx, cy, raio2):
+        (x, y), (vx, vy) = self.estado(t)
+        dx = x - cx
+        dy = y - cy
+        # A velocidade está com o eixo Y para cima; na tela, dy/dt é -vy
+        return dx * dx + dy * dy - raio2, dx * vx - dy * vy
+
+    """
+        Primeiro instante em [t0, t1] em que o objeto fica a uma distância de no máximo
+        `raio` do ponto de tela (cx, cy) (colisão contínua, sem depender do passo).
+
+        1. Fase ampla: descarta o trecho se o seu fim está mais longe do centro do que o
+           raio somado a um limite do comprimento do trecho (maior velocidade vezes duração).
+        2. Divide o trecho em partes de comprimento até `FRACAO_RAIO_CONTATO` * `raio`.
+        3. Em cada parte com as duas pontas fora do círculo, procura o ponto de maior
+           aproximação por bissecção na derivada da distância.
+        4. Refina o instante de contato por bissecção entre um instante fora e um
+           instante dentro do círculo.
+
+        Parâmetros:
+            cx (float): Coordenada X do centro do círculo, na tela.
+            cy (float): Coordenada Y do centro do círculo, na tela.
+            raio (float): A distância de contato.
+            t0 (float): Início do trecho.
+            t1 (float): Fim do trecho.
+            estado0 (tuple): `estado(t0)`, se já tiver sido calculado por quem chama.
+            estado1 (tuple): `estado(t1)`, se já tiver sido calculado por quem chama.
+
+        Retorna:
+            float: O instante do primeiro contato, ou None se não houver contato no trecho.
+    """
+    def tempo_contato(self, cx, cy, raio, t0, t1, estado0=None, estado1=None):
+        (x0, y0), (vx0, vy0) = estado0 or self.estado(t0)
+        (x1, y1), (vx1, vy1) = estado1 or self.estado(t1)
+
+        # Fase ampla: o trecho tem comprimento de no máximo `comprimento` (vx decresce e
+        # vy é monotônica), então não há contato se o fim dele está longe demais do centro
+        rapidez = max(abs(vx0), abs(vx1)) + max(abs(vy0), abs(vy1))
+        comprimento = rapidez * (t1 - t0)
+        dx = x1 - cx
+        dy = y1 - cy
+        alcance = raio + comprimento
+        if dx * dx + dy * dy > alcance * alcance:
+            return None
+
+        raio2 = raio * raio
+        dx = x0 - cx
+        dy = y0 - cy
+        if dx * dx + dy * dy <= raio2:
+            return t0
+        da = dx * vx0 - dy * vy0
+
+        partes = min(MAX_PARTES_CONTATO, max(1, math.ceil(comprimento / (FRACAO_RAIO_CONTATO * raio))))
+        duracao = (t1 - t0) / partes
+
+        a = t0
+        for i in range(1, partes + 1):
+            b = t1 if i == partes else t0 + i * duracao
+            fb, db = self._aproximacao(b, cx, cy, raio2)
+            if fb <= 0:
+                return self._refinar_contato(a, b, cx, cy, raio2)
+
+            # A distância diminui e volta a aumentar dentro da parte: procura o mínimo
+            if da < 0 < db:
+                inicio, fim = a, b
+                while fim - inicio > 1e-12 * max(1.0, fim):
+                    meio = (inicio + fim) / 2
+                    fm, dm = self._aproximacao(meio, cx, cy, raio2)
+                    if fm <= 0:
+                        return self._refinar_contato(a, meio, cx, cy, raio2)
+                    if dm < 0:
+                        inicio = meio
+                    else:
+                        fim = meio
+
+            a, da = b, db
+        return None
+
+    """
+        Bissecção entre `fora` (distância maior que o raio) e `dentro` (distância até o raio);
+        retorna o primeiro instante dentro do círculo, com tolerância relativa de 1e-12.
+    """
+    def _refinar_contato(self, fora, dentro, cx, cy, raio2):
+        while dentro - fora > 1e-12 * max(1.0, dentro):
+            meio = (fora + dentro) / 2
+            if self._aproximacao(meio, cx, cy, raio2)[0] <= 0:
+                dentro = meio
+            else:
+                fora = meio
+        return dentro
@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+
+from fisica import LIMITE_SERIE, Trajetoria, atualizar_posicao_e_velocidade_com_resistencia
+
+#---------------------------------------------------------------------------
+"""
+    Versão vetorizada de `_fatores_exponenciais` de `fisica.py`.
+
+    Calcula e^(-z), phi1(z) = (1 - e^(-z)) / z e phi2(z) = (e^(-z) - 1 + z) / z²
+    elemento a elemento, usando a série de Taylor onde |z| é pequeno. As
+    expressões seguem a mesma ordem de operações da versão escalar, para que os
+    resultados coincidam.
+
+    Parâmetros:
+        z (numpy.ndarray): O produto k * t.
+
+    Retorna:
+        tuple: Três arrays (e^(-z), phi1(z), phi2(z)) com o formato de `z`.
+"""
+def _fatores_exponenciais_lote(z):
+    pequeno = np.abs(z) < LIMITE_SERIE
+    z_seguro = np.where(pequeno, 1.0, z)
+    em1 = np.expm1(-z_seguro)
+
+    z2 = z * z
+    serie1 = 1 - z / 2 + z2 / 6 - z2 * z / 24 + z2 * z2 / 120 - z2 * z2 * z / 720
+    serie2 = 0.5 - z / 6 + z2 / 24 - z2 * z / 120 + z2 * z2 / 720 - z2 * z2 * z / 5040
+
+    phi1 = np.where(pequeno, serie1, -em1 / z_seguro)
+    phi2 = np.where(pequeno, serie2, (em1 + z_seguro) / (z_seguro * z_seguro))
+    e = np.where(pequeno, 1 - z * serie1, em1 + 1)
+    return e, phi1, phi2
+
+
+"""
+    Calcula posição e velocidade de vários lançamentos de uma só vez, sem laços em Python.
+
+    1. Converte todas as entradas para arrays de ponto flutuante e aplica broadcasting
+       (por exemplo, tempos com formato (N, 1) e ângulos com formato (M,) geram saídas (N, M)).
+    2. Decompõe as velocidades iniciais nos eixos X e Y.
+    3. Aplica as mesmas equações de `fisica.Trajetoria`, estáveis quando k -> 0.
+
+    Parâmetros:
+        t (array_like): Os tempos transcorridos desde o lançamento.
+        angulo (array_like): Os ângulos de lançamento em graus.
+        velocidade_inicial (array_like): As velocidades iniciais.
+        posicao_inicial_x (array_like): As posições iniciais no eixo X.
+        posicao_inicial_y (array_like): As posições iniciais no eixo Y.
+        g (array_like): As acelerações gravitacionais.
+        k (array_like): As constantes de resistência do ar (podem ser 0).
+
+    Retorna:
+        tuple: Um par de tuplas de arrays, no mesmo formato da versão escalar:
+            - (x, y): posições na tela (eixo Y para baixo).
+            - (velocidade_x, velocidade_y): velocidades com o eixo Y para cima.
+"""
+def atualizar_posicao_e_velocidade_em_lote(
+    t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k
+):
+    t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k = np.broadcast_arrays(
+        *(np.asarray(valor, dtype=np.float64)
+          for valor in (t, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k))
+    )
+
+    angulo_rad = np.radians(angulo)
+    velocidade_inicial_x = velocidade_inicial * np.cos(angulo_rad)
+    velocidade_inicial_y = velocidade_inicial * np.sin(angulo_rad)
+
+    e, phi1, phi2 = _fatores_exponenciais_lote(k * t)
+
+    x = posicao_inicial_x + velocidade_inicial_x * t * phi1
+    y = posicao_inicial_y - (velocidade_inicial_y * t * phi1 - g * t * t * phi2)
+    velocidade_x = velocidade_inicial_x * e
+    velocidade_y = velocidade_inicial_y * e - g * t * phi1
+
+    return (x, y), (velocidade_x, velocidade_y)
+
+
+"""
+    Confere a versão em lote contra as versões escalares em lançamentos aleatórios.
+
+    1. Sorteia tempos, ângulos, velocidades e ambientes dentro dos limites do jogo,
+       incluindo os valores de g e k das três fases.
+    2. Compara elemento a elemento com `Trajetoria.estado` (mesmas equações, deve
+       coincidir até o arredondamento) e com
+       `atualizar_posicao_e_velocidade_com_resistencia` (sujeita a cancelamento quando k é pequeno).
+
+    Parâmetros:
+        quantidade (int): Quantos lançamentos sortear.
+        semente (int): Semente do gerador aleatório.
+
+    Retorna:
+        tuple: (erro relativo máximo contra `Trajetoria`, erro relativo máximo contra a função escalar).
+"""
+def conferir_com_escalar(quantidade=2000, semente=0):
+    gerador = np.random.default_rng(semente)
+    ambientes = np.array([(9.81, 0.03), (1.62, 0.00001), (8.87, 0.3)])
+    escolhidos = ambientes[gerador.integers(0, len(ambientes), quantidade)]
+
+    t = gerador.uniform(0, 60, quantidade)
+    angulo = gerador.uniform(0, 90, quantidade)
+    velocidade_inicial = gerador.uniform(0, 600, quantidade)
+    g, k = escolhidos[:, 0], escolhidos[:, 1]
+
+    (x, y), (vx, vy) = atualizar_posicao_e_velocidade_em_lote(t, angulo, velocidade_inicial, 100, 550, g, k)
+
+    erro_trajetoria = 0.0
+    erro_escalar = 0.0
+    for i in range(quantidade):
+        lote = (x[i], y[i], vx[i], vy[i])
+        (xt, yt), (vxt, vyt) = Trajetoria(angulo[i], velocidade_inicial[i], 100, 550, g[i], k[i]).estado(t[i])
+        (xe, ye), (vxe, vye) = atualizar_posicao_e_velocidade_com_resistencia(
+            t[i], angulo[i], velocidade_inicial[i], 100, 550, g[i], k[i]
+        )
+        for a, b, c in zip(lote, (xt, yt, vxt, vyt), (xe, ye, vxe, vye)):
+            escala = max(1.0, abs(b))
+            erro_trajetoria = max(erro_trajetoria, abs(a - b) / escala)
+            erro_escalar = max(erro_escalar, abs(a - c) / escala)
+
+    return erro_trajetoria, erro_escalar
+
+
+if __name__ == '__main__':
+    erro_trajetoria, erro_escalar = conferir_com_escalar()
+    print(f"Erro relativo máximo contra Trajetoria: {erro_trajetoria:.3e}")
+    print(f"Erro relativo máximo contra a função escalar: {erro_escalar:.3e}")
+    if not (math.isfinite(erro_trajetoria) and erro_trajetoria <= 1e-12 and erro_escalar <= 1e-6):
+        raise SystemExit("A versão em lote diverge da versão escalar")
@@ -0,0 +1,431 @@
+import math
+
+from fisica import Trajetoria
+
+# Passo do RK4 e tolerâncias e passo inicial do Dormand–Prince
+PASSO_RK4 = 0.01
+TOLERANCIA_RELATIVA = 1e-9
+TOLERANCIA_ABSOLUTA = 1e-9
+PASSO_INICIAL = 0.01
+
+# Espaçamento entre os estados guardados pela trajetória integrada e duração máxima integrada
+INTERVALO_AMOSTRAS = 0.05
+TEMPO_MAXIMO = 600.0
+
+# Coeficientes do método de Dormand–Prince 5(4) (o sistema não depende de t, então os nós c não são usados)
+DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# Diferença entre as soluções de ordem 5 e de ordem 4 (estimativa do erro)
+DP_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+#---------------------------------------------------------------------------
+"""
+    Leis de arrasto. Cada lei calcula a derivada do estado [x, y, vx, vy] (eixo Y para
+    cima) e a escreve em uma lista já alocada, sem criar listas a cada chamada.
+
+    - Linear: a = -k v - g ŷ (a mesma física da solução fechada em `fisica.py`).
+    - Quadrática: a = -k |v| v - g ŷ (mais realista para uma cadeira arremessada).
+
+    Parâmetros:
+        g (float): A aceleração gravitacional.
+        k (float): O coeficiente de arrasto da lei.
+"""
+class ArrastoLinear:
+    nome = "linear"
+
+    def __init__(self, g, k):
+        self.g = g
+        self.k = k
+
+    def derivada(self, estado, saida):
+        vx = estado[2]
+        vy = estado[3]
+        saida[0] = vx
+        saida[1] = vy
+        saida[2] = -self.k * vx
+        saida[3] = -self.g - self.k * vy
+
+class ArrastoQuadratico(ArrastoLinear):
+    nome = "quadratico"
+
+    def derivada(self, estado, saida):
+        vx = estado[2]
+        vy = estado[3]
+        atrito = self.k * math.sqrt(vx * vx + vy * vy)
+        saida[0] = vx
+        saida[1] = vy
+        saida[2] = -atrito * vx
+        saida[3] = -self.g - atrito * vy
+
+# Leis de arrasto disponíveis pelo nome (usado na configuração de cada fase)
+LEIS_ARRASTO = {
+    "linear": ArrastoLinear,
+    "quadratico": ArrastoQuadratico,
+}
+
+"""
+    Integrador de Runge–Kutta clássico de quarta ordem, com passo fixo.
+
+    Os estágios e o estado intermediário ficam em listas alocadas uma vez; cada passo
+    atualiza o estado no lugar.
+
+    Parâmetros:
+        lei (ArrastoLinear): A lei que calcula a derivada do estado.
+        passo (float): O passo de tempo máximo.
+"""
+class IntegradorRK4:
+    def __init__(self, lei, passo=PASSO_RK4):
+        self.lei = lei
+        self.passo = passo
+        self.avaliacoes = 0
+        self._k1 = [0.0] * 4
+        self._k2 = [0.0] * 4
+        self._k3 = [0.0] * 4
+        self._k4 = [0.0] * 4
+        self._temporario = [0.0] * 4
+
+    """
+        Avança o estado no lugar por um passo `h`.
+    """
+    def dar_passo(self, estado, h):
+        derivada = self.lei.derivada
+        k1, k2, k3, k4, temporario = self._k1, self._k2, self._k3, self._k4, self._temporario
+
+        derivada(estado, k1)
+        for i in range(4):
+            temporario[i] = estado[i] + 0.5 * h * k1[i]
+        derivada(temporario, k2)
+        for i in range(4):
+            temporario[i] = estado[i] + 0.5 * h * k2[i]
+        derivada(temporario, k3)
+        for i in range(4):
+            temporario[i] = estado[i] + h * k3[i]
+        derivada(temporario, k4)
+        for i in range(4):
+            estado[i] += h / 6 * (k1[i] + 2 * k2[i] + 2 * k3[i] + k4[i])
+        self.avaliacoes += 4
+
+    """
+        Avança o estado no lugar de `t0` até `t1`, em passos iguais de no máximo `passo`.
+    """
+    def integrar(self, estado, t0, t1):
+        passos = max(1, math.ceil((t1 - t0) / self.passo - 1e-9))
+        h = (t1 - t0) / passos
+        for _ in range(passos):
+            self.dar_passo(estado, h)
+
+"""
+    Integrador adaptativo de Dormand–Prince 5(4).
+
+    1. Cada tentativa calcula sete estágios; o último é a derivada no novo estado e é
+       reaproveitado como primeiro estágio do passo seguinte (FSAL).
+    2. O erro estimado pela diferença entre as soluções de ordem 5 e 4 é comparado às
+       tolerâncias; o passo é aceito se a norma do erro for no máximo 1.
+    3. O próximo passo é ajustado por 0.9 · erro^(-1/5), limitado entre 0.2 e 5 vezes o atual.
+
+    Os estágios, o estado tentado e o erro ficam em listas alocadas uma vez.
+
+    Parâmetros:
+        lei (ArrastoLinear): A lei que calcula a derivada do estado.
+        tolerancia_relativa (float): Tolerância relativa do erro por passo.
+        tolerancia_absoluta (float): Tolerância absoluta do erro por passo.
+        passo_inicial (float): O primeiro passo tentado.
+"""
+class IntegradorDormandPrince:
+    def __init__(self, lei, tolerancia_relativa=TOLERANCIA_RELATIVA, tolerancia_absoluta=TOLERANCIA_ABSOLUTA,
+                 passo_inicial=PASSO_INICIAL):
+        self.lei = lei
+        self.tolerancia_relativa = tolerancia_relativa
+        self.tolerancia_absoluta = tolerancia_absoluta
+        self.passo = passo_inicial
+        self.avaliacoes = 0
+        self.passos_aceitos = 0
+        self.passos_rejeitados = 0
+        self._k = [[0.0] * 4 for _ in range(7)]
+        self._temporario = [0.0] * 4
+        self._novo = [0.0] * 4
+
+    """
+        Tenta um passo `h` a partir do estado, com `self._k[0]` já igual à derivada nele.
+
+        Retorna:
+            float: A norma do erro estimado; o estado tentado fica em `self._novo`.
+    """
+    def _tentar(self, estado, h):
+        derivada = self.lei.derivada
+        k = self._k
+        temporario = self._temporario
+
+        for estagio in range(1, 7):
+            coeficientes = DP_A[estagio]
+            destino = self._novo if estagio == 6 else temporario
+            for i in range(4):
+                soma = 0.0
+                for j in range(estagio):
+                    soma += coeficientes[j] * k[j][i]
+                destino[i] = estado[i] + h * soma
+            derivada(destino, k[estagio])
+        self.avaliacoes += 6
+
+        erro = 0.0
+        novo = self._novo
+        for i in range(4):
+            diferenca = 0.0
+            for j in range(7):
+                diferenca += DP_E[j] * k[j][i]
+            escala = self.tolerancia_absoluta + self.tolerancia_relativa * max(abs(estado[i]), abs(novo[i]))
+            erro += (h * diferenca / escala) ** 2
+        return math.sqrt(erro / 4)
+
+    """
+        Avança o estado no lugar de `t0` até exatamente `t1`, escolhendo os passos.
+        O passo sugerido ao final é mantido para a próxima chamada.
+    """
+    def integrar(self, estado, t0, t1):
+        k = self._k
+        self.lei.derivada(estado, k[0])
+        self.avaliacoes += 1
+
+        t = t0
+        while t < t1:
+            h = min(self.passo, t1 - t)
+            erro = self._tentar(estado, h)
+            fator = 5.0 if erro == 0 else min(5.0, max(0.2, 0.9 * erro ** -0.2))
+            if erro <= 1:
+                t = t1 if h == t1 - t else t + h
+                estado[:] = self._novo
+                # FSAL: a derivada no novo estado é o primeiro estágio do próximo passo
+                k[0], k[6] = k[6], k[0]
+                self.passos_aceitos += 1
+                # Um passo encurtado só para chegar em t1 não limita o próximo
+                if h == self.passo or fator < 1:
+                    self.passo = h * fator
+            else:
+                self.passo = h * fator
+                self.passos_rejeitados += 1
+
+"""
+    Trajetória obtida por integração numérica, com a mesma interface usada pela partida
+    que a `Trajetoria` de solução fechada (`posicao`, `velocidade`, `estado`,
+    `tempo_saida_tela` e `tempo_contato`).
+
+    1. Integra a partir do lançamento com o `IntegradorDormandPrince` e guarda o estado
+       (e a aceleração) a cada `INTERVALO_AMOSTRAS` segundos. A integração avança sob
+       demanda, apenas até o instante mais distante já consultado.
+    2. Entre duas amostras, posição e velocidade são interpoladas por polinômios de
+       Hermite cúbicos, usando a velocidade e a aceleração das amostras como derivadas.
+    3. O instante de saída da tela é encontrado por bissecção no trecho em que a
+       cadeira deixa a tela.
+
+    As posições seguem o sistema de coordenadas da tela (eixo Y para baixo) e as
+    velocidades seguem o referencial físico (eixo Y para cima), como em `Trajetoria`.
+
+    Parâmetros:
+        angulo (float): O ângulo de lançamento em graus.
+        velocidade_inicial (float): A velocidade inicial do lançamento.
+        posicao_inicial_x (float): A posição inicial no eixo X.
+        posicao_inicial_y (float): A posição inicial no eixo Y.
+        lei (ArrastoLinear): A lei de arrasto integrada.
+        intervalo (float): O espaçamento entre as amostras guardadas.
+"""
+class TrajetoriaIntegrada:
+    def __init__(self, angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, lei,
+                 intervalo=INTERVALO_AMOSTRAS):
+        angulo_rad = math.radians(angulo)
+        self.angulo = angulo
+        self.velocidade_inicial = velocidade_inicial
+        self.x0 = posicao_inicial_x
+        self.y0 = posicao_inicial_y
+        self.lei = lei
+        self.intervalo = intervalo
+        self.integrador = IntegradorDormandPrince(lei)
+
+        # Estado atual da integração: [x, y, vx, vy] com o eixo Y para cima
+        self._estado = [posicao_inicial_x, -posicao_inicial_y,
+                        velocidade_inicial * math.cos(angulo_rad), velocidade_inicial * math.sin(angulo_rad)]
+        self._derivada = [0.0] * 4
+        self.xs, self.ys, self.vxs, self.vys, self.axs, self.ays = [], [], [], [], [], []
+        self._guardar_amostra()
+
+    def _guardar_amostra(self):
+        estado, derivada = self._estado, self._derivada
+        self.lei.derivada(estado, derivada)
+        self.xs.append(estado[0])
+        self.ys.append(-estado[1])
+        self.vxs.append(estado[2])
+        self.vys.append(estado[3])
+        self.axs.append(derivada[2])
+        self.ays.append(derivada[3])
+
+    """
+        Integra até haver amostras que cubram o instante `t` (limitado a `TEMPO_MAXIMO`).
+    """
+    def _estender(self, t):
+        t = min(t, TEMPO_MAXIMO)
+        while (len(self.xs) - 1) * self.intervalo < t:
+            inicio = (len(self.xs) - 1) * self.intervalo
+            self.integrador.integrar(self._estado, inicio, inicio + self.intervalo)
+            self._guardar_amostra()
+
+    """
+        Retorna posição e velocidade no instante `t`, no mesmo formato de `Trajetoria.estado`.
+    """
+    def estado(self, t):
+        self._estender(t)
+        h = self.intervalo
+        i = min(int(t / h), len(self.xs) - 2)
+        s = t / h - i
+        s2 = s * s
+        s3 = s2 * s
+
+        # Bases de Hermite para o valor e para a derivada
+        h00 = 2 * s3 - 3 * s2 + 1
+        h10 = s3 - 2 * s2 + s
+        h01 = -2 * s3 + 3 * s2
+        h11 = s3 - s2
+        d00 = (6 * s2 - 6 * s) / h
+        d10 = 3 * s2 - 4 * s + 1
+        d01 = (-6 * s2 + 6 * s) / h
+        d11 = 3 * s2 - 2 * s
+
+        xs, ys, vxs, vys, axs, ays = self.xs, self.ys, self.vxs, self.vys, self.axs, self.ays
+        x = h00 * xs[i] + h * h10 * vxs[i] + h01 * xs[i + 1] + h * h11 * vxs[i + 1]
+        y = h00 * ys[i] - h * h10 * vys[i] + h01 * ys[i + 1] - h * h11 * vys[i + 1]
+        vx = h00 * vxs[i] + h * h10 * axs[i] + h01 * vxs[i + 1] + h * h11 * axs[i + 1]
+        vy = h00 * vys[i] + h * h10 * ays[i] + h01 * vys[i + 1] + h * h11 * ays[i + 1]
+        return (x, y), (vx, vy)
+
+    def posicao(self, t):
+        return self.estado(t)[0]
+
+    def velocidade(self, t):
+        return self.estado(t)[1]
+
+    """
+        Instante a partir do qual o objeto está fora da tela (`posicao_x > largura`
+        ou `posicao_y > altura`), como em `Trajetoria.tempo_saida_tela`.
+    """
+    def tempo_saida_tela(self, largura, altura):
+        # Integra amostra por amostra até alguma ficar fora da tela
+        i = 0
+        while True:
+            if self.xs[i] > largura or self.ys[i] > altura:
+                break
+            if i * self.intervalo >= TEMPO_MAXIMO:
+                return math.inf
+            i += 1
+            self._estender(i * self.intervalo)
+        if i == 0:
+            return 0.0
+
+        # Bissecção no trecho entre a última amostra dentro e a primeira fora da tela
+        dentro, fora = (i - 1) * self.intervalo, i * self.intervalo
+        while fora - dentro > 1e-12 * max(1.0, fora):
+            meio = (dentro + fora) / 2
+            x, y = self.posicao(meio)
+            if x > largura or y > altura:
+                fora = meio
+            else:
+                dentro = meio
+        return fora
+
+    # A colisão contínua só depende de `estado` e vale para qualquer lei de arrasto em
+    # que vx decresce e vy é monotônica, como as leis deste módulo
+    tempo_contato = Trajetoria.tempo_contato
+    _aproximacao = Trajetoria._aproximacao
+    _refinar_contato = Trajetoria._refinar_contato
+
+"""
+    Cria a trajetória de um lançamento com a lei de arrasto escolhida.
+
+    A lei linear usa a solução fechada (`Trajetoria`); as demais são integradas
+    numericamente (`TrajetoriaIntegrada`).
+
+    Parâmetros:
+        angulo (float): O ângulo de lançamento em graus.
+        velocidade_inicial (float): A velocidade inicial do lançamento.
+        posicao_inicial_x (float): A posição inicial no eixo X.
+        posicao_inicial_y (float): A posição inicial no eixo Y.
+        g (float): A aceleração gravitacional.
+        k (float): O coeficiente de arrasto.
+        arrasto (str): O nome da lei em `LEIS_ARRASTO`.
+
+    Retorna:
+        Trajetoria: A trajetória pronta para ser consultada.
+"""
+def criar_trajetoria(angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k, arrasto="linear"):
+    if arrasto == "linear":
+        return Trajetoria(angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y, g, k)
+    return TrajetoriaIntegrada(angulo, velocidade_inicial, posicao_inicial_x, posicao_inicial_y,
+                               LEIS_ARRASTO[arrasto](g, k))
+
+"""
+    Compara os integradores com a solução fechada do arrasto linear.
+
+    Para cada integrador e passo (ou tolerância), integra o mesmo lançamento de segundo em
+    segundo durante `duracao` segundos, mede o maior erro de posição em relação a `Trajetoria` e o
+    tempo gasto por segundo simulado.
+
+    Parâmetros:
+        duracao (float): O tempo simulado.
+        g (float): A aceleração gravitacional.
+        k (float): O coeficiente de arrasto linear.
+
+    Retorna:
+        list: Dicionários com o método, o parâmetro, o erro máximo (px), as avaliações da
+              derivada e o custo em microssegundos por segundo simulado.
+"""
+def comparar_com_solucao_fechada(duracao=20.0, g=8.87, k=0.3):
+    import time
+
+    referencia = Trajetoria(45, 300, 100, 550, g, k)
+    intervalo = 1.0
+    amostras = round(duracao / intervalo)
+    resultados = []
+
+    # Custo da própria solução fechada, como referência
+    inicio = time.perf_counter()
+    for i in range(1, amostras + 1):
+        referencia.estado(i * intervalo)
+    resultados.append({
+        "metodo": "fechada", "parametro": None, "erro_maximo": 0.0, "avaliacoes": 0,
+        "us_por_segundo": (time.perf_counter() - inicio) / duracao * 1e6,
+    })
+
+    configuracoes = [("rk4", passo, IntegradorRK4(ArrastoLinear(g, k), passo)) for passo in (0.5, 0.1, 0.01)]
+    configuracoes += [("dopri5", tolerancia, IntegradorDormandPrince(ArrastoLinear(g, k), tolerancia, tolerancia))
+                      for tolerancia in (1e-4, 1e-7, 1e-10)]
+    for metodo, parametro, integrador in configuracoes:
+        estado = [referencia.x0, -referencia.y0, referencia.vx0, referencia.vy0]
+        erro_maximo = 0.0
+        inicio = time.perf_counter()
+        for i in range(amostras):
+            integrador.integrar(estado, i * intervalo, (i + 1) * intervalo)
+            x, y = referencia.posicao((i + 1) * intervalo)
+            erro_maximo = max(erro_maximo, math.hypot(estado[0] - x, -estado[1] - y))
+        resultados.append({
+            "metodo": metodo, "parametro": parametro, "erro_maximo": erro_maximo,
+            "avaliacoes": integrador.avaliacoes,
+            "us_por_segundo": (time.perf_counter() - inicio) / duracao * 1e6,
+        })
+    return resultados
+
+if __name__ == '__main__':
+    print(f"{'método':<10}{'passo/tol':>11}{'erro máx (px)':>16}{'avaliações':>12}{'µs/s simulado':>16}")
+    for r in comparar_com_solucao_fechada():
+        parametro = "-" if r["parametro"] is None else f"{r['parametro']:g}"
+        print(f"{r['metodo']:<10}{parametro:>11}{r['erro_maximo']:>16.2e}{r['avaliacoes']:>12}{r['us_por_segundo']:>16.1f}")
+
+    # Confere a trajetória integrada (com interpolação) contra a solução fechada
+    fechada = Trajetoria(60, 250, 100, 550, 8.87, 0.3)
+    integrada = TrajetoriaIntegrada(60, 250, 100, 550, ArrastoLinear(8.87, 0.3))
+    erro = max(math.dist(fechada.posicao(t / 100), integrada.posicao(t / 100)) for t in range(2000))
+    saida = abs(fechada.tempo_saida_tela(1400, 800) - integrada.tempo_saida_tela(1400, 800))
+    print(f"trajetória integrada: erro máximo de posição {erro:.2e} px, erro no instante de saída {saida:.2e} s")
@@ -0,0 +1,265 @@
+import math
+
+from partida import TAMANHO_CADEIRA
+
+# Limites dos parâmetros de lançamento aceitos pelo jogo
+ANGULO_MAXIMO = 90
+VELOCIDADE_MAXIMA = 600
+
+# Abaixo deste valor de w, -w - ln(1 - w) é calculado pela série, sem cancelamento
+LIMITE_SERIE_MIRA = 0.05
+
+# Tolerância (em graus) das buscas pelo ângulo
+TOLERANCIA_ANGULO = 1e-7
+
+# Razão áurea usada na busca da velocidade mínima
+RAZAO_AUREA = (math.sqrt(5) - 1) / 2
+
+#---------------------------------------------------------------------------
+"""
+    Calcula -w - ln(1 - w) para w em [0, 1).
+
+    Para w pequeno, usa a série w²/2 + w³/3 + w⁴/4 + ..., que não sofre o cancelamento
+    entre w e ln(1 - w).
+"""
+def _perda_arrasto(w):
+    if w < LIMITE_SERIE_MIRA:
+        soma = 0.0
+        for n in range(16, 1, -1):
+            soma = soma * w + 1 / n
+        return soma * w * w
+    return -w - math.log1p(-w)
+
+"""
+    Resolve -w - ln(1 - w) = d para w em [0, 1), com d >= 0.
+
+    Esta é a equação cuja solução fechada usa a função W de Lambert. Em vez disso, usa
+    Newton partindo do valor sem arrasto (w = sqrt(2d)) ou da aproximação assintótica
+    (w = 1 - e^(-(d + 1))), o que for menor. Os dois ficam à direita da raiz e a função
+    é convexa e crescente, então Newton converge de forma monotônica, sem ultrapassar a raiz.
+    Quando d é tão grande que a aproximação assintótica arredonda para 1, ela já é exata
+    na precisão do ponto flutuante.
+"""
+def _resolver_arrasto(d):
+    if d <= 0:
+        return 0.0
+    w = min(math.sqrt(2 * d), -math.expm1(-(d + 1)))
+    if w >= 1:
+        return w
+    for _ in range(60):
+        passo = (_perda_arrasto(w) - d) * (1 - w) / w
+        w -= passo
+        if passo <= 1e-15 * w:
+            break
+    return w
+
+"""
+    Calcula o deslocamento do alvo em relação ao ponto de lançamento, no referencial
+    da cadeira (canto superior esquerdo), com o eixo Y para cima.
+
+    A colisão compara os centros da cadeira e do Marçal; por isso o alvo da trajetória
+    é o centro do Marçal deslocado de meia cadeira.
+
+    Parâmetros:
+        partida (Partida): A partida com as posições do lançamento e do Marçal.
+
+    Retorna:
+        tuple: (dx, dy), com dy positivo quando o alvo está acima do lançamento.
+"""
+def deslocamento_alvo(partida):
+    meia_cadeira = TAMANHO_CADEIRA // 2
+    meio_marcal = partida.tamanho_marcal // 2
+    alvo_x = partida.marcal_x + meio_marcal - meia_cadeira
+    alvo_y = partida.marcal_y + meio_marcal - meia_cadeira
+    return alvo_x - partida.posicao_inicial_x, partida.posicao_inicial_y - alvo_y
+
+"""
+    Calcula o tempo de voo e a velocidade inicial que levam a trajetória, lançada com
+    `angulo`, exatamente até o ponto (dx, dy).
+
+    1. Com arrasto linear, x(t) = vx0 (1 - e^(-kt)) / k. Chamando w = 1 - e^(-kt), a altura
+       no instante em que x = dx é dx tan(angulo) - (g / k²) (-w - ln(1 - w)).
+    2. Igualando a dy, resta -w - ln(1 - w) = (dx tan(angulo) - dy) k² / g, resolvida por
+       `_resolver_arrasto`; o tempo é -ln(1 - w) / k = (d + w) / k e a velocidade é
+       k dx / (w cos(angulo)).
+    3. Sem arrasto (k = 0), usa diretamente t = sqrt(2 (dx tan(angulo) - dy) / g).
+
+    Parâmetros:
+        angulo (float): O ângulo de lançamento em graus.
+        dx (float): Distância horizontal até o alvo.
+        dy (float): Altura do alvo em relação ao lançamento (eixo Y para cima).
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar.
+
+    Retorna:
+        tuple: (tempo, velocidade), ou None se o alvo não pode ser atingido com esse ângulo
+               (alvo acima da linha de visada ou atrás do lançamento).
+"""
+def tempo_e_velocidade(angulo, dx, dy, g, k):
+    if dx <= 0 or angulo >= 90:
+        return None
+    angulo_rad = math.radians(angulo)
+    cosseno = math.cos(angulo_rad)
+    folga = dx * math.tan(angulo_rad) - dy
+    if folga <= 0:
+        return None
+
+    if k == 0:
+        tempo = math.sqrt(2 * folga / g)
+        return tempo, dx / (cosseno * tempo)
+
+    d = folga * k * k / g
+    w = _resolver_arrasto(d)
+    return (d + w) / k, k * dx / (w * cosseno)
+
+"""
+    Retorna a velocidade inicial que atinge o alvo com o ângulo dado, ou None.
+"""
+def velocidade_para_angulo(angulo, dx, dy, g, k):
+    resultado = tempo_e_velocidade(angulo, dx, dy, g, k)
+    return None if resultado is None else resultado[1]
+
+"""
+    Intervalo de ângulos em que o alvo pode ser atingido: acima da linha de visada
+    e dentro do intervalo [0, 90] do jogo.
+"""
+def _angulos_validos(dx, dy):
+    return max(0.0, math.degrees(math.atan2(dy, dx))), float(ANGULO_MAXIMO)
+
+"""
+    Encontra o lançamento com a menor velocidade inicial que atinge o alvo.
+
+    1. A velocidade necessária tende ao infinito perto da linha de visada e perto da
+       vertical, com um único mínimo entre elas.
+    2. Busca esse mínimo pela razão áurea.
+
+    Parâmetros:
+        dx (float): Distância horizontal até o alvo.
+        dy (float): Altura do alvo em relação ao lançamento (eixo Y para cima).
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar.
+
+    Retorna:
+        tuple: (angulo, velocidade), ou None se o alvo não pode ser atingido dentro dos limites do jogo.
+"""
+def solucao_velocidade_minima(dx, dy, g, k):
+    if dx <= 0:
+        return None
+    inicio, fim = _angulos_validos(dx, dy)
+
+    def velocidade(angulo):
+        v = velocidade_para_angulo(angulo, dx, dy, g, k)
+        return math.inf if v is None else v
+
+    a = fim - RAZAO_AUREA * (fim - inicio)
+    b = inicio + RAZAO_AUREA * (fim - inicio)
+    va, vb = velocidade(a), velocidade(b)
+    while fim - inicio > TOLERANCIA_ANGULO:
+        if va < vb:
+            fim, b, vb = b, a, va
+            a = fim - RAZAO_AUREA * (fim - inicio)
+            va = velocidade(a)
+        else:
+            inicio, a, va = a, b, vb
+            b = inicio + RAZAO_AUREA * (fim - inicio)
+            vb = velocidade(b)
+
+    angulo = (inicio + fim) / 2
+    v = velocidade(angulo)
+    if v > VELOCIDADE_MAXIMA:
+        return None
+    return angulo, v
+
+"""
+    Encontra o lançamento que atinge o alvo no menor tempo, sem passar da velocidade máxima.
+
+    1. O tempo de voo cresce com o ângulo, então a solução é o menor ângulo cuja
+       velocidade necessária cabe no limite.
+    2. Entre a linha de visada (ou 0°) e o ângulo de velocidade mínima, a velocidade
+       necessária decresce; o ângulo procurado é encontrado por bissecção.
+
+    Parâmetros:
+        dx (float): Distância horizontal até o alvo.
+        dy (float): Altura do alvo em relação ao lançamento (eixo Y para cima).
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar.
+        velocidade_maxima (float): A maior velocidade inicial permitida.
+
+    Retorna:
+        tuple: (angulo, velocidade), ou None se o alvo não pode ser atingido dentro dos limites do jogo.
+"""
+def solucao_tempo_minimo(dx, dy, g, k, velocidade_maxima=VELOCIDADE_MAXIMA):
+    minima = solucao_velocidade_minima(dx, dy, g, k)
+    if minima is None or minima[1] > velocidade_maxima:
+        return None
+
+    inicio, _ = _angulos_validos(dx, dy)
+    v = velocidade_para_angulo(inicio, dx, dy, g, k)
+    if v is not None and v <= velocidade_maxima:
+        return inicio, v
+
+    # Bissecção entre um ângulo rápido demais e o ângulo de velocidade mínima
+    fim = minima[0]
+    while fim - inicio > TOLERANCIA_ANGULO:
+        meio = (inicio + fim) / 2
+        v = velocidade_para_angulo(meio, dx, dy, g, k)
+        if v is None or v > velocidade_maxima:
+            inicio = meio
+        else:
+            fim = meio
+    return fim, velocidade_para_angulo(fim, dx, dy, g, k)
+
+"""
+    Lista os lançamentos que atingem o alvo com ângulos em múltiplos de `passo`,
+    com a velocidade arredondada para múltiplos de `passo_velocidade`
+    (os valores que o jogador consegue alcançar com as setas).
+
+    Parâmetros:
+        dx (float): Distância horizontal até o alvo.
+        dy (float): Altura do alvo em relação ao lançamento (eixo Y para cima).
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar.
+        passo (float): O espaçamento entre os ângulos.
+        passo_velocidade (float): O arredondamento da velocidade.
+
+    Retorna:
+        list: Pares (angulo, velocidade) dentro dos limites do jogo, em ordem crescente de ângulo.
+"""
+def solucoes(dx, dy, g, k, passo=0.5, passo_velocidade=0.5):
+    inicio, fim = _angulos_validos(dx, dy)
+    resultado = []
+    for i in range(math.ceil(inicio / passo), math.floor(fim / passo) + 1):
+        angulo = i * passo
+        v = velocidade_para_angulo(angulo, dx, dy, g, k)
+        if v is not None:
+            v = round(v / passo_velocidade) * passo_velocidade
+            if v <= VELOCIDADE_MAXIMA:
+                resultado.append((angulo, v))
+    return resultado
+
+if __name__ == '__main__':
+    # Confere as soluções contra a trajetória e mede o tempo de cada chamada
+    import random
+    import time
+
+    from fisica import Trajetoria
+    from partida import FASES, POSICAO_INICIAL
+
+    gerador = random.Random(0)
+    x0, y0 = POSICAO_INICIAL
+    pior = 0.0
+    chamadas = 0
+    inicio = time.perf_counter()
+    for _ in range(500):
+        dx, dy = gerador.uniform(450, 1150), gerador.uniform(-175, 250)
+        for fase in FASES.values():
+            for solucao in (solucao_velocidade_minima(dx, dy, fase["g"], fase["k"]),
+                            solucao_tempo_minimo(dx, dy, fase["g"], fase["k"])):
+                chamadas += 1
+                if solucao is None:
+                    continue
+                trajetoria = Trajetoria(*solucao, x0, y0, fase["g"], fase["k"])
+                x, y = trajetoria.posicao(trajetoria.tempo_ate_x(x0 + dx))
+                pior = max(pior, abs((y0 - y) - dy))
+    duracao = time.perf_counter() - inicio
+    print(f"{chamadas} soluções, maior erro vertical {pior:.2e} px, {duracao / chamadas * 1e6:.0f} µs por solução")
@@ -0,0 +1,341 @@
+import random
+from collections import namedtuple
+
+from integradores import criar_trajetoria
+from perfil import perfilador
+
+# Dimensões padrão do campo de jogo (as mesmas da janela do jogo)
+LARGURA_CAMPO = 1400
+ALTURA_CAMPO = 800
+
+# Tamanho do sprite da cadeira e posição de lançamento
+TAMANHO_CADEIRA = 150
+POSICAO_INICIAL = (100, ALTURA_CAMPO - 250)
+POSICAO_INICIAL_MARCAL = (990, 550)
+
+# Parâmetros iniciais do lançamento e sensibilidade por passo (a 60 passos por segundo)
+ANGULO_INICIAL = 45
+VELOCIDADE_INICIAL = 50
+SENS_ANG = 0.5
+SENS_VEL = 0.5
+
+# Passos de jogo por segundo e tempo físico que avança a cada passo (nessa taxa)
+PASSOS_POR_SEGUNDO = 60
+PASSO_FISICA = 0.1
+
+# Configurações de cada dificuldade e de cada fase
+DIFICULDADES = {
+    1: {"nome": "Fácil", "tempo_total": 60, "meta_pontuacao": 15, "tamanho_marcal": 125},
+    2: {"nome": "Médio", "tempo_total": 60, "meta_pontuacao": 20, "tamanho_marcal": 100},
+    3: {"nome": "Difícil", "tempo_total": 30, "meta_pontuacao": 15, "tamanho_marcal": 75},
+}
+# "arrasto" escolhe a lei de resistência do ar em `integradores.LEIS_ARRASTO`
+FASES = {
+    1: {"nome": "Terra", "g": 9.81, "k": 0.03, "arrasto": "linear", "fundo": "images/debate.png"},
+    2: {"nome": "Lua", "g": 1.62, "k": 0.00001, "arrasto": "linear", "fundo": "images/lua2.png"},
+    3: {"nome": "Marte", "g": 8.87, "k": 0.3, "arrasto": "linear", "fundo": "images/marte.jpeg"},
+}
+
+# Estado das teclas lidas a cada passo
+Entrada = namedtuple("Entrada", ["cima", "baixo", "direita", "esquerda", "lancar", "reiniciar"])
+SEM_ENTRADA = Entrada(False, False, False, False, False, False)
+
+# Modos de jogo: uma cadeira por vez ("normal"), várias cadeiras no ar ("rajada", em `rajada.py`)
+# ou vários alvos em movimento ("alvos", em `alvos.py`)
+MODOS = ("normal", "rajada", "alvos")
+
+#---------------------------------------------------------------------------
+"""
+    Reposiciona o alvo em uma nova posição aleatória dentro de uma área predefinida.
+
+    1. Gera uma nova coordenada X aleatória dentro do intervalo [600, largura - 200].
+    2. Gera uma nova coordenada Y aleatória dentro do intervalo [300, altura - 150].
+    3. Retorna as novas coordenadas.
+
+    Parâmetros:
+        gerador (random.Random): O gerador de números aleatórios (por padrão, o módulo `random`).
+        largura (int): A largura do campo de jogo.
+        altura (int): A altura do campo de jogo.
+
+    Retorna:
+        tuple: Uma tupla contendo as novas coordenadas (x, y) do alvo.
+"""
+def reposicionar_marcal(gerador=random, largura=LARGURA_CAMPO, altura=ALTURA_CAMPO):
+    # Gera uma nova posição aleatória para o marcal
+    novo_x = gerador.randint(600, largura - 200)
+    novo_y = gerador.randint(300, altura - 150)
+    return novo_x, novo_y
+
+"""
+    Aplica o estado das teclas aos parâmetros do lançamento.
+
+    1. Ajusta o ângulo com as teclas para cima e para baixo.
+    2. Ajusta a velocidade inicial com as teclas para a direita e para a esquerda.
+    3. Marca o lançamento como ativado se a tecla de lançar estiver pressionada.
+    4. Define a intenção de reiniciar o jogo se a tecla de reiniciar estiver pressionada.
+    5. Limita o ângulo ao intervalo [0, 90] graus e a velocidade ao intervalo [0, 600].
+
+    Parâmetros:
+        entrada (Entrada): O estado das teclas no quadro atual.
+        sens_ang (float): A sensibilidade para ajustes no ângulo.
+        sens_vel (float): A sensibilidade para ajustes na velocidade inicial.
+        lancado (bool): Estado atual indicando se o lançamento já foi iniciado.
+        angulo (float): O ângulo atual do lançamento.
+        velocidade_inicial (float): A velocidade inicial atual do objeto.
+
+    Retorna:
+        tuple: Uma tupla contendo:
+            - angulo (float): O ângulo ajustado.
+            - velocidade_inicial (float): A velocidade inicial ajustada.
+            - lancado (bool): Se o lançamento está ativado.
+            - restart (bool): Se o jogo deve ser reiniciado.
+"""
+def aplicar_entrada(entrada, sens_ang, sens_vel, lancado, angulo, velocidade_inicial):
+    # Ajusta o ângulo
+    if entrada.cima:
+        angulo += sens_ang
+    if entrada.baixo:
+        angulo -= sens_ang
+
+    # Ajusta a velocidade
+    if entrada.direita:
+        velocidade_inicial += sens_vel
+    if entrada.esquerda:
+        velocidade_inicial -= sens_vel
+
+    if entrada.lancar:
+        lancado = True
+    restart = not entrada.reiniciar
+
+    angulo = max(0, min(90, angulo))
+    velocidade_inicial = max(0, min(600, velocidade_inicial))
+
+    return angulo, velocidade_inicial, lancado, restart
+
+"""
+    Estado e regras de uma partida, independentes de janela, imagens e relógio real.
+
+    1. Lê as configurações da dificuldade (tempo, meta, tamanho do alvo) e da fase (g, k e lei de arrasto).
+    2. A cada passo, em `avancar`:
+        - Encerra a partida quando o tempo acaba.
+        - Antes do lançamento, aplica a entrada do jogador e, ao lançar, pré-calcula a trajetória.
+        - Depois do lançamento, avança o tempo físico, verifica a colisão com o alvo
+          (pontuando e reposicionando o Marçal) e reinicia a cadeira quando ela sai do campo.
+          A colisão é contínua: considera todo o trecho percorrido desde o passo anterior,
+          então a cadeira não atravessa o alvo entre dois passos, mesmo em alta velocidade.
+
+    A partida avança em passos de duração fixa (1 / `passos_por_segundo` segundos de jogo)
+    e conta o próprio tempo pelo número de passos. O jogo com janela decide quantos passos
+    executar a partir do tempo real e a simulação sem janela executa os passos sem esperar,
+    de modo que as mesmas regras e os mesmos resultados valem nos dois casos.
+
+    Com uma taxa maior que 60, a física e a entrada são amostradas com mais frequência
+    (o tempo físico e os ajustes de ângulo e velocidade por passo diminuem na mesma proporção).
+
+    Parâmetros:
+        dificuldade (int): A dificuldade selecionada (1, 2 ou 3).
+        fases (int): A fase selecionada (1, 2 ou 3).
+        gerador (random.Random): O gerador usado para reposicionar o Marçal.
+        largura (int): A largura do campo de jogo.
+        altura (int): A altura do campo de jogo.
+        passos_por_segundo (int): Quantos passos formam um segundo de jogo.
+"""
+class Partida:
+    def __init__(self, dificuldade, fases, gerador=random, largura=LARGURA_CAMPO, altura=ALTURA_CAMPO,
+                 passos_por_segundo=PASSOS_POR_SEGUNDO):
+        config_dificuldade = DIFICULDADES[dificuldade]
+        config_fase = FASES[fases]
+
+        self.dificuldade = dificuldade
+        self.fases = fases
+        self.gerador = gerador
+        self.largura = largura
+        self.altura = altura
+
+        # Duração de cada passo e ajustes por passo na taxa escolhida
+        self.passos_por_segundo = passos_por_segundo
+        self.dt = 1 / passos_por_segundo
+        proporcao = PASSOS_POR_SEGUNDO / passos_por_segundo
+        self.passo_fisica = PASSO_FISICA * proporcao
+        self.sens_ang = SENS_ANG * proporcao
+        self.sens_vel = SENS_VEL * proporcao
+
+        self.g = config_fase["g"]
+        self.k = config_fase["k"]
+        self.arrasto = config_fase.get("arrasto", "linear")
+        self.tempo_total = config_dificuldade["tempo_total"]
+        self.meta_pontuacao = config_dificuldade["meta_pontuacao"]
+        self.tamanho_marcal = config_dificuldade["tamanho_marcal"]
+
+        self.angulo = ANGULO_INICIAL
+        self.velocidade_inicial = VELOCIDADE_INICIAL
+        self.posicao_inicial_x, self.posicao_inicial_y = POSICAO_INICIAL
+        self.posicao_x, self.posicao_y = POSICAO_INICIAL
+        # Velocidade da cadeira no último passo do voo (eixo Y para cima)
+        self.velocidade_x, self.velocidade_y = 0.0, 0.0
+        self.marcal_x, self.marcal_y = POSICAO_INICIAL_MARCAL
+
+        self.t = 0
+        self.lancado = False
+        self.trajetoria = None
+        self.tempo_saida = 0
+        self.estado_anterior = None
+        self.pontuacao = 0
+        self.lancamentos = 0
+        self.tempo_restante = self.tempo_total
+        self.passo = 0
+        self.ativa = True
+
+    """
+        Avança a partida em um passo.
+
+        Parâmetros:
+            entrada (Entrada): O estado das teclas no passo.
+
+        Retorna:
+            bool: `True` enquanto a partida continua ativa.
+    """
+    def avancar(self, entrada):
+        # Verifica se o tempo acabou
+        self.tempo_restante = self.tempo_total - self.passo // self.passos_por_segundo
+        if self.tempo_restante <= 0:
+            self.ativa = False
+            return False
+        self.passo += 1
+
+        saiu_do_campo = False
+        if not self.lancado:
+            self.angulo, self.velocidade_inicial, self.lancado, _ = aplicar_entrada(
+                entrada, self.sens_ang, self.sens_vel, self.lancado, self.angulo, self.velocidade_inicial
+            )
+            self.posicao_x, self.posicao_y = self.posicao_inicial_x, self.posicao_inicial_y
+
+            # Ao lançar, pré-calcula a trajetória e o instante em que ela sai do campo
+            if self.lancado:
+                self.lancamentos += 1
+                self.trajetoria = criar_trajetoria(
+                    self.angulo, self.velocidade_inicial,
+                    self.posicao_inicial_x, self.posicao_inicial_y, self.g, self.k, self.arrasto
+                )
+                self.tempo_saida = self.trajetoria.tempo_saida_tela(self.largura, self.altura)
+                self.velocidade_x, self.velocidade_y = self.trajetoria.estado(0)[1]
+                self.estado_anterior = None
+        else:
+            estado = self.trajetoria.estado(self.t)
+            self.posicao_x, self.posicao_y = estado[0]
+            self.velocidade_x, self.velocidade_y = estado[1]
+            saiu_do_campo = self.t > self.tempo_saida
+            t_anterior = max(0.0, self.t - self.passo_fisica)
+
+            # Verifica colisão com o alvo no trecho percorrido desde o passo anterior
+            perfilador.marcar("fisica")
+            tempo_acerto = self.testar_colisao(t_anterior, estado)
+            perfilador.marcar("colisao")
+            self.estado_anterior = estado
+            self.t += self.passo_fisica
+
+            if tempo_acerto is not None:
+                self.posicao_x, self.posicao_y = self.trajetoria.posicao(tempo_acerto)
+                self.pontuacao += 1
+                self.lancado = False
+                self.reposicionar_alvo()
+                self.t = 0
+
+        # Se o projétil sair do campo, reinicia
+        if self.lancado and saiu_do_campo:
+            self.lancado = False
+            self.posicao_x, self.posicao_y = self.posicao_inicial_x, self.posicao_inicial_y
+            self.t = 0
+
+        return True
+
+    """
+        Testa a colisão contínua entre a cadeira e o marcal no trecho [t_anterior, self.t]
+        (o centro do marcal é levado para o referencial do canto da cadeira).
+
+        Parâmetros:
+            t_anterior (float): Início do trecho.
+            estado (tuple): O estado da cadeira no fim do trecho.
+
+        Retorna:
+            float: O instante do acerto, ou None se não houver colisão no trecho.
+    """
+    def testar_colisao(self, t_anterior, estado):
+        meia_cadeira = TAMANHO_CADEIRA // 2
+        meio_marcal = self.tamanho_marcal // 2
+        return self.trajetoria.tempo_contato(
+            self.marcal_x + meio_marcal - meia_cadeira, self.marcal_y + meio_marcal - meia_cadeira,
+            0.6 * TAMANHO_CADEIRA + 0.25 * self.tamanho_marcal, t_anterior, self.t,
+            self.estado_anterior, estado
+        )
+
+    """
+        Reposiciona o marcal após um acerto.
+    """
+    def reposicionar_alvo(self):
+        self.marcal_x, self.marcal_y = reposicionar_marcal(self.gerador, self.largura, self.altura)
+
+    """
+        Avança vários passos mantendo a mesma entrada, com o mesmo resultado de chamar
+        `avancar` passo a passo.
+
+        1. Durante o voo, avança passo a passo até a cadeira acertar o alvo ou sair do campo.
+        2. Durante a mira, sem a tecla de lançar, aplica os ajustes de ângulo e velocidade
+           de todos os passos de uma vez (a soma limitada coincide com a soma passo a passo,
+           pois o ajuste tem sempre o mesmo sentido).
+        3. Para quando o tempo da partida acaba.
+
+        Parâmetros:
+            entrada (Entrada): O estado das teclas mantido durante os passos.
+            passos (int): Quantos passos avançar no máximo.
+
+        Retorna:
+            int: Quantos passos foram efetivamente avançados.
+    """
+    def avancar_varios(self, entrada, passos):
+        inicio = self.passo
+
+        if self.lancado or entrada.lancar:
+            while self.passo - inicio < passos and self.avancar(entrada):
+                if not self.lancado:
+                    break
+            return self.passo - inicio
+
+        # Passos restantes até o tempo acabar
+        fim = min(inicio + passos, self.tempo_total * self.passos_por_segundo)
+        if fim <= inicio:
+            self.avancar(entrada)
+            return 0
+
+        n = fim - inicio
+        self.angulo = max(0, min(90, self.angulo + n * self.sens_ang * (entrada.cima - entrada.baixo)))
+        self.velocidade_inicial = max(
+            0, min(600, self.velocidade_inicial + n * self.sens_vel * (entrada.direita - entrada.esquerda))
+        )
+        self.posicao_x, self.posicao_y = self.posicao_inicial_x, self.posicao_inicial_y
+        self.tempo_restante = self.tempo_total - (fim - 1) // self.passos_por_segundo
+        self.passo = fim
+        return n
+
+"""
+    Cria a partida do modo de jogo escolhido.
+
+    Os módulos dos outros modos só são importados quando escolhidos (o modo rajada usa NumPy).
+
+    Parâmetros:
+        modo (str): Um dos nomes em `MODOS`.
+        Os demais parâmetros são repassados para `Partida`.
+
+    Retorna:
+        Partida: A partida pronta para avançar.
+"""
+def criar_partida(modo, *argumentos, **opcoes):
+    if modo == "rajada":
+        from rajada import PartidaRajada
+        return PartidaRajada(*argumentos, **opcoes)
+    if modo == "alvos":
+        from alvos import PartidaAlvos
+        return PartidaAlvos(*argumentos, **opcoes)
+    if modo != "normal":
+        raise ValueError(f"Modo de jogo desconhecido: '{modo}'")
+    return Partida(*argumentos, **opcoes)
@@ -0,0 +1,155 @@
+import csv
+import json
+import time
+from collections import deque
+
+# Quantidade de quadros usados nos percentis (cerca de 10 s a 60 quadros por segundo)
+JANELA_QUADROS = 600
+
+# Quantidade de quadros guardados para exportar o traço (cerca de 1 min a 60 quadros por segundo)
+QUADROS_TRACO = 3600
+
+# Percentis exibidos e exportados
+PERCENTIS = (50, 95, 99)
+
+#---------------------------------------------------------------------------
+"""
+    Perfilador de quadros: mede quanto tempo cada etapa do quadro leva.
+
+    1. O código instrumentado chama `marcar(etapa)` ao terminar cada etapa; o tempo desde a
+       marca anterior é atribuído a essa etapa. Uma etapa marcada várias vezes no mesmo
+       quadro (por exemplo, a física de cada passo) tem os tempos somados.
+    2. `fechar_quadro` soma os tempos de cada etapa e guarda o total do quadro em uma janela
+       deslizante de `janela` quadros, usada para os percentis (`percentis`).
+    3. As marcas dos últimos `quadros_traco` quadros são guardadas para exportar em formato
+       de traço do Chrome (`exportar_traco`, aberto em chrome://tracing ou no Perfetto) ou CSV.
+    4. Desligado, cada marca custa apenas a chamada e um teste de `ativo`.
+
+    Parâmetros:
+        janela (int): Quadros considerados nos percentis.
+        quadros_traco (int): Quadros guardados para exportação.
+"""
+class Perfilador:
+    def __init__(self, janela=JANELA_QUADROS, quadros_traco=QUADROS_TRACO):
+        self.ativo = False
+        self.etapas = []
+        self.historico = deque(maxlen=janela)
+        self.total_quadros = 0
+        self.quadros = deque(maxlen=quadros_traco)
+        self._marcas = []
+        self._ultima = 0
+
+    def ligar(self):
+        self.ativo = True
+        self.iniciar_quadro()
+
+    def desligar(self):
+        self.ativo = False
+
+    def alternar(self):
+        if self.ativo:
+            self.desligar()
+        else:
+            self.ligar()
+        return self.ativo
+
+    """
+        Descarta as marcas do quadro atual e começa a contar a partir de agora
+        (por exemplo, quando a partida volta ao topo depois de outra tela).
+    """
+    def iniciar_quadro(self):
+        self._marcas = []
+        self._ultima = time.perf_counter_ns()
+
+    """
+        Atribui a `etapa` o tempo decorrido desde a marca anterior.
+    """
+    def marcar(self, etapa):
+        if not self.ativo:
+            return
+        agora = time.perf_counter_ns()
+        self._marcas.append((etapa, self._ultima, agora - self._ultima))
+        self._ultima = agora
+
+    """
+        Encerra o quadro atual, somando o tempo (em ms) de cada etapa.
+    """
+    def fechar_quadro(self):
+        if not self.ativo or not self._marcas:
+            return
+        totais = {}
+        for etapa, _, duracao in self._marcas:
+            if etapa not in totais:
+                totais[etapa] = 0.0
+                if etapa not in self.etapas:
+                    self.etapas.append(etapa)
+            totais[etapa] += duracao / 1e6
+        self.historico.append(totais)
+        self.quadros.append(self._marcas)
+        self.total_quadros += 1
+        self._marcas = []
+
+    """
+        Calcula os percentis do tempo de cada etapa e do quadro inteiro na janela deslizante.
+
+        Retorna:
+            dict: Para cada etapa (e para "quadro"), uma tupla com os percentis de `PERCENTIS`, em ms.
+    """
+    def percentis(self):
+        n = len(self.historico)
+        if n == 0:
+            return {}
+
+        def calcular(valores):
+            valores.sort()
+            # Percentil pelo posto mais próximo
+            return tuple(valores[max(0, -(-p * n // 100) - 1)] for p in PERCENTIS)
+
+        resultado = {etapa: calcular([q.get(etapa, 0.0) for q in self.historico]) for etapa in self.etapas}
+        resultado["quadro"] = calcular([sum(q.values()) for q in self.historico])
+        return resultado
+
+    """
+        Exporta os quadros guardados no formato de eventos de traço do Chrome.
+
+        Cada quadro vira um evento "quadro" que contém um evento por marca, com o tempo
+        em microssegundos desde o primeiro quadro guardado.
+
+        Parâmetros:
+            caminho (str): O arquivo JSON a ser criado.
+    """
+    def exportar_traco(self, caminho):
+        eventos = []
+        if self.quadros:
+            origem = self.quadros[0][0][1]
+            for numero, marcas in enumerate(self.quadros):
+                inicio = marcas[0][1]
+                fim = marcas[-1][1] + marcas[-1][2]
+                eventos.append({"name": "quadro", "cat": "quadro", "ph": "X", "pid": 0, "tid": 0,
+                                "ts": (inicio - origem) / 1e3, "dur": (fim - inicio) / 1e3,
+                                "args": {"quadro": numero}})
+                for etapa, inicio, duracao in marcas:
+                    eventos.append({"name": etapa, "cat": "etapa", "ph": "X", "pid": 0, "tid": 0,
+                                    "ts": (inicio - origem) / 1e3, "dur": duracao / 1e3})
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, arquivo)
+
+    """
+        Exporta os quadros guardados em CSV, com uma linha por marca.
+
+        Parâmetros:
+            caminho (str): O arquivo CSV a ser criado.
+    """
+    def exportar_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(["quadro", "etapa", "inicio_ms", "duracao_ms"])
+            if not self.quadros:
+                return
+            origem = self.quadros[0][0][1]
+            for numero, marcas in enumerate(self.quadros):
+                for etapa, inicio, duracao in marcas:
+                    escritor.writerow([numero, etapa, f"{(inicio - origem) / 1e6:.4f}", f"{duracao / 1e6:.4f}"])
+
+# Perfilador compartilhado pelo jogo
+perfilador = Perfilador()
@@ -0,0 +1,136 @@
+import time
+from collections import deque
+
+# Níveis de qualidade, do mais leve ao mais completo; cada nível acima carimba o traçado com
+# o dobro da frequência e liga outro custo por quadro (rotação da cadeira, antialiasing dos textos):
+#   intervalo_tracado: carimba um ponto do traçado a cada tantos passos de voo
+#   texto_suavizado: textos da interface com antialiasing
+#   pontos_previsao: pontos da linha que prevê a trajetória durante a mira
+#   cadeira_girada: desenha a cadeira girada na direção da velocidade durante o voo
+NIVEIS = (
+    {"nome": "mínima", "intervalo_tracado": 12, "texto_suavizado": False, "pontos_previsao": 16, "cadeira_girada": False},
+    {"nome": "baixa", "intervalo_tracado": 6, "texto_suavizado": False, "pontos_previsao": 32, "cadeira_girada": True},
+    {"nome": "alta", "intervalo_tracado": 3, "texto_suavizado": True, "pontos_previsao": 64, "cadeira_girada": True},
+)
+
+# Tempo de um quadro a 60 quadros por segundo (em ms)
+ORCAMENTO_QUADRO_MS = 1000 / 60
+
+# Percentil do tempo de trabalho dos quadros comparado com o orçamento
+PERCENTIL_GOVERNADOR = 90
+
+# Desce um nível quando o percentil passa desta fração do orçamento em `QUADROS_DESCER` quadros
+FRACAO_DESCER = 0.9
+QUADROS_DESCER = 30
+
+# Sobe um nível quando o percentil fica abaixo desta fração do orçamento em `QUADROS_SUBIR` quadros;
+# se a subida for desfeita logo em seguida, a espera para a próxima subida dobra (até `QUADROS_SUBIR_MAXIMO`)
+FRACAO_SUBIR = 0.6
+QUADROS_SUBIR = 180
+QUADROS_SUBIR_MAXIMO = 3600
+
+#---------------------------------------------------------------------------
+"""
+    Governador de qualidade: ajusta o nível de qualidade pelo tempo medido dos quadros.
+
+    1. Recebe, a cada quadro, o tempo de trabalho (atualizar e desenhar, sem a espera do
+       relógio) e o guarda em uma janela deslizante.
+    2. Desce um nível assim que o percentil `PERCENTIL_GOVERNADOR` dos últimos
+       `QUADROS_DESCER` quadros passa de `FRACAO_DESCER` do orçamento.
+    3. Sobe um nível só depois de `espera_subir` quadros seguidos com o percentil abaixo de
+       `FRACAO_SUBIR` do orçamento. A diferença entre as duas frações e entre as duas
+       janelas é a histerese, que evita alternar de nível a cada quadro.
+    4. Se um nível recém-alcançado por uma subida é abandonado antes de completar
+       `QUADROS_SUBIR` quadros, a espera para a próxima subida dobra; ela volta ao normal
+       depois de uma subida que se mantém.
+    5. Depois de cada troca, a janela é esvaziada: o novo nível é avaliado só com quadros
+       medidos nele.
+    6. Cada troca é guardada em `transicoes` e registrada com `registrar` (por padrão, `print`).
+
+    Parâmetros:
+        nivel (int): O nível inicial (índice em `NIVEIS`).
+        orcamento_ms (float): O tempo de um quadro na taxa desejada.
+        registrar (callable): Recebe a linha de texto de cada troca, ou None para não registrar.
+"""
+class GovernadorQualidade:
+    def __init__(self, nivel=len(NIVEIS) - 1, orcamento_ms=ORCAMENTO_QUADRO_MS, registrar=print):
+        self.nivel = nivel
+        self.orcamento_ms = orcamento_ms
+        self.registrar = registrar
+        self.ativo = True
+        self.total_quadros = 0
+        self.transicoes = []
+        self.espera_subir = QUADROS_SUBIR
+        self._tempos = deque(maxlen=QUADROS_SUBIR_MAXIMO)
+        self._subiu_em = None
+
+    @property
+    def configuracao(self):
+        return NIVEIS[self.nivel]
+
+    def _percentil(self, quadros):
+        tempos = sorted(list(self._tempos)[-quadros:])
+        return tempos[max(0, -(-PERCENTIL_GOVERNADOR * len(tempos) // 100) - 1)]
+
+    """
+        Registra o tempo de trabalho de um quadro e troca de nível se for o caso.
+
+        Parâmetros:
+            tempo_ms (float): O tempo de trabalho do quadro, em ms.
+
+        Retorna:
+            bool: `True` se o nível mudou (a configuração deve ser aplicada de novo).
+    """
+    def registrar_quadro(self, tempo_ms):
+        self.total_quadros += 1
+        if not self.ativo:
+            return False
+        self._tempos.append(tempo_ms)
+
+        if self.nivel > 0 and len(self._tempos) >= QUADROS_DESCER:
+            percentil = self._percentil(QUADROS_DESCER)
+            if percentil > FRACAO_DESCER * self.orcamento_ms:
+                # Uma subida desfeita logo em seguida dobra a espera pela próxima
+                if self._subiu_em is not None and self.total_quadros - self._subiu_em < QUADROS_SUBIR:
+                    self.espera_subir = min(2 * self.espera_subir, QUADROS_SUBIR_MAXIMO)
+                self._subiu_em = None
+                self._trocar(self.nivel - 1, percentil)
+                return True
+
+        if self.nivel < len(NIVEIS) - 1 and len(self._tempos) >= self.espera_subir:
+            percentil = self._percentil(self.espera_subir)
+            if percentil < FRACAO_SUBIR * self.orcamento_ms:
+                self._subiu_em = self.total_quadros
+                self._trocar(self.nivel + 1, percentil)
+                return True
+
+        # Uma subida que se manteve devolve a espera ao valor normal
+        if self._subiu_em is not None and self.total_quadros - self._subiu_em >= QUADROS_SUBIR:
+            self._subiu_em = None
+            self.espera_subir = QUADROS_SUBIR
+        return False
+
+    def _trocar(self, nivel, percentil):
+        transicao = {
+            "quadro": self.total_quadros,
+            "instante": time.time(),
+            "de": NIVEIS[self.nivel]["nome"],
+            "para": NIVEIS[nivel]["nome"],
+            f"p{PERCENTIL_GOVERNADOR}_ms": round(percentil, 2),
+        }
+        self.transicoes.append(transicao)
+        self.nivel = nivel
+        self._tempos.clear()
+        if self.registrar is not None:
+            self.registrar(f"[qualidade] quadro {transicao['quadro']}: {transicao['de']} -> {transicao['para']} "
+                           f"(p{PERCENTIL_GOVERNADOR} {percentil:.2f} ms, orçamento {self.orcamento_ms:.2f} ms)")
+
+    """
+        Descarta os tempos medidos (por exemplo, ao começar uma partida ou voltar de outra
+        tela), sem trocar de nível.
+    """
+    def reiniciar_janela(self):
+        self._tempos.clear()
+
+# Governador compartilhado pelo jogo (o nível alcançado vale para as partidas seguintes)
+governador = GovernadorQualidade()
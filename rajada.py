@@ -0,0 +1,297 @@
+import numpy as np
+
+from fisica_lote import _fatores_exponenciais_lote
+from partida import TAMANHO_CADEIRA, Partida, aplicar_entrada, reposicionar_marcal
+from perfil import perfilador
+
+# Tamanho (em pixels) de cada cadeira da rajada, menor que a cadeira do modo normal
+TAMANHO_CADEIRA_RAJADA = 40
+
+# Cadeiras lançadas em cada disparo, espalhadas em ângulo em torno da mira (em graus)
+CADEIRAS_POR_DISPARO = 16
+ESPALHAMENTO_DISPARO = 6.0
+
+# Tempo mínimo entre dois disparos enquanto a tecla de lançar fica pressionada (em s de jogo)
+INTERVALO_DISPARO = 0.1
+
+# Capacidade inicial dos arrays; dobra quando enche
+CAPACIDADE_RAJADA = 1024
+
+# Cor usada como transparente nos sprites da rajada (não aparece na imagem da cadeira)
+CHAVE_SPRITE = (255, 0, 255)
+
+#---------------------------------------------------------------------------
+"""
+    Cadeiras em voo guardadas como estrutura de arrays do NumPy (um array contíguo por campo).
+
+    1. Cada cadeira guarda apenas os parâmetros da solução fechada do arrasto linear
+       (posição e velocidade iniciais) e o próprio tempo de voo; a posição de todas é
+       calculada de uma vez a cada passo, com as mesmas equações de `fisica.Trajetoria`.
+    2. A colisão com o alvo é testada em lote e de forma contínua: para cada cadeira, o
+       segmento percorrido no passo é comparado com o círculo do alvo (ponto do segmento
+       mais próximo do centro).
+    3. Cadeiras que acertam o alvo ou saem pela direita ou por baixo do campo (de onde não
+       voltam) são removidas, e as restantes são compactadas no início dos arrays; só as
+       `quantidade` primeiras posições são válidas.
+
+    Parâmetros:
+        g (float): A aceleração gravitacional.
+        k (float): A constante de resistência do ar (pode ser 0).
+        capacidade (int): Tamanho inicial dos arrays.
+"""
+class LoteCadeiras:
+    CAMPOS = ("x0", "y0", "vx0", "vy0", "t", "x", "y")
+
+    def __init__(self, g, k, capacidade=CAPACIDADE_RAJADA):
+        self.g = g
+        self.k = k
+        self.quantidade = 0
+        for campo in self.CAMPOS:
+            setattr(self, campo, np.zeros(capacidade))
+
+    def __len__(self):
+        return self.quantidade
+
+    def _garantir_capacidade(self, necessaria):
+        capacidade = len(self.x)
+        if necessaria <= capacidade:
+            return
+        while capacidade < necessaria:
+            capacidade *= 2
+        for campo in self.CAMPOS:
+            antigo = getattr(self, campo)
+            novo = np.zeros(capacidade)
+            novo[:self.quantidade] = antigo[:self.quantidade]
+            setattr(self, campo, novo)
+
+    """
+        Acrescenta cadeiras lançadas do mesmo ponto.
+
+        Parâmetros:
+            x0 (float): Posição inicial no eixo X.
+            y0 (float): Posição inicial no eixo Y (eixo Y para baixo).
+            angulos (array_like): Ângulos de lançamento em graus.
+            velocidades (array_like): Velocidades iniciais.
+    """
+    def lancar(self, x0, y0, angulos, velocidades):
+        angulos, velocidades = np.broadcast_arrays(np.asarray(angulos, dtype=np.float64),
+                                                   np.asarray(velocidades, dtype=np.float64))
+        novas = angulos.size
+        inicio, fim = self.quantidade, self.quantidade + novas
+        self._garantir_capacidade(fim)
+
+        angulos_rad = np.radians(angulos.ravel())
+        self.x0[inicio:fim] = x0
+        self.y0[inicio:fim] = y0
+        self.vx0[inicio:fim] = velocidades.ravel() * np.cos(angulos_rad)
+        self.vy0[inicio:fim] = velocidades.ravel() * np.sin(angulos_rad)
+        self.t[inicio:fim] = 0.0
+        self.x[inicio:fim] = x0
+        self.y[inicio:fim] = y0
+        self.quantidade = fim
+
+    """
+        Avança todas as cadeiras em `dt`, testa a colisão com o alvo e remove as que acertaram
+        ou saíram do campo.
+
+        Parâmetros:
+            dt (float): O tempo físico do passo.
+            centro_x (float): Centro do alvo no eixo X, no referencial das cadeiras.
+            centro_y (float): Centro do alvo no eixo Y, no referencial das cadeiras.
+            raio (float): Distância entre os centros a partir da qual há colisão.
+            largura (int): A largura do campo.
+            altura (int): A altura do campo.
+
+        Retorna:
+            int: Quantas cadeiras acertaram o alvo.
+    """
+    def avancar(self, dt, centro_x, centro_y, raio, largura, altura):
+        n = self.quantidade
+        if n == 0:
+            return 0
+
+        t = self.t[:n]
+        t += dt
+        x, y = self.x[:n], self.y[:n]
+        x_anterior, y_anterior = x.copy(), y.copy()
+
+        _, phi1, phi2 = _fatores_exponenciais_lote(self.k * t)
+        np.multiply(self.vx0[:n] * t, phi1, out=x)
+        x += self.x0[:n]
+        np.subtract(self.y0[:n], self.vy0[:n] * t * phi1 - self.g * t * t * phi2, out=y)
+
+        # Ponto do segmento percorrido no passo mais próximo do centro do alvo
+        dx, dy = x - x_anterior, y - y_anterior
+        fx, fy = x_anterior - centro_x, y_anterior - centro_y
+        comprimento2 = dx * dx + dy * dy
+        fracao = np.clip(-(fx * dx + fy * dy) / np.where(comprimento2 > 0, comprimento2, 1.0), 0.0, 1.0)
+        px, py = fx + fracao * dx, fy + fracao * dy
+        acertos = px * px + py * py <= raio * raio
+
+        # O movimento horizontal nunca muda de sentido e, ao passar da borda de baixo, a cadeira
+        # já está descendo; nos dois casos ela não volta ao campo
+        vivas = ~(acertos | (x > largura) | (y > altura))
+        restantes = int(np.count_nonzero(vivas))
+        if restantes < n:
+            for campo in self.CAMPOS:
+                array = getattr(self, campo)
+                array[:restantes] = array[:n][vivas]
+            self.quantidade = restantes
+        return int(np.count_nonzero(acertos))
+
+    """
+        Desenha todas as cadeiras com uma única chamada a `Surface.blits`. Quando a tela tem
+        uma área de recorte (por exemplo, ao recompor um texto no `Compositor`), só as cadeiras
+        que a tocam são desenhadas, com o filtro feito em lote.
+
+        Parâmetros:
+            tela (pygame.Surface): A superfície onde desenhar.
+            sprite (pygame.Surface): A imagem de cada cadeira.
+
+        Retorna:
+            pygame.Rect: A região que contém todas as cadeiras (vazia se não houver nenhuma).
+    """
+    def desenhar(self, tela, sprite):
+        import pygame
+
+        n = self.quantidade
+        if n == 0:
+            return pygame.Rect(0, 0, 0, 0)
+        xs = self.x[:n].astype(np.int32)
+        ys = self.y[:n].astype(np.int32)
+        largura, altura = sprite.get_size()
+
+        recorte = tela.get_clip()
+        if recorte != tela.get_rect():
+            visiveis = ((xs < recorte.right) & (xs + largura > recorte.left)
+                        & (ys < recorte.bottom) & (ys + altura > recorte.top))
+            desenhadas = zip(xs[visiveis].tolist(), ys[visiveis].tolist())
+        else:
+            desenhadas = zip(xs.tolist(), ys.tolist())
+        tela.blits([(sprite, posicao) for posicao in desenhadas], doreturn=False)
+
+        esquerda, topo = int(xs.min()), int(ys.min())
+        return pygame.Rect(esquerda, topo, int(xs.max()) - esquerda + largura,
+                           int(ys.max()) - topo + altura).clip(tela.get_rect())
+
+"""
+    Converte um sprite com transparência por pixel em um sprite opaco com cor transparente
+    (`CHAVE_SPRITE`) e aceleração RLE, bem mais rápido de desenhar milhares de vezes por
+    quadro. Os pixels com alfa abaixo de 128 viram transparentes e os demais, opacos.
+
+    Parâmetros:
+        superficie (pygame.Surface): O sprite original, com canal alfa.
+
+    Retorna:
+        pygame.Surface: O sprite convertido para o formato da tela.
+"""
+def preparar_sprite(superficie):
+    import pygame
+
+    sprite = superficie.convert()
+    mascara = pygame.mask.from_surface(superficie, 127)
+    mascara.invert()
+    mascara.to_surface(sprite, setcolor=CHAVE_SPRITE, unsetcolor=None)
+    sprite.set_colorkey(CHAVE_SPRITE, pygame.RLEACCEL)
+    return sprite
+
+"""
+    Partida no modo rajada: várias cadeiras voando ao mesmo tempo.
+
+    1. A mira funciona como no modo normal, mas a cadeira de mira nunca sai do lugar.
+    2. Enquanto a tecla de lançar está pressionada, dispara `CADEIRAS_POR_DISPARO` cadeiras
+       espalhadas em ângulo a cada `INTERVALO_DISPARO` segundos de jogo.
+    3. As cadeiras em voo ficam em um `LoteCadeiras`, atualizado e testado contra o Marçal em
+       lote a cada passo. Cada passo com acertos vale um ponto, por mais cadeiras que acertem
+       nele, e o Marçal é reposicionado uma vez; assim, um único disparo não alcança a meta.
+    4. Usa a solução fechada do arrasto linear; fases com outra lei de arrasto não são aceitas.
+
+    Os parâmetros são os mesmos de `Partida`.
+"""
+class PartidaRajada(Partida):
+    def __init__(self, *argumentos, **opcoes):
+        super().__init__(*argumentos, **opcoes)
+        if self.arrasto != "linear":
+            raise ValueError(f"O modo rajada usa a solução fechada do arrasto linear, não '{self.arrasto}'")
+        self.cadeiras = LoteCadeiras(self.g, self.k)
+        self.passos_entre_disparos = max(1, round(INTERVALO_DISPARO * self.passos_por_segundo))
+        self.ultimo_disparo = None
+
+    """
+        Avança a partida em um passo (veja `Partida.avancar`).
+    """
+    def avancar(self, entrada):
+        self.tempo_restante = self.tempo_total - self.passo // self.passos_por_segundo
+        if self.tempo_restante <= 0:
+            self.ativa = False
+            return False
+        self.passo += 1
+
+        self.angulo, self.velocidade_inicial, disparar, _ = aplicar_entrada(
+            entrada, self.sens_ang, self.sens_vel, False, self.angulo, self.velocidade_inicial
+        )
+        if disparar and (self.ultimo_disparo is None
+                         or self.passo - self.ultimo_disparo >= self.passos_entre_disparos):
+            self.ultimo_disparo = self.passo
+            self.lancamentos += 1
+            # As cadeiras da rajada saem do centro da cadeira de mira
+            deslocamento = (TAMANHO_CADEIRA - TAMANHO_CADEIRA_RAJADA) / 2
+            self.cadeiras.lancar(
+                self.posicao_inicial_x + deslocamento, self.posicao_inicial_y + deslocamento,
+                self.angulo + np.linspace(-ESPALHAMENTO_DISPARO, ESPALHAMENTO_DISPARO, CADEIRAS_POR_DISPARO),
+                self.velocidade_inicial
+            )
+        perfilador.marcar("fisica")
+
+        meia_cadeira = TAMANHO_CADEIRA_RAJADA / 2
+        meio_marcal = self.tamanho_marcal / 2
+        acertos = self.cadeiras.avancar(
+            self.passo_fisica,
+            self.marcal_x + meio_marcal - meia_cadeira, self.marcal_y + meio_marcal - meia_cadeira,
+            0.6 * TAMANHO_CADEIRA_RAJADA + 0.25 * self.tamanho_marcal, self.largura, self.altura
+        )
+        perfilador.marcar("colisao")
+        if acertos:
+            # Um ponto por passo com acertos, como no modo normal: as cadeiras de um mesmo
+            # disparo que chegam juntas ao Marçal não somam pontos separados
+            self.pontuacao += 1
+            self.marcal_x, self.marcal_y = reposicionar_marcal(self.gerador, self.largura, self.altura)
+        return True
+
+    """
+        Avança vários passos com a mesma entrada (veja `Partida.avancar_varios`). Sem cadeiras
+        no ar e sem disparar, a mira é avançada de uma vez; caso contrário, passo a passo.
+    """
+    def avancar_varios(self, entrada, passos):
+        if not self.cadeiras and not entrada.lancar:
+            return super().avancar_varios(entrada, passos)
+        inicio = self.passo
+        while self.passo - inicio < passos and self.avancar(entrada):
+            pass
+        return self.passo - inicio
+
+if __name__ == '__main__':
+    # Mede o custo de um passo com milhares de cadeiras no ar, contra um laço por cadeira
+    import math
+    import time
+
+    from fisica import Trajetoria
+    from partida import FASES
+
+    g, k = FASES[1]["g"], FASES[1]["k"]
+    for quantidade in (1000, 5000, 20000):
+        lote = LoteCadeiras(g, k)
+        lote.lancar(100, 550, np.linspace(20, 70, quantidade), 150)
+        inicio = time.perf_counter()
+        for _ in range(60):
+            lote.avancar(0.1 / 60, 2000, 2000, 1, 10**6, 10**6)
+        por_passo = (time.perf_counter() - inicio) / 60
+
+        trajetorias = [Trajetoria(angulo, 150, 100, 550, g, k) for angulo in np.linspace(20, 70, quantidade)]
+        inicio = time.perf_counter()
+        for trajetoria in trajetorias:
+            x, y = trajetoria.posicao(1.0)
+            math.hypot(x - 2000, y - 2000) <= 1
+        por_objeto = time.perf_counter() - inicio
+        print(f"{quantidade:>6} cadeiras: {por_passo * 1000:.2f} ms por passo em lote, "
+              f"{por_objeto * 1000:.2f} ms com um laço por cadeira")
@@ -0,0 +1,509 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+# Orçamento padrão de memória para as imagens em cache (em bytes)
+ORCAMENTO_IMAGENS = 64 * 1024 * 1024
+
+#---------------------------------------------------------------------------
+"""
+    Cache central de imagens já convertidas para o formato da tela e já redimensionadas.
+
+    1. Cada imagem é identificada por (caminho, tamanho, alpha).
+    2. Na primeira vez, carrega o arquivo, converte para o formato da tela
+       (`convert_alpha` para imagens com transparência, `convert` para fundos opacos)
+       e redimensiona uma única vez.
+    3. Nas vezes seguintes, devolve a mesma superfície, sem acessar o disco.
+    4. Quando o total de memória passa do orçamento, remove as imagens usadas há mais
+       tempo (LRU).
+    5. Conta acertos, falhas e remoções para acompanhar a eficiência do cache.
+    6. `antecipar` carrega imagens em segundo plano, antes de serem pedidas (por exemplo,
+       as da fase selecionada enquanto o menu está parado):
+        - Uma única thread (daemon, criada no primeiro pedido) carrega, converte e
+          redimensiona cada imagem da mesma forma que `obter`; o pygame libera o GIL
+          durante a decodificação, de modo que o menu continua respondendo.
+        - Um novo pedido substitui a lista pendente: as imagens de uma seleção anterior
+          que ainda não começaram a ser carregadas são descartadas (canceladas). A imagem
+          em carregamento não é interrompida e vai para o cache normalmente.
+        - As imagens prontas só entram no cache (e no orçamento) pela thread principal,
+          em `obter` ou no pedido seguinte. Se `obter` pede uma imagem que está sendo
+          carregada, espera por ela em vez de carregá-la de novo.
+
+    A conversão exige que a janela já tenha sido criada com `pygame.display.set_mode`.
+
+    Parâmetros:
+        orcamento_bytes (int): Memória máxima ocupada pelas superfícies em cache.
+"""
+class CacheImagens:
+    def __init__(self, orcamento_bytes=ORCAMENTO_IMAGENS):
+        self.orcamento_bytes = orcamento_bytes
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self.antecipadas = 0
+        self.canceladas = 0
+        self._superficies = OrderedDict()
+
+        # Estado do carregamento em segundo plano, protegido por `_condicao`
+        self._condicao = threading.Condition()
+        self._pendentes = []
+        self._carregando = None
+        self._prontas = {}
+        self._thread = None
+
+    """
+        Retorna a imagem pronta para ser desenhada.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo de imagem.
+            tamanho (tuple): O tamanho (largura, altura) desejado, ou None para manter o original.
+            alpha (bool): Se a imagem tem transparência (`convert_alpha`) ou é opaca (`convert`).
+
+        Retorna:
+            pygame.Surface: A superfície convertida e redimensionada.
+    """
+    def obter(self, caminho, tamanho=None, alpha=True):
+        chave = (caminho, tamanho, alpha)
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self._superficies.move_to_end(chave)
+            self.acertos += 1
+            return superficie
+
+        if self._thread is not None:
+            superficie = self._retirar_antecipada(chave)
+            if superficie is not None:
+                self.acertos += 1
+                self._guardar(chave, superficie)
+                return superficie
+
+        self.falhas += 1
+        superficie = self._carregar(chave)
+        self._guardar(chave, superficie)
+        return superficie
+
+    """
+        Carrega, converte e redimensiona uma imagem (usado por `obter` e pela thread de
+        carregamento em segundo plano).
+    """
+    @staticmethod
+    def _carregar(chave):
+        caminho, tamanho, alpha = chave
+        superficie = pygame.image.load(caminho)
+        superficie = superficie.convert_alpha() if alpha else superficie.convert()
+        if tamanho is not None and superficie.get_size() != tuple(tamanho):
+            superficie = pygame.transform.scale(superficie, tamanho)
+        return superficie
+
+    """
+        Pede o carregamento em segundo plano das imagens que ainda não estão no cache,
+        cancelando as de pedidos anteriores que ainda não começaram.
+
+        Parâmetros:
+            pedidos (list): Tuplas (caminho, tamanho, alpha), na ordem de carregamento.
+    """
+    def antecipar(self, pedidos):
+        with self._condicao:
+            self._recolher_prontas()
+            self.canceladas += len(self._pendentes)
+            self._pendentes = []
+            for caminho, tamanho, alpha in pedidos:
+                chave = (caminho, tamanho, alpha)
+                if chave not in self._superficies and chave != self._carregando and chave not in self._pendentes:
+                    self._pendentes.append(chave)
+
+            if self._thread is None and self._pendentes:
+                self._thread = threading.Thread(target=self._trabalhar, name="CacheImagens", daemon=True)
+                self._thread.start()
+            self._condicao.notify_all()
+
+    """
+        Cancela os carregamentos pendentes e espera o que está em andamento terminar (por
+        exemplo, antes de `pygame.quit`).
+    """
+    def parar_antecipacao(self):
+        with self._condicao:
+            self.canceladas += len(self._pendentes)
+            self._pendentes = []
+            while self._carregando is not None:
+                self._condicao.wait()
+
+    """
+        Laço da thread de carregamento: retira o próximo pedido pendente, carrega a imagem
+        fora da trava e a entrega em `_prontas`.
+    """
+    def _trabalhar(self):
+        while True:
+            with self._condicao:
+                while not self._pendentes:
+                    self._condicao.wait()
+                chave = self._carregando = self._pendentes.pop(0)
+
+            try:
+                superficie = self._carregar(chave)
+            except (pygame.error, OSError):
+                # O erro aparece na thread principal, quando `obter` tentar carregar a imagem
+                superficie = None
+
+            with self._condicao:
+                if superficie is not None:
+                    self._prontas[chave] = superficie
+                self._carregando = None
+                self._condicao.notify_all()
+
+    """
+        Retira uma imagem carregada em segundo plano, esperando se ela estiver em
+        carregamento. Se ela ainda estiver pendente, deixa de ser pendente (a thread
+        principal vai carregá-la agora).
+    """
+    def _retirar_antecipada(self, chave):
+        with self._condicao:
+            while self._carregando == chave:
+                self._condicao.wait()
+            if chave in self._pendentes:
+                self._pendentes.remove(chave)
+            superficie = self._prontas.pop(chave, None)
+        if superficie is not None:
+            self.antecipadas += 1
+        return superficie
+
+    """
+        Passa para o cache as imagens já carregadas em segundo plano (chamado com
+        `_condicao` adquirida, na thread principal).
+    """
+    def _recolher_prontas(self):
+        for chave, superficie in self._prontas.items():
+            if chave not in self._superficies:
+                self._guardar(chave, superficie)
+                self.antecipadas += 1
+        self._prontas.clear()
+
+    """
+        Guarda a superfície no cache e remove as menos usadas até respeitar o orçamento.
+        Uma imagem maior que o orçamento inteiro ainda é guardada, sozinha.
+    """
+    def _guardar(self, chave, superficie):
+        tamanho_bytes = superficie.get_pitch() * superficie.get_height()
+        while self._superficies and self.bytes_usados + tamanho_bytes > self.orcamento_bytes:
+            _, removida = self._superficies.popitem(last=False)
+            self.bytes_usados -= removida.get_pitch() * removida.get_height()
+            self.remocoes += 1
+
+        self._superficies[chave] = superficie
+        self.bytes_usados += tamanho_bytes
+
+    """
+        Remove todas as imagens do cache (por exemplo, após recriar a janela).
+    """
+    def limpar(self):
+        with self._condicao:
+            self._prontas.clear()
+        self._superficies.clear()
+        self.bytes_usados = 0
+
+    """
+        Retorna um resumo do uso do cache.
+
+        Retorna:
+            dict: Acertos, falhas, remoções, imagens antecipadas e canceladas, taxa de acerto,
+            número de imagens e bytes usados.
+    """
+    def estatisticas(self):
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "remocoes": self.remocoes,
+            "antecipadas": self.antecipadas,
+            "canceladas": self.canceladas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "imagens": len(self._superficies),
+            "bytes_usados": self.bytes_usados,
+        }
+
+# Cache compartilhado pelas telas do jogo
+imagens = CacheImagens()
+
+# Intervalo (em graus) entre os ângulos dos sprites rotacionados
+PASSO_ROTACAO = 2
+
+"""
+    Cache de versões rotacionadas de um sprite em ângulos discretos.
+
+    1. O ângulo pedido é arredondado para o múltiplo de `passo` mais próximo.
+    2. Na primeira vez, rotaciona o sprite original com `pygame.transform.rotozoom` (suavizado)
+       e converte o resultado com `convert_alpha`. Cada versão é sempre gerada a partir do
+       original, sem acumular o borrão de rotações sucessivas.
+    3. Nas vezes seguintes, devolve a mesma superfície: o custo por quadro é uma consulta a
+       um dicionário e um blit.
+    4. `preencher` gera de uma vez as versões de um intervalo de ângulos (por exemplo, ao
+       carregar a partida), evitando o custo da primeira rotação durante o jogo.
+
+    Parâmetros:
+        superficie (pygame.Surface): O sprite original, sem rotação.
+        passo (int): O intervalo entre os ângulos, em graus (deve dividir 360).
+"""
+class SpritesRotacionados:
+    def __init__(self, superficie, passo=PASSO_ROTACAO):
+        self.original = superficie
+        self.passo = passo
+        self.acertos = 0
+        self.falhas = 0
+        self._versoes = {}
+
+    """
+        Retorna o sprite rotacionado e o deslocamento que mantém o centro no mesmo lugar.
+
+        Parâmetros:
+            angulo (float): O ângulo em graus, no sentido anti-horário.
+
+        Retorna:
+            tuple: (superfície, (dx, dy)), em que (dx, dy) é somado à posição do canto
+            superior esquerdo do sprite sem rotação.
+    """
+    def obter(self, angulo):
+        indice = round(angulo / self.passo) % (360 // self.passo)
+        versao = self._versoes.get(indice)
+        if versao is not None:
+            self.acertos += 1
+            return versao
+
+        self.falhas += 1
+        superficie = pygame.transform.rotozoom(self.original, indice * self.passo, 1).convert_alpha()
+        largura, altura = self.original.get_size()
+        versao = self._versoes[indice] = (
+            superficie,
+            ((largura - superficie.get_width()) // 2, (altura - superficie.get_height()) // 2),
+        )
+        return versao
+
+    """
+        Gera as versões de todos os ângulos em [inicio, fim].
+    """
+    def preencher(self, inicio=0, fim=360 - PASSO_ROTACAO):
+        for angulo in range(inicio, fim + 1, self.passo):
+            self.obter(angulo)
+
+    def __len__(self):
+        return len(self._versoes)
+
+# Quantidade máxima de textos renderizados mantidos em cache
+CAPACIDADE_TEXTOS = 256
+
+# Fontes já criadas, por (nome, tamanho)
+_fontes = {}
+
+"""
+    Retorna uma fonte do pygame, criando-a somente na primeira vez.
+
+    Parâmetros:
+        nome (str): O arquivo da fonte, ou None para a fonte padrão do pygame.
+        tamanho (int): O tamanho da fonte.
+
+    Retorna:
+        pygame.font.Font: A fonte compartilhada.
+"""
+def obter_fonte(nome, tamanho):
+    chave = (nome, tamanho)
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        fonte = _fontes[chave] = pygame.font.Font(nome, tamanho)
+    return fonte
+
+# Arquivo onde os caminhos das fontes do sistema já resolvidos são guardados entre execuções
+ARQUIVO_CACHE_FONTES = "cache_fontes.json"
+
+# Caminhos das fontes do sistema já resolvidos, por "nome|negrito" (carregados do disco na primeira consulta)
+_caminhos_fontes = None
+
+"""
+    Resolve o arquivo de uma fonte do sistema, com o resultado guardado em disco.
+
+    1. Procura o nome no cache (`ARQUIVO_CACHE_FONTES`), lido do disco na primeira consulta;
+       um caminho que não existe mais é resolvido de novo.
+    2. Se não encontrar, usa a mesma busca de `pygame.font.SysFont` (que, no Linux, consulta o
+       fontconfig e é a parte lenta da abertura do jogo) e grava o resultado no arquivo.
+    3. Fontes não encontradas também são guardadas, como a fonte padrão do pygame.
+
+    Parâmetros:
+        nome (str): O nome da fonte do sistema.
+        negrito (bool): Se a fonte deve ser em negrito.
+        arquivo (str): O arquivo do cache.
+
+    Retorna:
+        tuple: (caminho do arquivo, ou None para a fonte padrão; se o negrito deve ser simulado
+        com `Font.set_bold`, por não haver arquivo em negrito).
+"""
+def resolver_fonte_sistema(nome, negrito=False, arquivo=ARQUIVO_CACHE_FONTES):
+    global _caminhos_fontes
+    if _caminhos_fontes is None:
+        try:
+            with open(arquivo, encoding="utf-8") as entrada:
+                _caminhos_fontes = json.load(entrada)
+        except (OSError, ValueError):
+            _caminhos_fontes = {}
+
+    chave = f"{nome}|{negrito}"
+    resolvida = _caminhos_fontes.get(chave)
+    if resolvida is not None and (resolvida[0] is None or os.path.exists(resolvida[0])):
+        return tuple(resolvida)
+
+    # `SysFont` repassa ao construtor o arquivo escolhido e se o negrito é simulado
+    resolvida = pygame.font.SysFont(
+        nome, 1, negrito,
+        constructor=lambda caminho, tamanho, simular_negrito, simular_italico: (caminho, simular_negrito)
+    )
+    _caminhos_fontes[chave] = resolvida
+    try:
+        with open(arquivo, "w", encoding="utf-8") as saida:
+            json.dump(_caminhos_fontes, saida, indent=2, ensure_ascii=False)
+    except OSError:
+        # Sem permissão de escrita, a fonte é resolvida de novo na próxima execução
+        pass
+    return resolvida
+
+"""
+    Retorna uma fonte do sistema (como `pygame.font.SysFont`), criando-a somente na primeira
+    vez e resolvendo o arquivo pelo cache em disco (`resolver_fonte_sistema`).
+
+    Parâmetros:
+        nome (str): O nome da fonte do sistema, ou None para a fonte padrão do pygame.
+        tamanho (int): O tamanho da fonte.
+        negrito (bool): Se a fonte deve ser em negrito.
+
+    Retorna:
+        pygame.font.Font: A fonte compartilhada.
+"""
+def obter_fonte_sistema(nome, tamanho, negrito=False):
+    if nome is None:
+        return obter_fonte(None, tamanho)
+    chave = ("sistema", nome, tamanho, negrito)
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        caminho, simular_negrito = resolver_fonte_sistema(nome, negrito)
+        fonte = _fontes[chave] = pygame.font.Font(caminho, tamanho)
+        fonte.set_bold(simular_negrito)
+    return fonte
+
+"""
+    Cache de textos renderizados, identificados por (fonte, texto, cor, antialias).
+
+    1. Na primeira vez, renderiza o texto com `fonte.render`.
+    2. Nas vezes seguintes, devolve a mesma superfície.
+    3. Mantém no máximo `capacidade` textos, removendo os usados há mais tempo.
+
+    Parâmetros:
+        capacidade (int): Quantidade máxima de textos em cache.
+"""
+class CacheTextos:
+    def __init__(self, capacidade=CAPACIDADE_TEXTOS):
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._superficies = OrderedDict()
+
+    """
+        Retorna a superfície com o texto renderizado.
+
+        Parâmetros:
+            fonte (pygame.font.Font): A fonte usada.
+            texto (str): O texto.
+            cor (tuple): A cor do texto.
+            antialias (bool): Se o texto é suavizado.
+
+        Retorna:
+            pygame.Surface: O texto renderizado.
+    """
+    def renderizar(self, fonte, texto, cor, antialias=True):
+        chave = (fonte, texto, cor, antialias)
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self._superficies.move_to_end(chave)
+            self.acertos += 1
+            return superficie
+
+        self.falhas += 1
+        superficie = fonte.render(texto, antialias, cor)
+        self._superficies[chave] = superficie
+        if len(self._superficies) > self.capacidade:
+            self._superficies.popitem(last=False)
+        return superficie
+
+    """
+        Retorna um resumo do uso do cache (acertos, falhas e número de textos guardados).
+    """
+    def estatisticas(self):
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "textos": len(self._superficies),
+        }
+
+# Cache compartilhado pelas telas do jogo
+textos = CacheTextos()
+
+"""
+    Texto da interface (HUD) que só é renderizado novamente quando o seu valor muda.
+
+    1. Guarda a fonte, a cor, a posição e o último texto exibido.
+    2. Em `atualizar`, compara o novo texto com o anterior e, somente se mudou,
+       obtém a nova superfície do cache de textos.
+    3. Em `desenhar`, apenas copia a superfície pronta para a tela.
+    4. `definir_suavizado` liga ou desliga o antialiasing, renderizando o texto de novo.
+
+    Parâmetros:
+        fonte (pygame.font.Font): A fonte do texto.
+        cor (tuple): A cor do texto.
+        posicao (tuple): A posição (x, y) do canto superior esquerdo na tela.
+        texto (str): O texto inicial.
+        suavizado (bool): Se o texto é renderizado com antialiasing.
+"""
+class TextoHUD:
+    def __init__(self, fonte, cor, posicao, texto="", suavizado=True):
+        self.fonte = fonte
+        self.cor = cor
+        self.posicao = posicao
+        self.suavizado = suavizado
+        self.texto = None
+        self.superficie = None
+        self.retangulo_anterior = None
+        self.alterado = False
+        self.atualizar(texto)
+
+    """
+        Troca o texto exibido. Retorna `True` se o texto mudou.
+
+        Quando muda, marca o texto como `alterado` e guarda o retângulo ocupado pelo texto
+        anterior, para que o compositor possa apagá-lo.
+    """
+    def atualizar(self, texto):
+        if texto == self.texto:
+            return False
+        if self.superficie is not None and not self.alterado:
+            self.retangulo_anterior = self.retangulo()
+        self.texto = texto
+        self.superficie = textos.renderizar(self.fonte, texto, self.cor, self.suavizado)
+        self.alterado = True
+        return True
+
+    def definir_suavizado(self, suavizado):
+        if suavizado == self.suavizado:
+            return
+        self.suavizado = suavizado
+        texto, self.texto = self.texto, None
+        self.atualizar(texto)
+
+    """
+        Retorna o retângulo ocupado pelo texto na tela.
+    """
+    def retangulo(self):
+        return self.superficie.get_rect(topleft=self.posicao)
+
+    def desenhar(self, tela):
+        tela.blit(self.superficie, self.posicao)
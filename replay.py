@@ -0,0 +1,275 @@
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+
+from partida import DIFICULDADES, FASES, LARGURA_CAMPO, ALTURA_CAMPO, MODOS, PASSOS_POR_SEGUNDO, Entrada, criar_partida
+
+# Identificação e versão do formato das gravações
+ASSINATURA = b"CHRG"
+VERSAO = 2
+
+# Cabeçalho: assinatura, versão, dificuldade, fase, modo de jogo (índice em `MODOS`), passos
+# por segundo, largura e altura do campo e semente do Marçal. Resultado: pontuação, lançamentos e passos da partida.
+FORMATO_CABECALHO = struct.Struct("<4sBBBBHHHQ")
+FORMATO_RESULTADO = struct.Struct("<IIQ")
+
+# Pasta onde o jogo grava as partidas
+PASTA_GRAVACOES = "gravacoes"
+
+#---------------------------------------------------------------------------
+"""
+    Converte o estado das teclas em uma máscara de bits (um bit por campo de `Entrada`).
+"""
+def codificar_entrada(entrada):
+    mascara = 0
+    for i, tecla in enumerate(entrada):
+        if tecla:
+            mascara |= 1 << i
+    return mascara
+
+"""
+    Converte uma máscara de bits de volta no estado das teclas.
+"""
+def decodificar_entrada(mascara):
+    return Entrada(*(bool(mascara >> i & 1) for i in range(len(Entrada._fields))))
+
+"""
+    Escreve um inteiro não negativo com 7 bits por byte (o bit mais alto indica que há mais bytes).
+"""
+def _escrever_varint(saida, valor):
+    while valor >= 0x80:
+        saida.append(valor & 0x7F | 0x80)
+        valor >>= 7
+    saida.append(valor)
+
+"""
+    Lê um inteiro escrito por `_escrever_varint` a partir de `posicao`.
+
+    Retorna:
+        tuple: (valor, posição seguinte).
+"""
+def _ler_varint(dados, posicao):
+    valor = 0
+    deslocamento = 0
+    while True:
+        byte = dados[posicao]
+        posicao += 1
+        valor |= (byte & 0x7F) << deslocamento
+        if byte < 0x80:
+            return valor, posicao
+        deslocamento += 7
+
+"""
+    Sorteia a semente do gerador que reposiciona o Marçal em uma partida gravada.
+"""
+def nova_semente():
+    return random.getrandbits(63)
+
+"""
+    Gravação de uma partida: a entrada de cada passo, a semente do Marçal, a dificuldade, a fase
+    e o modo de jogo.
+
+    1. `registrar` recebe a entrada de cada chamada a `Partida.avancar`. As entradas são
+       guardadas como máscaras de bits em sequências (máscara, repetições), já que as teclas
+       costumam ficar no mesmo estado por muitos passos.
+    2. `finalizar` guarda o resultado da partida, que a reprodução usa para conferir se
+       chegou ao mesmo desfecho.
+    3. `salvar` e `carregar` usam um formato binário: cabeçalho e resultado de tamanho fixo
+       (`FORMATO_CABECALHO`, `FORMATO_RESULTADO`), seguidos das sequências, cada uma com a
+       máscara em um byte e as repetições em um inteiro de tamanho variável.
+    4. Como a partida só depende da entrada de cada passo e da semente, reproduzir a
+       gravação (`reproduzir`) dá a mesma partida, com ou sem janela e em qualquer velocidade.
+
+    Parâmetros:
+        dificuldade (int): A dificuldade da partida.
+        fases (int): A fase da partida.
+        semente (int): A semente do gerador usado em `reposicionar_marcal`.
+        passos_por_segundo (int): Quantos passos formam um segundo de jogo.
+        largura (int): A largura do campo de jogo.
+        altura (int): A altura do campo de jogo.
+        modo (str): O modo de jogo, um dos nomes em `partida.MODOS`.
+"""
+class Gravacao:
+    def __init__(self, dificuldade, fases, semente, passos_por_segundo=PASSOS_POR_SEGUNDO,
+                 largura=LARGURA_CAMPO, altura=ALTURA_CAMPO, modo="normal"):
+        self.dificuldade = dificuldade
+        self.fases = fases
+        self.modo = modo
+        self.semente = semente
+        self.passos_por_segundo = passos_por_segundo
+        self.largura = largura
+        self.altura = altura
+        self.sequencias = []
+        self.resultado = None
+
+    """
+        Cria a partida descrita pela gravação, com o gerador do Marçal já semeado.
+    """
+    def criar_partida(self):
+        return criar_partida(self.modo, self.dificuldade, self.fases, gerador=random.Random(self.semente),
+                             largura=self.largura, altura=self.altura, passos_por_segundo=self.passos_por_segundo)
+
+    def registrar(self, entrada):
+        mascara = codificar_entrada(entrada)
+        if self.sequencias and self.sequencias[-1][0] == mascara:
+            self.sequencias[-1][1] += 1
+        else:
+            self.sequencias.append([mascara, 1])
+
+    def finalizar(self, partida):
+        self.resultado = (partida.pontuacao, partida.lancamentos, partida.passo)
+
+    """
+        Percorre as entradas passo a passo.
+    """
+    def entradas(self):
+        for mascara, repeticoes in self.sequencias:
+            entrada = decodificar_entrada(mascara)
+            for _ in range(repeticoes):
+                yield entrada
+
+    def __len__(self):
+        return sum(repeticoes for _, repeticoes in self.sequencias)
+
+    """
+        Salva a gravação em `caminho`.
+
+        Parâmetros:
+            caminho (str): O arquivo de destino.
+            sobrescrever (bool): Se `False`, o arquivo é criado em modo exclusivo e
+                `FileExistsError` é levantado se ele já existir.
+    """
+    def salvar(self, caminho, sobrescrever=True):
+        dados = bytearray(FORMATO_CABECALHO.pack(
+            ASSINATURA, VERSAO, self.dificuldade, self.fases, MODOS.index(self.modo), self.passos_por_segundo,
+            self.largura, self.altura, self.semente
+        ))
+        dados += FORMATO_RESULTADO.pack(*(self.resultado or (0, 0, 0)))
+        for mascara, repeticoes in self.sequencias:
+            dados.append(mascara)
+            _escrever_varint(dados, repeticoes)
+        with open(caminho, "wb" if sobrescrever else "xb") as arquivo:
+            arquivo.write(dados)
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+
+        assinatura, versao, dificuldade, fases, modo, passos_por_segundo, largura, altura, semente = \
+            FORMATO_CABECALHO.unpack_from(dados)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            raise ValueError(f"{caminho} não é uma gravação de partida (versão {VERSAO})")
+
+        gravacao = cls(dificuldade, fases, semente, passos_por_segundo, largura, altura, MODOS[modo])
+        gravacao.resultado = FORMATO_RESULTADO.unpack_from(dados, FORMATO_CABECALHO.size)
+        posicao = FORMATO_CABECALHO.size + FORMATO_RESULTADO.size
+        while posicao < len(dados):
+            mascara = dados[posicao]
+            repeticoes, posicao = _ler_varint(dados, posicao + 1)
+            gravacao.sequencias.append([mascara, repeticoes])
+        return gravacao
+
+"""
+    Reproduz uma gravação sem janela e sem esperar pelo relógio.
+
+    Cada sequência é aplicada com `Partida.avancar_varios`, que equivale a avançar passo a
+    passo com a mesma entrada; quando ela para antes (fim de um voo), o restante da sequência
+    é aplicado em seguida.
+
+    Parâmetros:
+        gravacao (Gravacao): A partida gravada.
+
+    Retorna:
+        Partida: A partida ao final da reprodução.
+"""
+def reproduzir(gravacao):
+    partida = gravacao.criar_partida()
+    for mascara, repeticoes in gravacao.sequencias:
+        entrada = decodificar_entrada(mascara)
+        while repeticoes > 0 and partida.ativa:
+            avancados = partida.avancar_varios(entrada, repeticoes)
+            if avancados == 0:
+                # A partida acabou neste passo
+                break
+            repeticoes -= avancados
+    return partida
+
+"""
+    Salva uma nova gravação em `PASTA_GRAVACOES`, com a data e a hora no nome.
+
+    Partidas com as mesmas configurações encerradas no mesmo segundo recebem um contador
+    no nome; cada arquivo é criado em modo exclusivo, de modo que nenhuma gravação
+    sobrescreve outra.
+
+    Retorna:
+        str: O caminho do arquivo criado.
+"""
+def salvar_nova_gravacao(gravacao):
+    os.makedirs(PASTA_GRAVACOES, exist_ok=True)
+    base = f"{time.strftime('%Y%m%d-%H%M%S')}_d{gravacao.dificuldade}_f{gravacao.fases}_{gravacao.modo}"
+    contador = 0
+    while True:
+        nome = f"{base}_{contador}.chrg" if contador else f"{base}.chrg"
+        caminho = os.path.join(PASTA_GRAVACOES, nome)
+        try:
+            gravacao.salvar(caminho, sobrescrever=False)
+            return caminho
+        except FileExistsError:
+            contador += 1
+
+"""
+    Reproduz uma gravação na janela do jogo, em tempo real (escala de tempo 1x).
+"""
+def reproduzir_na_janela(gravacao):
+    import pygame
+
+    import chairs
+    from cenas import PilhaCenas
+
+    chairs.iniciar()
+    chairs.escala_tempo = 1.0
+    pilha = PilhaCenas(pygame.time.Clock())
+    pilha.empilhar(chairs.CenaJogo(reproducao=gravacao))
+    pilha.executar()
+    pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz partidas gravadas de Chairs! e confere o resultado.")
+    parser.add_argument("gravacoes", nargs="+", help="arquivos de gravação (.chrg)")
+    parser.add_argument("--janela", action="store_true", help="reproduz na janela do jogo, em tempo real")
+    args = parser.parse_args()
+
+    if args.janela:
+        for caminho in args.gravacoes:
+            reproduzir_na_janela(Gravacao.carregar(caminho))
+        return
+
+    divergencias = 0
+    for caminho in args.gravacoes:
+        gravacao = Gravacao.carregar(caminho)
+        inicio = time.perf_counter()
+        partida = reproduzir(gravacao)
+        duracao = time.perf_counter() - inicio
+
+        resultado = (partida.pontuacao, partida.lancamentos, partida.passo)
+        confere = resultado == tuple(gravacao.resultado)
+        divergencias += not confere
+        if confere:
+            situacao = "confere"
+        else:
+            gravado = tuple(gravacao.resultado)
+            situacao = (f"DIVERGE: gravado pontuação/lançamentos/passos {gravado[0]}/{gravado[1]}/{gravado[2]}, "
+                        f"reproduzido {resultado[0]}/{resultado[1]}/{resultado[2]}")
+        print(f"{caminho}: {DIFICULDADES[gravacao.dificuldade]['nome']}/{FASES[gravacao.fases]['nome']}/{gravacao.modo}, "
+              f"{len(gravacao)} passos em {duracao * 1000:.1f} ms, pontuação {partida.pontuacao} ({situacao})")
+
+    if divergencias:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import time
+
+from mira import deslocamento_alvo, solucoes
+from partida import DIFICULDADES, FASES, SEM_ENTRADA, Entrada, Partida
+
+# Quantas partidas cada tarefa do pool de processos executa
+PARTIDAS_POR_TAREFA = 50
+
+#---------------------------------------------------------------------------
+"""
+    Jogador automático que sorteia um ângulo e uma velocidade e segura as setas até alcançá-los.
+
+    1. Ao começar a mirar, sorteia um ângulo em [0, 90] e uma velocidade em [0, 600],
+       arredondados para múltiplos da sensibilidade do jogo (0.5).
+    2. Pressiona as setas na direção dos valores sorteados, informando por quantos passos
+       a mesma combinação de teclas fica pressionada.
+    3. Quando ângulo e velocidade coincidem com o sorteio, pressiona a tecla de lançar.
+
+    Um jogador é qualquer função que recebe a `Partida` e retorna a `Entrada` e o número
+    de passos durante os quais ela é mantida.
+
+    Parâmetros:
+        gerador (random.Random): O gerador usado nos sorteios.
+"""
+class JogadorAleatorio:
+    def __init__(self, gerador):
+        self.gerador = gerador
+        self.alvo = None
+
+    def escolher_alvo(self, partida):
+        angulo = self.gerador.randint(0, 180) / 2
+        velocidade = self.gerador.randint(0, 1200) / 2
+        return angulo, velocidade
+
+    def __call__(self, partida):
+        if self.alvo is None:
+            self.alvo = self.escolher_alvo(partida)
+        angulo, velocidade = self.alvo
+
+        # Passos até cada ajuste terminar
+        passos_angulo = abs(angulo - partida.angulo) / partida.sens_ang
+        passos_velocidade = abs(velocidade - partida.velocidade_inicial) / partida.sens_vel
+        if passos_angulo == 0 and passos_velocidade == 0:
+            self.alvo = None
+            return Entrada(False, False, False, False, True, False), 1
+
+        passos = min(p for p in (passos_angulo, passos_velocidade) if p > 0)
+        entrada = Entrada(
+            cima=partida.angulo < angulo,
+            baixo=partida.angulo > angulo,
+            direita=partida.velocidade_inicial < velocidade,
+            esquerda=partida.velocidade_inicial > velocidade,
+            lancar=False,
+            reiniciar=False,
+        )
+        return entrada, max(1, math.ceil(passos))
+
+"""
+    Jogador automático que só sorteia ângulos, mantendo a velocidade inicial.
+    Serve de referência para um jogador que não ajusta a força do lançamento.
+"""
+class JogadorSoAngulo(JogadorAleatorio):
+    def escolher_alvo(self, partida):
+        return self.gerador.randint(0, 180) / 2, partida.velocidade_inicial
+
+"""
+    Jogador automático que mira no Marçal usando o resolvedor de `mira.py`.
+
+    Entre os lançamentos que atingem o alvo (com ângulo e velocidade em múltiplos da
+    sensibilidade do jogo), escolhe o que exige segurar as setas por menos tempo a partir
+    da mira atual. Se o alvo não puder ser atingido (ou a fase não usa arrasto linear,
+    que é o caso resolvido por `mira.py`), sorteia como o `JogadorAleatorio`.
+"""
+class JogadorMira(JogadorAleatorio):
+    def escolher_alvo(self, partida):
+        if partida.arrasto != "linear":
+            return super().escolher_alvo(partida)
+        dx, dy = deslocamento_alvo(partida)
+        candidatos = solucoes(dx, dy, partida.g, partida.k, partida.sens_ang, partida.sens_vel)
+        if not candidatos:
+            return super().escolher_alvo(partida)
+        return min(candidatos, key=lambda c: max(abs(c[0] - partida.angulo) / partida.sens_ang,
+                                                 abs(c[1] - partida.velocidade_inicial) / partida.sens_vel))
+
+# Jogadores disponíveis pelo nome (usado na linha de comando e pelos processos do pool)
+JOGADORES = {
+    "aleatorio": JogadorAleatorio,
+    "so_angulo": JogadorSoAngulo,
+    "mira": JogadorMira,
+}
+
+"""
+    Simula uma partida completa sem janela, sem esperar pelo relógio real.
+
+    1. Cria a partida com um gerador próprio, para que a semente determine as posições do Marçal.
+    2. Enquanto o jogador mira, consulta a entrada e por quantos passos ela é mantida;
+       durante o voo a entrada é ignorada e o voo é avançado até terminar.
+    3. Usa `Partida.avancar_varios`, que equivale a avançar passo a passo; como a partida
+       conta o próprio tempo em passos, o resultado é o mesmo do jogo com janela.
+
+    Parâmetros:
+        dificuldade (int): A dificuldade (1, 2 ou 3).
+        fases (int): A fase (1, 2 ou 3).
+        jogador (callable): Função que recebe a `Partida` e retorna a `Entrada` e por quantos passos mantê-la.
+        semente (int): Semente usada para reposicionar o Marçal.
+
+    Retorna:
+        dict: Pontuação, meta, vitória, número de lançamentos e de passos simulados.
+"""
+def simular_partida(dificuldade, fases, jogador, semente=None):
+    partida = Partida(dificuldade, fases, gerador=random.Random(semente))
+
+    passos_da_partida = partida.tempo_total * partida.passos_por_segundo
+    while partida.ativa:
+        if partida.lancado:
+            entrada, passos = SEM_ENTRADA, passos_da_partida
+        else:
+            entrada, passos = jogador(partida)
+        partida.avancar_varios(entrada, passos)
+
+    return {
+        "pontuacao": partida.pontuacao,
+        "meta_pontuacao": partida.meta_pontuacao,
+        "venceu": partida.pontuacao >= partida.meta_pontuacao,
+        "lancamentos": partida.lancamentos,
+        "passos": partida.passo,
+    }
+
+"""
+    Tarefa executada por um processo do pool: simula um bloco de partidas de uma combinação.
+
+    Parâmetros:
+        tarefa (tuple): (dificuldade, fases, nome do jogador, semente inicial, quantidade).
+
+    Retorna:
+        tuple: ((dificuldade, fases), lista de resultados de `simular_partida`).
+"""
+def _executar_tarefa(tarefa):
+    dificuldade, fases, nome_jogador, semente_inicial, quantidade = tarefa
+    resultados = []
+    for semente in range(semente_inicial, semente_inicial + quantidade):
+        jogador = JOGADORES[nome_jogador](random.Random(-semente - 1))
+        resultados.append(simular_partida(dificuldade, fases, jogador, semente))
+    return (dificuldade, fases), resultados
+
+"""
+    Resume os resultados de várias partidas de uma mesma combinação de dificuldade e fase.
+
+    Parâmetros:
+        resultados (list): Resultados de `simular_partida`.
+
+    Retorna:
+        dict: Quantidade de partidas, média, desvio padrão, mínimo e máximo da pontuação,
+              taxa de vitória, lançamentos médios e acertos por lançamento.
+"""
+def resumir(resultados):
+    n = len(resultados)
+    pontuacoes = [r["pontuacao"] for r in resultados]
+    media = sum(pontuacoes) / n
+    variancia = sum((p - media) ** 2 for p in pontuacoes) / n
+    lancamentos = sum(r["lancamentos"] for r in resultados)
+    return {
+        "partidas": n,
+        "meta_pontuacao": resultados[0]["meta_pontuacao"],
+        "pontuacao_media": media,
+        "pontuacao_desvio": math.sqrt(variancia),
+        "pontuacao_minima": min(pontuacoes),
+        "pontuacao_maxima": max(pontuacoes),
+        "taxa_vitoria": sum(r["venceu"] for r in resultados) / n,
+        "lancamentos_medios": lancamentos / n,
+        "acertos_por_lancamento": sum(pontuacoes) / lancamentos if lancamentos else 0.0,
+    }
+
+"""
+    Simula muitas partidas em paralelo e agrega as estatísticas por dificuldade e fase.
+
+    1. Divide as partidas de cada combinação em tarefas de `PARTIDAS_POR_TAREFA` partidas.
+    2. Distribui as tarefas em um pool de processos.
+    3. Junta os resultados e resume cada combinação com `resumir`.
+
+    Parâmetros:
+        partidas (int): Partidas simuladas por combinação de dificuldade e fase.
+        jogador (str): Nome do jogador em `JOGADORES`.
+        processos (int): Número de processos do pool (None usa todos os núcleos).
+        semente (int): Semente base; cada partida usa uma semente derivada dela.
+        dificuldades (iterable): As dificuldades simuladas.
+        fases (iterable): As fases simuladas.
+
+    Retorna:
+        dict: Estatísticas por (dificuldade, fase).
+"""
+def simular_em_lote(partidas, jogador="aleatorio", processos=None, semente=0,
+                    dificuldades=tuple(DIFICULDADES), fases=tuple(FASES)):
+    tarefas = []
+    for dificuldade in dificuldades:
+        for fase in fases:
+            for inicio in range(0, partidas, PARTIDAS_POR_TAREFA):
+                quantidade = min(PARTIDAS_POR_TAREFA, partidas - inicio)
+                tarefas.append((dificuldade, fase, jogador, semente + inicio, quantidade))
+
+    resultados = {}
+    with multiprocessing.Pool(processos) as pool:
+        for combinacao, bloco in pool.imap_unordered(_executar_tarefa, tarefas):
+            resultados.setdefault(combinacao, []).extend(bloco)
+
+    return {combinacao: resumir(bloco) for combinacao, bloco in sorted(resultados.items())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simula partidas de Chairs! sem janela e resume os resultados.")
+    parser.add_argument("--partidas", type=int, default=1000, help="partidas por combinação de dificuldade e fase")
+    parser.add_argument("--jogador", choices=sorted(JOGADORES), default="aleatorio")
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: todos os núcleos)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--json", help="arquivo onde salvar as estatísticas em JSON")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    estatisticas = simular_em_lote(args.partidas, args.jogador, args.processos, args.semente)
+    duracao = time.perf_counter() - inicio
+
+    total = sum(e["partidas"] for e in estatisticas.values())
+    print(f"{total} partidas em {duracao:.2f} s ({total / duracao:.0f} partidas/s)")
+    print(f"{'dificuldade':<12}{'fase':<8}{'meta':>6}{'média':>9}{'desvio':>9}{'máx':>6}{'vitórias':>10}{'acerto/lanç':>13}")
+    for (dificuldade, fase), e in estatisticas.items():
+        print(f"{DIFICULDADES[dificuldade]['nome']:<12}{FASES[fase]['nome']:<8}{e['meta_pontuacao']:>6}"
+              f"{e['pontuacao_media']:>9.2f}{e['pontuacao_desvio']:>9.2f}{e['pontuacao_maxima']:>6}"
+              f"{e['taxa_vitoria']:>10.1%}{e['acertos_por_lancamento']:>13.3f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(
+                [{"dificuldade": d, "fase": f, **e} for (d, f), e in estatisticas.items()],
+                arquivo, indent=2, ensure_ascii=False,
+            )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from fisica import Trajetoria, atualizar_posicao_e_velocidade_com_resistencia
+from fisica_lote import atualizar_posicao_e_velocidade_em_lote, conferir_com_escalar
+
+# Tolerâncias relativas de `fisica_lote.py`: mesmas equações de `Trajetoria` (só arredondamento)
+# e a função escalar, sujeita a cancelamento quando k é pequeno
+TOLERANCIA_TRAJETORIA = 1e-12
+TOLERANCIA_ESCALAR = 1e-6
+
+AMBIENTES = [(9.81, 0.03), (1.62, 0.00001), (8.87, 0.3), (9.81, 0.0)]
+
+
+def erro_relativo(lote, referencia):
+    return max(abs(a - b) / max(1.0, abs(b)) for a, b in zip(lote, referencia))
+
+
+def test_conferir_com_escalar_dentro_das_tolerancias():
+    erro_trajetoria, erro_escalar = conferir_com_escalar(quantidade=2000, semente=0)
+    assert erro_trajetoria <= TOLERANCIA_TRAJETORIA
+    assert erro_escalar <= TOLERANCIA_ESCALAR
+
+
+@pytest.mark.parametrize("g, k", AMBIENTES)
+def test_lote_coincide_com_trajetoria_e_funcao_escalar(g, k):
+    gerador = np.random.default_rng(1)
+    t = gerador.uniform(0, 60, 200)
+    angulo = gerador.uniform(0, 90, 200)
+    velocidade_inicial = gerador.uniform(0, 600, 200)
+
+    (x, y), (vx, vy) = atualizar_posicao_e_velocidade_em_lote(t, angulo, velocidade_inicial, 100, 550, g, k)
+
+    for i in range(len(t)):
+        lote = (x[i], y[i], vx[i], vy[i])
+        (xt, yt), (vxt, vyt) = Trajetoria(angulo[i], velocidade_inicial[i], 100, 550, g, k).estado(t[i])
+        assert erro_relativo(lote, (xt, yt, vxt, vyt)) <= TOLERANCIA_TRAJETORIA
+        if k > 0:
+            (xe, ye), (vxe, vye) = atualizar_posicao_e_velocidade_com_resistencia(
+                t[i], angulo[i], velocidade_inicial[i], 100, 550, g, k
+            )
+            assert erro_relativo(lote, (xe, ye, vxe, vye)) <= TOLERANCIA_ESCALAR
+
+
+def test_broadcasting_com_escalares_e_arrays():
+    # Tempos em coluna (N, 1) e ângulos em linha (M,) geram saídas (N, M); os demais são escalares
+    t = np.linspace(0, 10, 5)[:, None]
+    angulos = np.array([15.0, 45.0, 75.0])
+    g, k = 9.81, 0.03
+
+    (x, y), (vx, vy) = atualizar_posicao_e_velocidade_em_lote(t, angulos, 200, 100, 550, g, k)
+
+    for saida in (x, y, vx, vy):
+        assert saida.shape == (5, 3)
+    for i in range(5):
+        for j in range(3):
+            (xt, yt), (vxt, vyt) = Trajetoria(angulos[j], 200, 100, 550, g, k).estado(t[i, 0])
+            assert erro_relativo((x[i, j], y[i, j], vx[i, j], vy[i, j]), (xt, yt, vxt, vyt)) <= TOLERANCIA_TRAJETORIA
+
+
+def test_escalares_retornam_arrays_sem_dimensao():
+    (x, y), (vx, vy) = atualizar_posicao_e_velocidade_em_lote(2.0, 30.0, 100.0, 100, 550, 9.81, 0.03)
+    assert np.shape(x) == ()
+    (xt, yt), (vxt, vyt) = Trajetoria(30.0, 100.0, 100, 550, 9.81, 0.03).estado(2.0)
+    assert erro_relativo((float(x), float(y), float(vx), float(vy)), (xt, yt, vxt, vyt)) <= TOLERANCIA_TRAJETORIA
+
+
+def test_ambientes_diferentes_por_elemento():
+    # g e k também podem variar elemento a elemento
+    g = np.array([ambiente[0] for ambiente in AMBIENTES])
+    k = np.array([ambiente[1] for ambiente in AMBIENTES])
+
+    (x, y), (vx, vy) = atualizar_posicao_e_velocidade_em_lote(3.0, 40.0, 250.0, 100, 550, g, k)
+
+    for i, (gi, ki) in enumerate(AMBIENTES):
+        (xt, yt), (vxt, vyt) = Trajetoria(40.0, 250.0, 100, 550, gi, ki).estado(3.0)
+        assert erro_relativo((x[i], y[i], vx[i], vy[i]), (xt, yt, vxt, vyt)) <= TOLERANCIA_TRAJETORIA
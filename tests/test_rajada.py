@@ -0,0 +1,40 @@
+import itertools
+import random
+
+import pytest
+
+from partida import DIFICULDADES, FASES, SEM_ENTRADA, Entrada
+from rajada import PartidaRajada
+
+LANCAR = Entrada(False, False, False, False, True, False)
+
+
+def jogar_um_disparo(dificuldade, fase, angulo, velocidade, semente):
+    partida = PartidaRajada(dificuldade, fase, gerador=random.Random(semente))
+    partida.angulo, partida.velocidade_inicial = angulo, velocidade
+    # Um único passo com a tecla de lançar dispara uma única rajada; depois, nenhuma entrada.
+    # Sem cadeiras no ar, a pontuação não muda mais
+    partida.avancar(LANCAR)
+    assert partida.lancamentos == 1
+    while partida.cadeiras and partida.avancar(SEM_ENTRADA):
+        pass
+    return partida
+
+
+@pytest.mark.parametrize("dificuldade, fase", list(itertools.product(DIFICULDADES, FASES)))
+def test_um_disparo_nao_alcanca_a_meta(dificuldade, fase):
+    meta = DIFICULDADES[dificuldade]["meta_pontuacao"]
+    for semente in range(3):
+        for angulo, velocidade in ((20, 150), (35, 120), (45, 100), (45, 200), (60, 250), (30, 400)):
+            partida = jogar_um_disparo(dificuldade, fase, angulo, velocidade, semente)
+            assert partida.pontuacao < meta
+
+
+def test_acertos_no_mesmo_passo_valem_um_ponto():
+    # Mira no Marçal pela posição inicial: várias cadeiras da rajada chegam juntas
+    maior = 0
+    for angulo, velocidade in itertools.product(range(10, 70, 2), range(60, 300, 10)):
+        partida = jogar_um_disparo(1, 1, angulo, velocidade, 0)
+        maior = max(maior, partida.pontuacao)
+        assert partida.pontuacao <= partida.passo
+    assert 0 < maior < DIFICULDADES[1]["meta_pontuacao"]
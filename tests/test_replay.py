@@ -0,0 +1,21 @@
+import os
+
+import replay
+from partida import SEM_ENTRADA
+from replay import Gravacao, salvar_nova_gravacao
+
+
+def test_gravacoes_no_mesmo_segundo_nao_se_sobrescrevem(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay, "PASTA_GRAVACOES", str(tmp_path))
+    # Mesmo segundo e mesmas configurações para todas as gravações
+    monkeypatch.setattr(replay.time, "strftime", lambda formato: "20240101-120000")
+
+    caminhos = []
+    for semente in range(3):
+        gravacao = Gravacao(1, 1, semente)
+        gravacao.registrar(SEM_ENTRADA)
+        caminhos.append(salvar_nova_gravacao(gravacao))
+
+    assert len(set(caminhos)) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(caminho) for caminho in caminhos)
+    assert [Gravacao.carregar(caminho).semente for caminho in caminhos] == [0, 1, 2]